@@ -2,6 +2,8 @@
 #include "i18n_api.h"
 #include "i18n_engine.h"
 
+#include <algorithm>
+#include <cctype>
 #include <cstring>
 #include <string>
 #include <vector>
@@ -10,7 +12,7 @@
 
 namespace {
 constexpr uint32_t ABI_VERSION = 1;
-constexpr uint32_t BINARY_VERSION_SUPPORTED_MAX = 2;
+constexpr uint32_t BINARY_VERSION_SUPPORTED_MAX = 3;
 constexpr size_t RESULT_TOO_LARGE_LIMIT = 16ull * 1024ull * 1024ull; // 16 MiB cap to keep RESULT_TOO_LARGE testable
 
 I18nEngine* as_engine(void* ptr) {
@@ -22,6 +24,11 @@ bool begin_engine_call(I18nEngine* eng) {
   clear_engine_error(eng);
   return true;
 }
+
+struct SnapshotPin {
+  I18nEngine* engine;
+  I18nEngine::PinnedScope scope;
+};
 }
 
 extern "C" {
@@ -30,6 +37,13 @@ I18N_API void* i18n_new() {
   return new I18nEngine();
 }
 
+I18N_API void* i18n_clone(void* ptr) {
+  if (!ptr) return nullptr;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return nullptr;
+  return e->clone().release();
+}
+
 I18N_API void i18n_free(void* ptr) {
   delete static_cast<I18nEngine*>(ptr);
 }
@@ -115,6 +129,13 @@ I18N_API int i18n_load_txt_file(void* ptr, const char* path, int strict) {
   return e->load_txt_file(path, strict != 0) ? 0 : -1;
 }
 
+I18N_API int i18n_load_txt_file_ex(void* ptr, const char* path, int flags) {
+  if (!ptr || !path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->load_txt_file(path, (flags & I18N_LOAD_STRICT) != 0, (flags & I18N_LOAD_TRUSTED) != 0) ? 0 : -1;
+}
+
 I18N_API int i18n_reload(void* ptr) {
   if (!ptr) return -1;
   auto* e = as_engine(ptr);
@@ -122,6 +143,72 @@ I18N_API int i18n_reload(void* ptr) {
   return e->reload() ? 0 : -1;
 }
 
+I18N_API int i18n_reload_async(void* ptr, i18n_reload_callback callback, void* user_data) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  const bool queued = e->reload_async([callback, user_data](bool ok, const std::string& err) {
+    if (callback) callback(user_data, ok ? 0 : -1, ok ? "" : err.c_str());
+  });
+  return queued ? 0 : -1;
+}
+
+I18N_API int i18n_reload_if_changed(void* ptr) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->reload_if_changed();
+}
+
+I18N_API uint64_t i18n_get_generation(void* ptr) {
+  if (!ptr) return 0;
+  return as_engine(ptr)->get_generation();
+}
+
+I18N_API int i18n_preload(void* ptr) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->preload() ? 0 : -1;
+}
+
+I18N_API int i18n_load_locale_file(void* ptr, const char* path, int strict) {
+  if (!ptr || !path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->load_locale_file(path, strict != 0) ? 0 : -1;
+}
+
+I18N_API int i18n_set_fallback_chain(void* ptr, const char* chain) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  e->set_fallback_chain(chain ? chain : "");
+  return 0;
+}
+
+I18N_API int i18n_get_fallback_chain_copy(void* ptr, char* out_buf, int buf_size) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return copy_to_buffer(e, e->get_fallback_chain(), out_buf, buf_size);
+}
+
+I18N_API int i18n_get_locale_stats(void* ptr, const char* locale, uint64_t* out_hits, uint64_t* out_misses) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  uint64_t hits = 0;
+  uint64_t misses = 0;
+  if (!e->get_locale_stats(locale ? locale : "", hits, misses)) {
+    set_engine_error(e, "Unbekannte Locale");
+    return -1;
+  }
+  if (out_hits) *out_hits = hits;
+  if (out_misses) *out_misses = misses;
+  return 0;
+}
+
 I18N_API uint32_t i18n_abi_version(void) {
   return ABI_VERSION;
 }
@@ -148,7 +235,8 @@ I18N_API int i18n_translate(void* ptr,
   auto vec_args = build_vec_args(args, args_len);
   auto* e = as_engine(ptr);
   if (!begin_engine_call(e)) return -1;
-  const std::string res = e->translate(token, vec_args);
+  // Reine Längenabfragen (out_buf == NULL) zählen nicht in die Locale-Statistik.
+  const std::string res = e->translate(token, vec_args, out_buf && buf_size > 0);
   return copy_to_buffer(e, res, out_buf, buf_size);
 }
 
@@ -163,10 +251,240 @@ I18N_API int i18n_translate_plural(void* ptr,
   auto vec_args = build_vec_args(args, args_len);
   auto* e = as_engine(ptr);
   if (!begin_engine_call(e)) return -1;
-  const std::string res = e->translate_plural(token, count, vec_args);
+  const std::string res = e->translate_plural(token, count, vec_args, out_buf && buf_size > 0);
+  return copy_to_buffer(e, res, out_buf, buf_size);
+}
+
+static bool build_typed_args(I18nEngine* engine, const i18n_arg* args, int args_len,
+                             std::vector<I18nEngine::TypedArg>& out) {
+  using Kind = I18nEngine::TypedArg::Kind;
+  out.clear();
+  if (!args || args_len <= 0) return true;
+  out.resize((size_t)args_len);
+  for (int i = 0; i < args_len; ++i) {
+    const i18n_arg& src = args[i];
+    auto& dst = out[(size_t)i];
+    dst.precision = src.precision;
+    switch (src.type) {
+      case I18N_ARG_STRING:
+        dst.kind = Kind::LITERAL;
+        if (src.value.str) dst.text = src.value.str;
+        break;
+      case I18N_ARG_INT:
+        dst.kind = Kind::INT;
+        dst.int_value = src.value.i;
+        break;
+      case I18N_ARG_DOUBLE:
+        dst.kind = Kind::DOUBLE;
+        dst.double_value = src.value.d;
+        break;
+      case I18N_ARG_TOKEN_ID:
+        dst.kind = Kind::TOKEN_ID;
+        dst.token_id = src.value.id;
+        break;
+      case I18N_ARG_TOKEN:
+        if (!src.value.str) {
+          set_engine_error(engine, "Token-Argument " + std::to_string(i) + " ist NULL");
+          return false;
+        }
+        dst.kind = Kind::TOKEN;
+        dst.text = src.value.str;
+        break;
+      default:
+        set_engine_error(engine, "Unbekannter Argumenttyp " + std::to_string(src.type) + " bei Argument " + std::to_string(i));
+        return false;
+    }
+  }
+  return true;
+}
+
+I18N_API int i18n_translate_ex(void* ptr,
+                               const char* token,
+                               const i18n_arg* args,
+                               int args_len,
+                               char* out_buf,
+                               int buf_size) {
+  if (!ptr || !token) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::vector<I18nEngine::TypedArg> typed;
+  if (!build_typed_args(e, args, args_len, typed)) return -1;
+  const std::string res = e->translate_ex(token, typed, out_buf && buf_size > 0);
   return copy_to_buffer(e, res, out_buf, buf_size);
 }
 
+I18N_API int i18n_translate_plural_ex(void* ptr,
+                                      const char* token,
+                                      int count,
+                                      const i18n_arg* args,
+                                      int args_len,
+                                      char* out_buf,
+                                      int buf_size) {
+  if (!ptr || !token) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::vector<I18nEngine::TypedArg> typed;
+  if (!build_typed_args(e, args, args_len, typed)) return -1;
+  const std::string res = e->translate_plural_ex(token, count, typed, out_buf && buf_size > 0);
+  return copy_to_buffer(e, res, out_buf, buf_size);
+}
+
+I18N_API int i18n_translate_batch(void* ptr,
+                                  int count,
+                                  const char** tokens,
+                                  const int* plural_counts,
+                                  const int* arg_counts,
+                                  const char** args,
+                                  char* out_buf,
+                                  int buf_size,
+                                  int* out_lengths) {
+  if (!ptr || count < 0 || (count > 0 && (!tokens || !out_lengths))) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+
+  // Kopiert wird erst, wenn alle Ergebnisse in den Puffer passen; sonst nur Längen + benötigte Größe.
+  const auto scope = e->pin_scope();
+  std::vector<std::string> results((size_t)count);
+  std::vector<std::string> vec_args;
+  size_t arg_pos = 0;
+  size_t total = 0;
+  for (int i = 0; i < count; ++i) {
+    const int n_args = arg_counts ? std::max(arg_counts[i], 0) : 0;
+    vec_args.clear();
+    for (int k = 0; k < n_args; ++k, ++arg_pos) {
+      const char* arg = args ? args[arg_pos] : nullptr;
+      vec_args.emplace_back(arg ? arg : "");
+    }
+    if (!tokens[i]) {
+      out_lengths[i] = -1;
+      total += 1;
+      continue;
+    }
+    const bool plural = plural_counts && plural_counts[i] != I18N_BATCH_NO_COUNT;
+    results[i] = plural ? e->translate_plural(scope, tokens[i], plural_counts[i], vec_args)
+                        : e->translate(scope, tokens[i], vec_args);
+    out_lengths[i] = (int)std::min(results[i].size(), (size_t)std::numeric_limits<int>::max());
+    total += results[i].size() + 1;
+    if (total >= RESULT_TOO_LARGE_LIMIT) {
+      set_engine_error(e, "RESULT_TOO_LARGE");
+      return -1;
+    }
+  }
+
+  if (out_buf && buf_size > 0 && total <= (size_t)buf_size) {
+    char* dst = out_buf;
+    for (int i = 0; i < count; ++i) {
+      if (!results[i].empty()) std::memcpy(dst, results[i].data(), results[i].size());
+      dst += results[i].size();
+      *dst++ = '\0';
+    }
+  }
+  return (int)total;
+}
+
+I18N_API int i18n_translate_plural_column(void* ptr,
+                                          const char* token,
+                                          const void* counts,
+                                          int count_bytes,
+                                          int rows,
+                                          const char** args,
+                                          int arg_columns,
+                                          char* out_buf,
+                                          int buf_size,
+                                          int* out_lengths) {
+  if (!ptr || !token || rows < 0 || arg_columns < 0 || (rows > 0 && (!counts || !out_lengths))) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+
+  std::string arena;
+  std::vector<size_t> lengths;
+  if (!e->translate_plural_column(token, counts, count_bytes, (size_t)rows, args, (size_t)arg_columns, arena,
+                                  lengths)) {
+    return -1;
+  }
+  if (arena.size() >= RESULT_TOO_LARGE_LIMIT) {
+    set_engine_error(e, "RESULT_TOO_LARGE");
+    return -1;
+  }
+  for (int i = 0; i < rows; ++i) out_lengths[i] = (int)lengths[(size_t)i];
+  if (out_buf && buf_size > 0 && arena.size() <= (size_t)buf_size) std::memcpy(out_buf, arena.data(), arena.size());
+  return (int)arena.size();
+}
+
+I18N_API int i18n_has_token(void* ptr, const char* token) {
+  if (!ptr || !token) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->has_token(token) ? 1 : 0;
+}
+
+I18N_API int i18n_set_result_cache(void* ptr, uint64_t max_bytes) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  e->set_result_cache(max_bytes);
+  return 0;
+}
+
+I18N_API int i18n_get_result_cache_stats(void* ptr, uint64_t* out_hits, uint64_t* out_misses, uint64_t* out_evictions,
+                                         uint64_t* out_bytes) {
+  if (!ptr || !out_hits || !out_misses || !out_evictions || !out_bytes) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  e->get_result_cache_stats(*out_hits, *out_misses, *out_evictions, *out_bytes);
+  return 0;
+}
+
+I18N_API void* i18n_pin_snapshot(void* ptr) {
+  if (!ptr) return nullptr;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return nullptr;
+  auto scope = e->pin_scope();
+  if (!scope) {
+    set_engine_error(e, "No catalog loaded");
+    return nullptr;
+  }
+  return new SnapshotPin{e, std::move(scope)};
+}
+
+I18N_API void i18n_unpin_snapshot(void* pin) {
+  delete static_cast<SnapshotPin*>(pin);
+}
+
+I18N_API uint64_t i18n_pinned_generation(void* pin) {
+  if (!pin) return 0;
+  return I18nEngine::pinned_generation(static_cast<SnapshotPin*>(pin)->scope);
+}
+
+I18N_API int i18n_translate_pinned(void* pin,
+                                   const char* token,
+                                   const char** args,
+                                   int args_len,
+                                   char* out_buf,
+                                   int buf_size) {
+  if (!pin || !token) return -1;
+  auto* p = static_cast<SnapshotPin*>(pin);
+  if (!begin_engine_call(p->engine)) return -1;
+  auto vec_args = build_vec_args(args, args_len);
+  const std::string res = p->engine->translate(p->scope, token, vec_args, out_buf && buf_size > 0);
+  return copy_to_buffer(p->engine, res, out_buf, buf_size);
+}
+
+I18N_API int i18n_translate_plural_pinned(void* pin,
+                                          const char* token,
+                                          int count,
+                                          const char** args,
+                                          int args_len,
+                                          char* out_buf,
+                                          int buf_size) {
+  if (!pin || !token) return -1;
+  auto* p = static_cast<SnapshotPin*>(pin);
+  if (!begin_engine_call(p->engine)) return -1;
+  auto vec_args = build_vec_args(args, args_len);
+  const std::string res = p->engine->translate_plural(p->scope, token, count, vec_args, out_buf && buf_size > 0);
+  return copy_to_buffer(p->engine, res, out_buf, buf_size);
+}
+
 I18N_API int i18n_print(void* ptr, char* out_buf, int buf_size) {
   if (!ptr) return -1;
   auto* e = as_engine(ptr);
@@ -197,7 +515,148 @@ I18N_API int i18n_export_binary(void* ptr, const char* path) {
   if (!ptr || !path) return -1;
   auto* e = as_engine(ptr);
   if (!begin_engine_call(e)) return -1;
-  return e->export_binary_catalog(path) ? 0 : -1;
+  std::string err;
+  if (!e->export_binary_catalog(path, 0, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return 0;
+}
+
+I18N_API int i18n_export_binary_ex(void* ptr, const char* path, int flags) {
+  if (!ptr || !path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::string err;
+  if (!e->export_binary_catalog(path, (uint32_t)flags, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return 0;
+}
+
+I18N_API int i18n_set_cache_dir(void* ptr, const char* dir) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  e->set_cache_dir(dir ? dir : "");
+  return 0;
+}
+
+I18N_API int i18n_export_sharded(void* ptr, const char* path, int prefix_len, int export_flags) {
+  if (!ptr || !path || prefix_len <= 0) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::string err;
+  if (!e->export_sharded(path, (uint32_t)prefix_len, (uint32_t)export_flags, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return 0;
+}
+
+I18N_API int i18n_get_shard_stats(void* ptr, uint32_t* out_loaded, uint32_t* out_total) {
+  if (!ptr || !out_loaded || !out_total) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  uint32_t loaded = 0;
+  uint32_t total = 0;
+  if (!e->get_shard_stats(loaded, total)) {
+    set_engine_error(e, "Kein Shard-Katalog geladen");
+    return -1;
+  }
+  *out_loaded = loaded;
+  *out_total = total;
+  return 0;
+}
+
+I18N_API int i18n_export_subset(void* ptr, const char* path, const char* roots, int export_flags) {
+  if (!ptr || !path || !roots) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::vector<std::string> tokens;
+  std::string current;
+  for (const char* p = roots;; ++p) {
+    const char c = *p;
+    if (c == '\0' || c == ',' || std::isspace((unsigned char)c)) {
+      if (!current.empty()) tokens.push_back(std::move(current));
+      current.clear();
+      if (c == '\0') break;
+      continue;
+    }
+    current += c;
+  }
+  size_t kept = 0;
+  std::string err;
+  if (!e->export_subset(path, tokens, (uint32_t)export_flags, kept, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return (int)std::min(kept, (size_t)std::numeric_limits<int>::max());
+}
+
+I18N_API int i18n_make_patch(void* ptr, const char* old_path, const char* new_path, const char* patch_path) {
+  if (!ptr || !old_path || !new_path || !patch_path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::string err;
+  if (!e->make_patch(old_path, new_path, patch_path, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return 0;
+}
+
+I18N_API int i18n_apply_patch_file(void* ptr, const char* base_path, const char* patch_path, const char* out_path, int export_flags) {
+  if (!ptr || !base_path || !patch_path || !out_path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::string err;
+  if (!e->apply_patch_file(base_path, patch_path, out_path, (uint32_t)export_flags, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return 0;
+}
+
+I18N_API int i18n_apply_patch(void* ptr, const char* patch_path) {
+  if (!ptr || !patch_path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->apply_patch(patch_path) ? 0 : -1;
+}
+
+I18N_API int i18n_export_bundle(void* ptr, const char* path) {
+  if (!ptr || !path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  std::string err;
+  if (!e->export_bundle(path, err)) {
+    set_engine_error(e, err);
+    return -1;
+  }
+  return 0;
+}
+
+I18N_API int i18n_load_bundle(void* ptr, const char* path, const char* locale, int strict) {
+  if (!ptr || !path) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->load_bundle_file(path, locale, strict != 0) ? 0 : -1;
+}
+
+I18N_API int i18n_select_locale(void* ptr, const char* locale) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return e->select_bundle_locale(locale) ? 0 : -1;
+}
+
+I18N_API int i18n_get_bundle_locales_copy(void* ptr, char* out_buf, int buf_size) {
+  if (!ptr) return -1;
+  auto* e = as_engine(ptr);
+  if (!begin_engine_call(e)) return -1;
+  return copy_to_buffer(e, e->get_bundle_locales(), out_buf, buf_size);
 }
 
 }
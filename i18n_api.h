@@ -18,6 +18,9 @@ extern "C" {
 
 I18N_API void* i18n_new(void);
 I18N_API void  i18n_free(void* ptr);
+// Neue Engine mit eigenem Fehlerzustand, die Katalog, Locales und Bundle der Quelle teilt (kein erneutes Laden).
+// Gedacht für eine Instanz pro Thread; spätere Reloads wirken nur auf die jeweilige Instanz. NULL = Fehler.
+I18N_API void* i18n_clone(void* ptr);
 
 // Pointer bleibt bis zum nächsten API-Aufruf auf derselben Engine-Instanz gültig (Engine ist nicht threadsafe). Nutzen Sie vorzugsweise die Copy-Variante.
 I18N_API const char* i18n_last_error(void* ptr);
@@ -27,6 +30,9 @@ I18N_API int i18n_last_error_copy(void* ptr, char* out_buf, int buf_size);
 
 I18N_API int i18n_load_txt(void* ptr, const char* txt_str, int strict);
 I18N_API int i18n_load_txt_file(void* ptr, const char* path, int strict);
+// I18N_LOAD_TRUSTED überspringt die Checksum-Prüfung binärer Kataloge (nur für Dateien aus der eigenen, signierten Pipeline).
+enum { I18N_LOAD_STRICT = 1, I18N_LOAD_TRUSTED = 2 };
+I18N_API int i18n_load_txt_file_ex(void* ptr, const char* path, int flags);
 I18N_API int i18n_reload(void* ptr);
 I18N_API uint32_t i18n_abi_version(void);
 I18N_API uint32_t i18n_binary_version_supported_max(void);
@@ -46,7 +52,140 @@ I18N_API int i18n_translate_plural(void* ptr,
                                    int args_len,
                                    char* out_buf,
                                    int buf_size);
+// Typisierte Argumente: keine Token-Heuristik (kein '='-Escape nötig), Zahlen werden nativ formatiert.
+enum {
+  I18N_ARG_STRING = 0,   // value.str wird unverändert eingesetzt (NULL = "")
+  I18N_ARG_INT = 1,      // value.i dezimal
+  I18N_ARG_DOUBLE = 2,   // value.d; precision >= 0 = feste Nachkommastellen, sonst kürzeste exakte Darstellung
+  I18N_ARG_TOKEN_ID = 3, // value.id als Token in Hex (precision = Stellenzahl, sonst mindestens 6), wird aufgelöst
+  I18N_ARG_TOKEN = 4     // value.str als Token (auch token{variant}), wird ohne Prüfung aufgelöst
+};
+typedef struct i18n_arg {
+  int32_t type;
+  int32_t precision;
+  union {
+    const char* str;
+    int64_t i;
+    double d;
+    uint64_t id;
+  } value;
+} i18n_arg;
+I18N_API int i18n_translate_ex(void* ptr,
+                               const char* token,
+                               const i18n_arg* args,
+                               int args_len,
+                               char* out_buf,
+                               int buf_size);
+I18N_API int i18n_translate_plural_ex(void* ptr,
+                                      const char* token,
+                                      int count,
+                                      const i18n_arg* args,
+                                      int args_len,
+                                      char* out_buf,
+                                      int buf_size);
+// Batch: count Übersetzungen in einem Aufruf. Eintrag i nimmt arg_counts[i] Argumente fortlaufend aus args
+// (arg_counts NULL = keine Argumente). plural_counts NULL oder I18N_BATCH_NO_COUNT = i18n_translate, sonst Pluralform.
+// Ergebnisse liegen NUL-getrennt hintereinander in out_buf, out_lengths[i] = Länge ohne NUL (-1 = Token fehlt im Aufruf).
+// Rückgabe: benötigte Bytes inkl. aller NULs oder -1. Ist buf_size kleiner, bleibt out_buf ungefüllt (Retry mit mehr Platz).
+// Alle Einträge eines Aufrufs werden gegen denselben Snapshot übersetzt.
+#define I18N_BATCH_NO_COUNT (-2147483647 - 1)
+I18N_API int i18n_translate_batch(void* ptr,
+                                  int count,
+                                  const char** tokens,
+                                  const int* plural_counts,
+                                  const int* arg_counts,
+                                  const char** args,
+                                  char* out_buf,
+                                  int buf_size,
+                                  int* out_lengths);
+// Spaltenweise Pluralübersetzung eines Tokens: counts zeigt auf rows zusammenhängende Ganzzahlen mit count_bytes
+// (4 = int32, 8 = int64), z. B. ein NumPy-Array. args ist spaltenweise: args[c * rows + i] = Argument c der Zeile i
+// (args NULL oder arg_columns 0 = keine Argumente). Die Pluralform wird einmal pro Kategorie aufgelöst, Formen ohne
+// %N werden nur einmal gerendert. Ausgabe und Rückgabe wie bei i18n_translate_batch. Keine Locale-Statistik.
+I18N_API int i18n_translate_plural_column(void* ptr,
+                                          const char* token,
+                                          const void* counts,
+                                          int count_bytes,
+                                          int rows,
+                                          const char** args,
+                                          int arg_columns,
+                                          char* out_buf,
+                                          int buf_size,
+                                          int* out_lengths);
+// 1 = Token (bzw. Basis mit Plural-Varianten) in aktiver Locale oder Fallback-Kette vorhanden, 0 = nein, -1 = Fehler.
+I18N_API int i18n_has_token(void* ptr, const char* token);
+
+// Optionaler Ergebnis-Cache für i18n_translate*/Batch/Pins: LRU über (Token, Count, Argumente), begrenzt auf
+// max_bytes (0 = aus, Standard). Jeder neu veröffentlichte Snapshot startet mit leerem Cache. Treffer zählen nicht in
+// die Locale-Statistik. Zähler sind kumulativ pro Engine, bytes = aktuelle Belegung.
+I18N_API int i18n_set_result_cache(void* ptr, uint64_t max_bytes);
+I18N_API int i18n_get_result_cache_stats(void* ptr, uint64_t* out_hits, uint64_t* out_misses, uint64_t* out_evictions,
+                                         uint64_t* out_bytes);
+
+// Snapshot-Pinning: hält den aktuellen Stand (Snapshot + Fallback-Kette) fest, bis i18n_unpin_snapshot ihn freigibt.
+// Übersetzungen über den Pin sehen keine zwischenzeitlichen Reloads und greifen nicht mehr pro Aufruf atomar zu.
+// Fehler landen in i18n_last_error der Engine; Pins vor i18n_free freigeben. NULL = kein Katalog geladen.
+I18N_API void* i18n_pin_snapshot(void* ptr);
+I18N_API void  i18n_unpin_snapshot(void* pin);
+// Generation des gepinnten Stands (vgl. i18n_get_generation), 0 bei pin == NULL.
+I18N_API uint64_t i18n_pinned_generation(void* pin);
+I18N_API int i18n_translate_pinned(void* pin,
+                                   const char* token,
+                                   const char** args,
+                                   int args_len,
+                                   char* out_buf,
+                                   int buf_size);
+I18N_API int i18n_translate_plural_pinned(void* pin,
+                                          const char* token,
+                                          int count,
+                                          const char** args,
+                                          int args_len,
+                                          char* out_buf,
+                                          int buf_size);
 I18N_API int i18n_export_binary(void* ptr, const char* path);
+// Identische Texte teilen sich immer einen Offset; I18N_EXPORT_SHARE_SUFFIXES lässt Endstücke in längere Texte zeigen.
+// I18N_EXPORT_COMPRESS schreibt Binary v3 mit blockweise komprimierter String-Table (Entpacken erst beim Zugriff).
+// I18N_EXPORT_SECTION_CHECKSUMS legt pro Sektion (komprimiert pro Block) einen 64-Bit-Hash ab; Texte werden beim ersten Zugriff geprüft.
+enum { I18N_EXPORT_SHARE_SUFFIXES = 1, I18N_EXPORT_COMPRESS = 2, I18N_EXPORT_SECTION_CHECKSUMS = 4 };
+I18N_API int i18n_export_binary_ex(void* ptr, const char* path, int flags);
+
+// Asynchroner Reload: Lesen/Parsen im engine-eigenen Worker-Thread, der alte Snapshot bleibt bis zum atomaren Tausch
+// aktiv. callback(user_data, status, error) läuft im Worker-Thread: status 0 = neuer Snapshot aktiv, -1 = Fehler
+// (error nur während des Callbacks gültig). Mehrere offene Anfragen teilen sich einen Lauf. Rückgabe: 0 = eingereiht.
+typedef void (*i18n_reload_callback)(void* user_data, int status, const char* error);
+I18N_API int i18n_reload_async(void* ptr, i18n_reload_callback callback, void* user_data);
+
+// Lädt current_path nur neu, wenn sich die Datei seit dem Laden geändert hat (stat; bei gleicher Größe und neuer
+// mtime entscheidet der Roh-Hash der Dateibytes, Shard-Manifeste und Bundles laden direkt neu).
+// Rückgabe: 1 = neuer Snapshot veröffentlicht, 0 = unverändert, -1 = Fehler (alter Snapshot bleibt aktiv).
+I18N_API int i18n_reload_if_changed(void* ptr);
+// Zähler, der bei jedem veröffentlichten Snapshot (Laden, Reload, Patch, Locale/Fallback-Änderung) steigt.
+I18N_API uint64_t i18n_get_generation(void* ptr);
+// Hält den vollständigen Katalog (alle Locales, komprimierte Blöcke, Shards) entpackt im Speicher. Gedacht vor fork():
+// Kind-Prozesse teilen die Seiten dann per Copy-on-Write und schreiben beim Übersetzen nichts nach. 0 = ok, -1 = Fehler.
+I18N_API int i18n_preload(void* ptr);
+
+// Snapshot-Cache (opt-in): .txt-Kataloge werden nach dem Parsen als Binary unter dir abgelegt und beim nächsten
+// i18n_load_txt_file/i18n_load_locale_file gemappt, solange Größe/mtime bzw. Inhalts-Hash passen. NULL oder "" = aus.
+I18N_API int i18n_set_cache_dir(void* ptr, const char* dir);
+
+// Sharding: schreibt Manifest (path, Endung .i18ns) plus ein Binary-Segment pro Token-Präfix (prefix_len 1..4 Hex-Zeichen).
+// i18n_load_txt_file auf das Manifest öffnet Segmente erst beim ersten Lookup in ihrem Präfix-Bereich.
+I18N_API int i18n_export_sharded(void* ptr, const char* path, int prefix_len, int export_flags);
+// Geladene vs. vorhandene Segmente. Rückgabe -1, wenn kein Shard-Katalog aktiv ist.
+I18N_API int i18n_get_shard_stats(void* ptr, uint32_t* out_loaded, uint32_t* out_total);
+
+// Tree-Shaking: exportiert nur die von `roots` (Tokens getrennt durch Komma/Whitespace) über @-Referenzen
+// erreichbaren Einträge als Binary. Rückgabe: Anzahl exportierter Einträge oder -1.
+I18N_API int i18n_export_subset(void* ptr, const char* path, const char* roots, int export_flags);
+
+// Delta-Patches (I18P) zwischen zwei Katalogen. Patches tragen einen inhaltlichen Hash von Basis und Ziel,
+// der vor und nach dem Anwenden geprüft wird. export_flags wie bei i18n_export_binary_ex.
+I18N_API int i18n_make_patch(void* ptr, const char* old_path, const char* new_path, const char* patch_path);
+I18N_API int i18n_apply_patch_file(void* ptr, const char* base_path, const char* patch_path, const char* out_path, int export_flags);
+// Wendet den Patch auf den aktiven Katalog an, ohne Datei neu zu parsen. Reloads wenden ihn erneut an,
+// ein neues Laden oder i18n_select_locale verwirft ihn.
+I18N_API int i18n_apply_patch(void* ptr, const char* patch_path);
 
 I18N_API int i18n_print(void* ptr, char* out_buf, int buf_size);
 I18N_API int i18n_find(void* ptr, const char* query, char* out_buf, int buf_size);
@@ -56,6 +195,25 @@ I18N_API int i18n_get_meta_fallback_copy(void* ptr, char* out_buf, int buf_size)
 I18N_API int i18n_get_meta_note_copy(void* ptr, char* out_buf, int buf_size);
 I18N_API int i18n_get_meta_plural_rule(void* ptr);
 
+// Fallback-Ketten: lädt einen weiteren Katalog als Locale (Name = @meta locale, sonst Dateiname), ohne den aktiven Katalog zu ersetzen.
+I18N_API int i18n_load_locale_file(void* ptr, const char* path, int strict);
+// Kette z. B. "de_DE,en_US" (Trenner ',', ';' oder '>'). NULL oder "" => die Kette folgt den @meta fallback=-Verweisen.
+I18N_API int i18n_set_fallback_chain(void* ptr, const char* chain);
+// Kopiert die aufgelöste Kette (aktive Locale zuerst, kommasepariert).
+I18N_API int i18n_get_fallback_chain_copy(void* ptr, char* out_buf, int buf_size);
+// Top-Level-Lookups pro Locale. locale NULL oder "" = aktive Locale. Rückgabe: 0 oder -1 bei unbekannter Locale.
+I18N_API int i18n_get_locale_stats(void* ptr, const char* locale, uint64_t* out_hits, uint64_t* out_misses);
+
+// Multi-Locale-Bundle (I18B): gemeinsamer Token-Index, deduplizierter String-Pool, eine Offset-Spalte pro Locale.
+// Exportiert den aktiven Katalog plus alle per i18n_load_locale_file geladenen Locales (jeweils mit @meta locale).
+I18N_API int i18n_export_bundle(void* ptr, const char* path);
+// Mappt das Bundle und aktiviert locale (NULL oder "" = erste Locale). Fallback-Ebenen kommen aus demselben Bundle.
+I18N_API int i18n_load_bundle(void* ptr, const char* path, const char* locale, int strict);
+// Wechselt die Locale innerhalb des geladenen Bundles ohne Datei-I/O.
+I18N_API int i18n_select_locale(void* ptr, const char* locale);
+// Kopiert die Locale-Namen des geladenen Bundles (kommasepariert).
+I18N_API int i18n_get_bundle_locales_copy(void* ptr, char* out_buf, int buf_size);
+
 #ifdef __cplusplus
 }
 #endif
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 import argparse
 import ctypes
+import hashlib
+import json
+import os
 import platform
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 DEFAULT_LIB_WINDOWS = "i18n_engine.dll"
 DEFAULT_LIB_UNIX = "libi18n_engine.so"
+EXPORT_SHARE_SUFFIXES = 1
+EXPORT_COMPRESS = 2
+EXPORT_SECTION_CHECKSUMS = 4
+BUILD_MANIFEST = ".i18n_build_manifest.json"
 
 
 def resolve_engine_path(custom: Optional[Path]) -> Path:
@@ -27,22 +36,7 @@ def last_error(engine, lib):
     return buf.value.decode("utf-8", errors="ignore")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Erstellt ein binäres Release-Katalog (Magic Header + Hash)."
-    )
-    parser.add_argument("input", type=Path, help="UTF-8 Katalogdatei (.txt)")
-    parser.add_argument("output", type=Path, help="Ausgabe-Binärdatei (.bin)")
-    parser.add_argument("--library", type=Path, help="Pfad zur i18n-Engine (.dll oder .so)")
-    parser.add_argument("--strict", action="store_true", help="strict=1 während des Ladens erzwingen")
-    args = parser.parse_args()
-
-    if not args.input.exists():
-        raise SystemExit(f"Input file {args.input} nicht gefunden.")
-
-    lib_path = resolve_engine_path(args.library)
-    lib = load_library(lib_path)
-
+def setup_library(lib):
     lib.i18n_new.restype = ctypes.c_void_p
     lib.i18n_free.argtypes = [ctypes.c_void_p]
     lib.i18n_last_error_copy.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
@@ -50,25 +44,244 @@ def main():
     lib.i18n_load_txt_file.restype = ctypes.c_int
     lib.i18n_export_binary.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
     lib.i18n_export_binary.restype = ctypes.c_int
+    lib.i18n_export_binary_ex.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    lib.i18n_export_binary_ex.restype = ctypes.c_int
+    lib.i18n_load_locale_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    lib.i18n_load_locale_file.restype = ctypes.c_int
+    lib.i18n_export_bundle.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.i18n_export_bundle.restype = ctypes.c_int
+    lib.i18n_export_sharded.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
+    lib.i18n_export_sharded.restype = ctypes.c_int
+
 
+def compile_catalog(lib, input_path, output_path, strict, flags, locales=(), shard_prefix=0):
+    """Kompiliert einen Katalog; Rückgabe ist die Art der Ausgabe, Fehler als RuntimeError."""
     engine = lib.i18n_new()
     if not engine:
-        raise SystemExit("Konnte Engine nicht initialisieren.")
+        raise RuntimeError("Konnte Engine nicht initialisieren.")
 
     try:
-        res = lib.i18n_load_txt_file(engine, str(args.input).encode("utf-8"), 1 if args.strict else 0)
+        res = lib.i18n_load_txt_file(engine, str(input_path).encode("utf-8"), 1 if strict else 0)
         if res < 0:
-            raise SystemExit(f"Fehler beim Laden: {last_error(engine, lib)}")
+            raise RuntimeError(f"Fehler beim Laden: {last_error(engine, lib)}")
 
-        args.output.parent.mkdir(parents=True, exist_ok=True)
-        res = lib.i18n_export_binary(engine, str(args.output).encode("utf-8"))
-        if res < 0:
-            raise SystemExit(f"Fehler beim Export: {last_error(engine, lib)}")
+        for locale_path in locales:
+            res = lib.i18n_load_locale_file(engine, str(locale_path).encode("utf-8"), 1 if strict else 0)
+            if res < 0:
+                raise RuntimeError(f"Fehler beim Laden von {locale_path}: {last_error(engine, lib)}")
 
-        print(f"Binärer Katalog erzeugt: {args.output}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_path.suffix.lower() == ".i18nb":
+            res = lib.i18n_export_bundle(engine, str(output_path).encode("utf-8"))
+            kind = "Multi-Locale-Bundle"
+        else:
+            if locales:
+                raise RuntimeError("--locale erfordert eine Ausgabe mit Endung .i18nb.")
+            if output_path.suffix.lower() == ".i18ns":
+                if shard_prefix <= 0:
+                    raise RuntimeError("Ausgabe .i18ns erfordert --shard-prefix N.")
+                res = lib.i18n_export_sharded(engine, str(output_path).encode("utf-8"), shard_prefix, flags)
+                kind = "Shard-Manifest"
+            else:
+                if shard_prefix:
+                    raise RuntimeError("--shard-prefix erfordert eine Ausgabe mit Endung .i18ns.")
+                res = lib.i18n_export_binary_ex(engine, str(output_path).encode("utf-8"), flags)
+                kind = "Binärer Katalog"
+        if res < 0:
+            raise RuntimeError(f"Fehler beim Export: {last_error(engine, lib)}")
+        return kind
     finally:
         lib.i18n_free(engine)
 
 
+_worker_lib = None
+
+
+def _init_worker(lib_path):
+    global _worker_lib
+    _worker_lib = load_library(Path(lib_path))
+    setup_library(_worker_lib)
+
+
+def _compile_job(input_path, output_path, strict, flags):
+    # Läuft im Worker-Prozess: Library wird pro Prozess einmal geladen, nicht pro Katalog.
+    start = time.perf_counter()
+    try:
+        compile_catalog(_worker_lib, Path(input_path), Path(output_path), strict, flags)
+        error = None
+    except Exception as exc:
+        # Jeder Fehler bleibt beim eigenen Katalog, damit Report und Manifest trotzdem geschrieben werden.
+        error = str(exc) or type(exc).__name__
+    return error, time.perf_counter() - start
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compile_directory(lib_path, input_dir, output_dir, strict, flags, jobs, report_path, force):
+    """Kompiliert alle *.txt unter input_dir parallel nach output_dir (gleiche Struktur, Endung .i18n)."""
+    manifest_path = output_dir / BUILD_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    previous = manifest.get("entries", {}) if manifest.get("version") == 1 else {}
+
+    started = time.perf_counter()
+    results = {}
+    pending = {}
+    entries = {}
+    for input_path in sorted(input_dir.rglob("*.txt")):
+        rel = input_path.relative_to(input_dir).as_posix()
+        output_path = output_dir / Path(rel).with_suffix(".i18n")
+        entry = {"sha256": file_digest(input_path), "strict": strict, "flags": flags}
+        old = previous.get(rel)
+        if not force and old == entry and output_path.exists():
+            results[rel] = {"input": str(input_path), "output": str(output_path), "status": "skipped", "seconds": 0.0}
+            entries[rel] = entry
+            continue
+        pending[rel] = (input_path, output_path, entry)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(str(lib_path),)) as pool:
+            futures = {
+                rel: pool.submit(_compile_job, str(input_path), str(output_path), strict, flags)
+                for rel, (input_path, output_path, _) in pending.items()
+            }
+            for rel, future in futures.items():
+                input_path, output_path, entry = pending[rel]
+                try:
+                    error, seconds = future.result()
+                except Exception as exc:
+                    error, seconds = f"Worker abgebrochen: {exc or type(exc).__name__}", 0.0
+                result = {"input": str(input_path), "output": str(output_path), "seconds": round(seconds, 4)}
+                if error:
+                    result.update(status="failed", error=error)
+                else:
+                    result["status"] = "compiled"
+                    entries[rel] = entry
+                results[rel] = result
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tmp_manifest = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_manifest.write_text(json.dumps({"version": 1, "entries": entries}, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_manifest, manifest_path)
+
+    files = [results[rel] for rel in sorted(results)]
+    counts = {status: sum(1 for r in files if r["status"] == status) for status in ("compiled", "skipped", "failed")}
+    report = {
+        "input_dir": str(input_dir),
+        "output_dir": str(output_dir),
+        "jobs": jobs,
+        "seconds": round(time.perf_counter() - started, 4),
+        **counts,
+        "files": files,
+    }
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Erstellt ein binäres Release-Katalog (Magic Header + Hash)."
+    )
+    parser.add_argument("input", type=Path, help="UTF-8 Katalogdatei (.txt) oder Verzeichnis mit Katalogen")
+    parser.add_argument("output", type=Path, help="Ausgabe-Binärdatei (.bin) bzw. Ausgabe-Verzeichnis")
+    parser.add_argument("--library", type=Path, help="Pfad zur i18n-Engine (.dll oder .so)")
+    parser.add_argument("--strict", action="store_true", help="strict=1 während des Ladens erzwingen")
+    parser.add_argument(
+        "--share-suffixes",
+        action="store_true",
+        help="Texte, die Endstück eines anderen Textes sind, in dessen Bytes ablegen (kleinere String-Table)",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="String-Table blockweise komprimieren (Binary v3, Entpacken erst beim Zugriff)",
+    )
+    parser.add_argument(
+        "--section-checksums",
+        action="store_true",
+        help="64-Bit-Checksumme pro Sektion statt einer FNV1a-Summe über die ganze Datei (Binary v3)",
+    )
+    parser.add_argument(
+        "--locale",
+        dest="locales",
+        type=Path,
+        action="append",
+        default=[],
+        help="Weitere Locale-Kataloge für ein Multi-Locale-Bundle (Ausgabe mit Endung .i18nb)",
+    )
+    parser.add_argument(
+        "--shard-prefix",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Katalog nach den ersten N Hex-Zeichen des Tokens in Segmente teilen (Ausgabe mit Endung .i18ns)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Verzeichnis-Modus: Anzahl paralleler Worker-Prozesse",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Verzeichnis-Modus: JSON-Build-Report (Standard: <output>/build_report.json)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Verzeichnis-Modus: auch unveränderte Kataloge neu kompilieren",
+    )
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        raise SystemExit(f"Input file {args.input} nicht gefunden.")
+
+    flags = EXPORT_SHARE_SUFFIXES if args.share_suffixes else 0
+    if args.compress:
+        flags |= EXPORT_COMPRESS
+    if args.section_checksums:
+        flags |= EXPORT_SECTION_CHECKSUMS
+
+    lib_path = resolve_engine_path(args.library)
+
+    if args.input.is_dir():
+        if args.locales or args.shard_prefix:
+            raise SystemExit("--locale und --shard-prefix sind im Verzeichnis-Modus nicht verfügbar.")
+        if not lib_path.exists():
+            raise SystemExit(f"Library {lib_path} not found.")
+        report_path = args.report or args.output / "build_report.json"
+        report = compile_directory(
+            lib_path.resolve(), args.input, args.output, args.strict, flags, max(1, args.jobs), report_path, args.force
+        )
+        print(
+            f"{report['compiled']} kompiliert, {report['skipped']} unverändert, {report['failed']} fehlgeschlagen "
+            f"in {report['seconds']:.2f}s (Report: {report_path})"
+        )
+        failures = [f for f in report["files"] if f["status"] == "failed"]
+        if failures:
+            for failure in failures:
+                print(f"FEHLER {failure['input']}: {failure['error']}")
+            raise SystemExit(1)
+        return
+
+    lib = load_library(lib_path)
+    setup_library(lib)
+    try:
+        kind = compile_catalog(lib, args.input, args.output, args.strict, flags, args.locales, args.shard_prefix)
+    except RuntimeError as exc:
+        raise SystemExit(str(exc))
+    print(f"{kind} erzeugt: {args.output}")
+
+
 if __name__ == "__main__":
     main()
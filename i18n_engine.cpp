@@ -9,8 +9,18 @@
 #include <filesystem>
 #include <limits>
 #include <cerrno>
+#include <list>
+#include <mutex>
+#include <condition_variable>
+#include <thread>
+#include <cstdio>
+#include <string_view>
+#include <iterator>
+#include <map>
+#include <charconv>
 #ifdef _WIN32
 #include <windows.h>
+#include <io.h>
 #else
 #include <fcntl.h>
 #include <sys/mman.h>
@@ -22,11 +32,43 @@ namespace {
 constexpr char BINARY_MAGIC[4] = { 'I', '1', '8', 'N' };
 constexpr uint8_t BINARY_VERSION_V1 = 1;
 constexpr uint8_t BINARY_VERSION_CURRENT = 2;
+constexpr uint8_t BINARY_VERSION_V3 = 3;
 constexpr uint8_t BINARY_VERSION = BINARY_VERSION_CURRENT;
+constexpr uint8_t BINARY_FLAG_COMPRESSED = 0x01;
+constexpr uint8_t BINARY_FLAG_SECTION_CHECKSUMS = 0x02;
+constexpr uint8_t BINARY_FLAG_BLOCK_CHECKSUMS = 0x04; // komprimierte Blöcke tragen eigene 64-Bit-Hashes
+constexpr uint8_t BINARY_FLAGS_KNOWN = BINARY_FLAG_COMPRESSED | BINARY_FLAG_SECTION_CHECKSUMS | BINARY_FLAG_BLOCK_CHECKSUMS;
+constexpr uint32_t SECTION_CHECKSUM_COUNT = 3; // metadata, entry table, string table
+constexpr size_t SECTION_CHECKSUM_RECORD_SIZE = 4 + SECTION_CHECKSUM_COUNT * 8;
+constexpr size_t COMPRESSED_SECTION_HEADER_SIZE = 12; // raw_size, block_size, block_count
+constexpr uint32_t COMPRESSED_BLOCK_SIZE = 16u * 1024u;
+constexpr uint32_t COMPRESSED_BLOCK_STORED = 0x80000000u; // Block liegt unkomprimiert vor
+constexpr size_t LAZY_BLOCK_CACHE_BLOCKS = 8;
+// Verwaltungsaufwand pro Eintrag im Ergebnis-Cache (Listenknoten, Hash-Bucket, String-Header), grob geschätzt.
+constexpr size_t RESULT_CACHE_ENTRY_OVERHEAD = 128;
 constexpr size_t BINARY_HEADER_SIZE_V1 = 20;
 constexpr size_t BINARY_HEADER_SIZE_V2 = 24;
 constexpr size_t BINARY_HEADER_SIZE = BINARY_HEADER_SIZE_V2;
 constexpr size_t METADATA_HEADER_SIZE = 6; // locale_len, fallback_len, note_len
+constexpr char BUNDLE_MAGIC[4] = { 'I', '1', '8', 'B' };
+constexpr uint8_t BUNDLE_VERSION = 1;
+constexpr size_t BUNDLE_HEADER_SIZE = 24;
+constexpr size_t BUNDLE_LOCALE_HEADER_SIZE = 8; // locale_len, fallback_len, note_len, plural, reserved
+constexpr size_t BUNDLE_SLOT_SIZE = 8;          // text_offset, text_length
+constexpr uint32_t BUNDLE_MISSING = 0xFFFFFFFFu;
+constexpr char SHARD_MAGIC[4] = { 'I', '1', '8', 'S' };
+constexpr uint8_t SHARD_VERSION = 2; // v2: Segmentnamen nach Inhalt, Roh-Hash pro Segment
+constexpr size_t SHARD_HEADER_SIZE = 16; // magic, version, prefix_len, plural, reserved, shard_count, checksum
+constexpr uint32_t SHARD_PREFIX_MAX = 4;
+constexpr char CACHE_MAGIC[4] = { 'I', '1', '8', 'C' };
+constexpr uint8_t CACHE_VERSION = 1;
+constexpr size_t CACHE_HEADER_SIZE = 48; // magic, version, strict, reserved, size, mtime, hash, binary size, checksum, labels
+constexpr char PATCH_MAGIC[4] = { 'I', '1', '8', 'P' };
+constexpr uint8_t PATCH_VERSION = 1;
+constexpr size_t PATCH_HEADER_SIZE = 36; // magic, version, op_count, ops_size, ops_checksum, base_hash, target_hash
+constexpr uint8_t PATCH_OP_UPSERT = 'U';
+constexpr uint8_t PATCH_OP_DELETE = 'D';
+constexpr uint8_t PATCH_OP_META = 'M';
 
 uint16_t read_le_u16(const uint8_t* data) {
   return (uint16_t)data[0] | ((uint16_t)data[1] << 8);
@@ -51,6 +93,72 @@ void append_le_u32(std::vector<uint8_t>& dst, uint32_t value) {
   dst.push_back((uint8_t)((value >> 24) & 0xFF));
 }
 
+uint64_t read_le_u64(const uint8_t* data) {
+  return (uint64_t)read_le_u32(data) | ((uint64_t)read_le_u32(data + 4) << 32);
+}
+
+void append_le_u64(std::vector<uint8_t>& dst, uint64_t value) {
+  append_le_u32(dst, (uint32_t)value);
+  append_le_u32(dst, (uint32_t)(value >> 32));
+}
+
+// Sektions-Checksumme: verarbeitet 8 Bytes pro Schritt statt byteweise wie FNV-1a.
+// Inkrementell nutzbar, die Gesamtlänge muss vorab bekannt sein (fließt in den Startwert ein).
+class SectionHasher {
+public:
+  explicit SectionHasher(uint64_t total_len) : h(0x9E3779B97F4A7C15ull ^ (total_len * k2)) {}
+
+  void update(const uint8_t* data, size_t len) {
+    while (len > 0) {
+      if (pending_len == 0 && len >= 8) {
+        mix(read_le_u64(data));
+        data += 8;
+        len -= 8;
+        continue;
+      }
+      pending[pending_len++] = *data++;
+      --len;
+      if (pending_len == 8) {
+        mix(read_le_u64(pending));
+        pending_len = 0;
+      }
+    }
+  }
+
+  uint64_t finish() const {
+    uint64_t tail = 0;
+    for (size_t k = 0; k < pending_len; ++k) tail |= (uint64_t)pending[k] << (8 * k);
+    uint64_t out = h;
+    out ^= ((tail * k1) << 31 | (tail * k1) >> 33) * k2;
+    out ^= out >> 33;
+    out *= 0xFF51AFD7ED558CCDull;
+    out ^= out >> 33;
+    out *= 0xC4CEB9FE1A85EC53ull;
+    out ^= out >> 33;
+    return out;
+  }
+
+private:
+  static constexpr uint64_t k1 = 0x87C37B91114253D5ull;
+  static constexpr uint64_t k2 = 0x4CF5AD432745937Full;
+  uint64_t h;
+  uint8_t pending[8] = {};
+  size_t pending_len = 0;
+
+  void mix(uint64_t word) {
+    uint64_t w = word * k1;
+    w = (w << 31) | (w >> 33);
+    h ^= w * k2;
+    h = ((h << 27) | (h >> 37)) * 5 + 0x52DCE729;
+  }
+};
+
+uint64_t section_hash64(const uint8_t* data, size_t len) {
+  SectionHasher hasher(len);
+  hasher.update(data, len);
+  return hasher.finish();
+}
+
 uint32_t fnv1a32_append(uint32_t hash, const uint8_t* data, size_t len) {
   uint32_t h = hash;
   for (size_t i = 0; i < len; ++i) {
@@ -60,6 +168,229 @@ uint32_t fnv1a32_append(uint32_t hash, const uint8_t* data, size_t len) {
   return h;
 }
 
+// Legt jeden Text genau einmal ab; mit share_suffixes zeigen Texte, die Endstück eines anderen sind, in dessen Bytes.
+// Das Ergebnis ist deterministisch, da nur Reihenfolge und Inhalt der Eingabe zählen. Die Texte werden nicht
+// kopiert: `emitted` verweist in der Schreibreihenfolge auf die Quell-Strings.
+struct StringTableLayout {
+  std::vector<const std::string*> emitted;
+  std::vector<uint32_t> offsets;
+  uint64_t size = 0;
+};
+
+void plan_string_table(const std::vector<const std::string*>& texts, bool share_suffixes, StringTableLayout& layout) {
+  layout.emitted.clear();
+  layout.offsets.assign(texts.size(), 0);
+  layout.size = 0;
+  std::unordered_map<std::string_view, uint32_t> interned;
+  std::vector<const std::string*> unique;
+  std::vector<uint32_t> slot(texts.size());
+  for (size_t i = 0; i < texts.size(); ++i) {
+    auto it = interned.emplace(std::string_view(*texts[i]), (uint32_t)unique.size());
+    if (it.second) unique.push_back(texts[i]);
+    slot[i] = it.first->second;
+  }
+
+  std::vector<uint32_t> unique_offsets(unique.size(), 0);
+  auto emit = [&](uint32_t u) {
+    unique_offsets[u] = (uint32_t)layout.size;
+    layout.emitted.push_back(unique[u]);
+    layout.size += unique[u]->size();
+  };
+  if (!share_suffixes) {
+    for (uint32_t u = 0; u < unique.size(); ++u) emit(u);
+  } else {
+    // Absteigend nach gespiegeltem Text sortiert folgt jedes Endstück direkt auf einen Text, der es enthält.
+    std::vector<uint32_t> order(unique.size());
+    for (uint32_t u = 0; u < order.size(); ++u) order[u] = u;
+    std::sort(order.begin(), order.end(), [&](uint32_t a, uint32_t b) {
+      return std::lexicographical_compare(unique[b]->rbegin(), unique[b]->rend(),
+                                          unique[a]->rbegin(), unique[a]->rend());
+    });
+    const std::string* prev = nullptr;
+    uint32_t prev_offset = 0;
+    for (uint32_t u : order) {
+      const std::string& text = *unique[u];
+      if (prev && text.size() <= prev->size() &&
+          std::equal(text.rbegin(), text.rend(), prev->rbegin())) {
+        unique_offsets[u] = prev_offset + (uint32_t)(prev->size() - text.size());
+      } else {
+        emit(u);
+      }
+      prev = unique[u];
+      prev_offset = unique_offsets[u];
+    }
+  }
+
+  for (size_t i = 0; i < texts.size(); ++i) layout.offsets[i] = unique_offsets[slot[i]];
+}
+
+// Schreibt in eine Temp-Datei neben dem Ziel und ersetzt das Ziel erst nach fsync per rename,
+// damit Leser nie eine halb geschriebene Datei sehen. Ohne commit() wird die Temp-Datei verworfen.
+class AtomicFileWriter {
+public:
+  ~AtomicFileWriter() {
+    if (file) {
+      std::fclose(file);
+      std::error_code ec;
+      std::filesystem::remove(temp_path, ec);
+    }
+  }
+
+  bool open(const std::filesystem::path& path, std::string& err) {
+    target_path = path;
+    if (target_path.has_parent_path()) {
+      std::error_code ec;
+      std::filesystem::create_directories(target_path.parent_path(), ec);
+    }
+#ifdef _WIN32
+    const unsigned long pid = (unsigned long)GetCurrentProcessId();
+#else
+    const unsigned long pid = (unsigned long)getpid();
+#endif
+    // pid + Zähler: auch zwei Threads desselben Prozesses (Cache, Reload-Worker) kollidieren nicht.
+    static std::atomic<uint64_t> temp_counter{0};
+    temp_path = target_path;
+    temp_path += ".tmp" + std::to_string(pid) + "." + std::to_string(temp_counter.fetch_add(1) + 1);
+#ifdef _WIN32
+    file = _wfopen(temp_path.wstring().c_str(), L"wb");
+#else
+    file = std::fopen(temp_path.string().c_str(), "wb");
+#endif
+    if (!file) {
+      err = "Temp-Datei konnte nicht angelegt werden.";
+      return false;
+    }
+    std::setvbuf(file, nullptr, _IOFBF, 1 << 16);
+    return true;
+  }
+
+  void write(const void* data, size_t len) {
+    if (ok && len > 0 && std::fwrite(data, 1, len, file) != len) ok = false;
+  }
+
+  void write_at(uint64_t pos, const void* data, size_t len) {
+    if (!ok) return;
+    if (seek((int64_t)pos, SEEK_SET) != 0) { ok = false; return; }
+    write(data, len);
+    if (seek(0, SEEK_END) != 0) ok = false;
+  }
+
+  bool commit(std::string& err) {
+    if (ok && std::fflush(file) != 0) ok = false;
+#ifdef _WIN32
+    if (ok && _commit(_fileno(file)) != 0) ok = false;
+#else
+    if (ok && fsync(fileno(file)) != 0) ok = false;
+#endif
+    if (std::fclose(file) != 0) ok = false;
+    file = nullptr;
+    std::error_code ec;
+    if (!ok) {
+      std::filesystem::remove(temp_path, ec);
+      err = "Datei konnte nicht geschrieben werden.";
+      return false;
+    }
+    std::filesystem::rename(temp_path, target_path, ec);
+    if (ec) {
+      std::filesystem::remove(temp_path, ec);
+      err = "Datei konnte nicht ersetzt werden.";
+      return false;
+    }
+#ifndef _WIN32
+    // Verzeichniseintrag ebenfalls persistieren, sonst kann der rename nach einem Crash fehlen.
+    const std::filesystem::path dir = target_path.has_parent_path() ? target_path.parent_path() : std::filesystem::path(".");
+    const int dir_fd = ::open(dir.string().c_str(), O_RDONLY);
+    if (dir_fd >= 0) {
+      fsync(dir_fd);
+      close(dir_fd);
+    }
+#endif
+    return true;
+  }
+
+private:
+  // 64-Bit-Offsets auch unter Windows (long ist dort 32 Bit).
+  int seek(int64_t pos, int whence) {
+#ifdef _WIN32
+    return _fseeki64(file, pos, whence);
+#else
+    return fseeko(file, (off_t)pos, whence);
+#endif
+  }
+
+  std::filesystem::path target_path;
+  std::filesystem::path temp_path;
+  std::FILE* file = nullptr;
+  bool ok = true;
+};
+
+// Kleiner LZ77-Codec ohne Abhängigkeiten. Steuerbyte < 0x80: (c + 1) Literale folgen,
+// sonst Match der Länge (c & 0x7F) + 4 mit 16-Bit-Distanz (LE).
+constexpr size_t LZ_MIN_MATCH = 4;
+constexpr size_t LZ_MAX_MATCH = 0x7F + LZ_MIN_MATCH;
+constexpr size_t LZ_MAX_LITERALS = 0x80;
+constexpr size_t LZ_HASH_BITS = 12;
+
+void lz_compress(const uint8_t* src, size_t len, std::vector<uint8_t>& out) {
+  out.clear();
+  std::vector<int32_t> table((size_t)1 << LZ_HASH_BITS, -1);
+  size_t literal_start = 0;
+  auto flush_literals = [&](size_t end) {
+    while (literal_start < end) {
+      const size_t n = std::min(end - literal_start, LZ_MAX_LITERALS);
+      out.push_back((uint8_t)(n - 1));
+      out.insert(out.end(), src + literal_start, src + literal_start + n);
+      literal_start += n;
+    }
+  };
+
+  size_t i = 0;
+  while (i + LZ_MIN_MATCH <= len) {
+    uint32_t word;
+    std::memcpy(&word, src + i, 4);
+    const size_t h = (word * 2654435761u) >> (32 - LZ_HASH_BITS);
+    const int32_t cand = table[h];
+    table[h] = (int32_t)i;
+    if (cand >= 0 && i - (size_t)cand <= 0xFFFF && std::memcmp(src + cand, src + i, LZ_MIN_MATCH) == 0) {
+      size_t match = LZ_MIN_MATCH;
+      while (match < LZ_MAX_MATCH && i + match < len && src[cand + match] == src[i + match]) ++match;
+      flush_literals(i);
+      const uint16_t dist = (uint16_t)(i - (size_t)cand);
+      out.push_back((uint8_t)(0x80 | (match - LZ_MIN_MATCH)));
+      out.push_back((uint8_t)(dist & 0xFF));
+      out.push_back((uint8_t)(dist >> 8));
+      i += match;
+      literal_start = i;
+    } else {
+      ++i;
+    }
+  }
+  flush_literals(len);
+}
+
+bool lz_decompress(const uint8_t* src, size_t len, uint8_t* dst, size_t dst_len) {
+  size_t in = 0;
+  size_t pos = 0;
+  while (in < len) {
+    const uint8_t c = src[in++];
+    if (c < 0x80) {
+      const size_t n = (size_t)c + 1;
+      if (in + n > len || pos + n > dst_len) return false;
+      std::memcpy(dst + pos, src + in, n);
+      in += n;
+      pos += n;
+    } else {
+      if (in + 2 > len) return false;
+      const size_t n = (size_t)(c & 0x7F) + LZ_MIN_MATCH;
+      const size_t dist = read_le_u16(src + in);
+      in += 2;
+      if (dist == 0 || dist > pos || pos + n > dst_len) return false;
+      for (size_t k = 0; k < n; ++k, ++pos) dst[pos] = dst[pos - dist];
+    }
+  }
+  return pos == dst_len;
+}
+
 struct FileMapping {
   void* data = nullptr;
   size_t size = 0;
@@ -166,6 +497,356 @@ struct FileMapping {
 };
 } // namespace
 
+struct I18nEngine::BundleView {
+  struct LocaleInfo {
+    std::string name;
+    std::string fallback;
+    std::string note;
+    uint8_t plural = 0;
+  };
+
+  FileMapping mapping;
+  std::string path;
+  std::vector<LocaleInfo> locales;
+  std::vector<std::string> tokens;
+  std::vector<std::string> variants;
+  size_t columns_offset = 0;
+  size_t pool_offset = 0;
+  uint32_t pool_size = 0;
+  // Einmal pro Bundle aufgebaut und von allen Locales geteilt: Schlüssel -> Zeile der Offset-Spalten.
+  std::unordered_map<std::string, uint32_t> index;
+  std::vector<std::unordered_map<std::string, std::set<std::string>>> locale_variants;
+  std::vector<uint32_t> entry_counts;
+
+  const uint8_t* data() const { return reinterpret_cast<const uint8_t*>(mapping.data); }
+  const uint8_t* column(size_t locale) const {
+    return data() + columns_offset + locale * tokens.size() * BUNDLE_SLOT_SIZE;
+  }
+  size_t find_locale(const std::string& name) const {
+    for (size_t i = 0; i < locales.size(); ++i) {
+      if (locales[i].name == name) return i;
+    }
+    return locales.size();
+  }
+};
+
+struct I18nEngine::BundleTexts {
+  // Ein Locale-Wechsel kopiert keine Texte: erst der erste Lookup legt den String aus dem Pool an.
+  std::shared_ptr<const BundleView> bundle;
+  size_t locale = 0;
+  std::unique_ptr<std::atomic<const std::string*>[]> texts;
+  std::mutex mutex;
+
+  BundleTexts(std::shared_ptr<const BundleView> view, size_t locale_index)
+      : bundle(std::move(view)), locale(locale_index), texts(new std::atomic<const std::string*>[bundle->tokens.size()]) {
+    for (size_t i = 0; i < bundle->tokens.size(); ++i) texts[i].store(nullptr, std::memory_order_relaxed);
+  }
+
+  ~BundleTexts() {
+    for (size_t i = 0; i < bundle->tokens.size(); ++i) delete texts[i].load(std::memory_order_relaxed);
+  }
+
+  const std::string* text(uint32_t row) {
+    const std::string* cached = texts[row].load(std::memory_order_acquire);
+    if (cached) return cached;
+    const uint8_t* slot = bundle->column(locale) + (size_t)row * BUNDLE_SLOT_SIZE;
+    const uint32_t text_offset = read_le_u32(slot);
+    if (text_offset == BUNDLE_MISSING) return nullptr;
+
+    std::lock_guard<std::mutex> lock(mutex);
+    cached = texts[row].load(std::memory_order_acquire);
+    if (cached) return cached;
+    const char* pool = reinterpret_cast<const char*>(bundle->data() + bundle->pool_offset);
+    const std::string* out = new std::string(pool + text_offset, read_le_u32(slot + 4));
+    texts[row].store(out, std::memory_order_release);
+    return out;
+  }
+
+  const std::string* find(const std::string& key) {
+    auto it = bundle->index.find(key);
+    return it == bundle->index.end() ? nullptr : text(it->second);
+  }
+
+  const std::set<std::string>* variants(const std::string& base) const {
+    const auto& by_base = bundle->locale_variants[locale];
+    auto it = by_base.find(base);
+    return it == by_base.end() ? nullptr : &it->second;
+  }
+};
+
+struct I18nEngine::LazyTexts {
+  struct Block {
+    uint32_t offset;
+    uint32_t length;
+    bool stored;
+  };
+
+  std::vector<uint8_t> section;
+  uint32_t raw_size = 0;
+  uint32_t block_size = 0;
+  std::vector<Block> blocks;
+  std::vector<std::pair<uint32_t, uint32_t>> entries; // unkomprimierter Offset, Länge
+  std::unique_ptr<std::atomic<const std::string*>[]> texts;
+
+  std::mutex cache_mutex;
+  std::list<std::pair<uint32_t, std::vector<uint8_t>>> block_cache; // vorne = zuletzt benutzt
+  // Geprüft wird erst beim ersten Zugriff: mit Block-Checksummen jeder Block für sich, sonst die ganze Sektion.
+  // plain = unkomprimierte Sektion, Texte liegen direkt in `section`.
+  bool plain = false;
+  bool verify_pending = false;
+  bool corrupt = false;
+  uint64_t expected_hash = 0;
+  std::vector<uint64_t> block_hashes;
+  std::vector<uint8_t> block_state; // 0 = ungeprüft, 1 = ok, 2 = defekt
+  std::string error;
+
+  ~LazyTexts() {
+    for (size_t i = 0; i < entries.size(); ++i) delete texts[i].load(std::memory_order_relaxed);
+  }
+
+  const std::vector<uint8_t>* block_locked(uint32_t index) {
+    for (auto it = block_cache.begin(); it != block_cache.end(); ++it) {
+      if (it->first == index) {
+        block_cache.splice(block_cache.begin(), block_cache, it);
+        return &block_cache.front().second;
+      }
+    }
+    if (!block_state.empty() && block_state[index] == 2) return nullptr;
+    const Block& block = blocks[index];
+    const size_t raw_len = std::min<size_t>(block_size, raw_size - (size_t)index * block_size);
+    std::vector<uint8_t> raw(raw_len);
+    const uint8_t* src = section.data() + block.offset;
+    if (!block_hashes.empty() && block_state[index] == 0) {
+      if (section_hash64(src, block.length) != block_hashes[index]) {
+        block_state[index] = 2;
+        error = "Binär-Format: Checksum von String-Block " + std::to_string(index) + " stimmt nicht.";
+        return nullptr;
+      }
+      block_state[index] = 1;
+    }
+    if (block.stored ? block.length != raw_len : !lz_decompress(src, block.length, raw.data(), raw_len)) {
+      if (!block_state.empty()) block_state[index] = 2;
+      error = "Binär-Format: String-Block " + std::to_string(index) + " nicht entpackbar.";
+      return nullptr;
+    }
+    if (block.stored) std::memcpy(raw.data(), src, raw_len);
+    block_cache.emplace_front(index, std::move(raw));
+    if (block_cache.size() > LAZY_BLOCK_CACHE_BLOCKS) block_cache.pop_back();
+    return &block_cache.front().second;
+  }
+
+  const std::string* text(uint32_t entry) {
+    const std::string* cached = texts[entry].load(std::memory_order_acquire);
+    if (cached) return cached;
+
+    std::lock_guard<std::mutex> lock(cache_mutex);
+    cached = texts[entry].load(std::memory_order_acquire);
+    if (cached) return cached;
+    if (verify_pending) {
+      corrupt = section_hash64(section.data(), section.size()) != expected_hash;
+      if (corrupt) error = "Binär-Format: Checksum der String-Table stimmt nicht.";
+      verify_pending = false;
+    }
+    if (corrupt) return nullptr;
+
+    const uint32_t offset = entries[entry].first;
+    const uint32_t length = entries[entry].second;
+    auto value = std::make_unique<std::string>();
+    if (plain) {
+      value->assign(reinterpret_cast<const char*>(section.data() + offset), length);
+    } else {
+      value->reserve(length);
+      uint32_t pos = offset;
+      while (pos < offset + length) {
+        const uint32_t index = pos / block_size;
+        const std::vector<uint8_t>* raw = block_locked(index);
+        if (!raw) return nullptr;
+        const uint32_t in_block = pos - index * block_size;
+        const uint32_t take = std::min<uint32_t>((uint32_t)raw->size() - in_block, offset + length - pos);
+        value->append(reinterpret_cast<const char*>(raw->data() + in_block), take);
+        pos += take;
+      }
+    }
+    const std::string* out = value.release();
+    texts[entry].store(out, std::memory_order_release);
+    return out;
+  }
+
+  std::string failure() {
+    std::lock_guard<std::mutex> lock(cache_mutex);
+    return error;
+  }
+};
+
+struct I18nEngine::ShardSet {
+  struct Shard {
+    std::string prefix;
+    std::string path;
+    uint32_t entry_count = 0;
+    uint64_t hash = 0; // Roh-Hash der Segmentdatei laut Manifest
+  };
+
+  std::vector<Shard> shards;
+  std::vector<int32_t> by_prefix; // Präfix als Hex-Zahl -> Shard-Index, -1 = kein Segment
+  uint32_t prefix_len = 0;
+  bool strict = false;
+  bool trusted = false;
+
+  std::unique_ptr<std::atomic<const CatalogSnapshot*>[]> loaded;
+  std::vector<std::shared_ptr<CatalogSnapshot>> owned;
+  std::vector<bool> failed;
+  std::vector<std::string> errors;
+  std::mutex load_mutex;
+
+  // Tokens sind bereits kleingeschrieben normalisiert.
+  static bool prefix_slot(const std::string& key, uint32_t len, size_t& out) {
+    if (key.size() < len) return false;
+    out = 0;
+    for (uint32_t i = 0; i < len; ++i) {
+      const char c = key[i];
+      int digit;
+      if (c >= '0' && c <= '9') digit = c - '0';
+      else if (c >= 'a' && c <= 'f') digit = c - 'a' + 10;
+      else return false;
+      out = out * 16 + (size_t)digit;
+    }
+    return true;
+  }
+
+  int32_t index_for(const std::string& key) const {
+    size_t slot = 0;
+    return prefix_slot(key, prefix_len, slot) ? by_prefix[slot] : -1;
+  }
+
+  std::shared_ptr<const CatalogSnapshot> load(size_t index) {
+    std::lock_guard<std::mutex> lock(load_mutex);
+    if (!owned[index] && !failed[index]) {
+      std::string err;
+      if (!trusted) {
+        // Ersetzte oder beschädigte Segmente erkennen, statt Stände verschiedener Exporte zu mischen.
+        FileMapping mapping;
+        if (mapping.map(std::filesystem::path(shards[index].path), err) &&
+            section_hash64(reinterpret_cast<const uint8_t*>(mapping.data), mapping.size) != shards[index].hash) {
+          err = "Hash passt nicht zum Manifest.";
+        }
+      }
+      if (err.empty()) owned[index] = load_snapshot_from_file(shards[index].path, strict, trusted, err);
+      // Ein defektes oder fehlendes Segment liefert keine Texte, statt bei jedem Lookup neu zu öffnen.
+      failed[index] = !owned[index];
+      if (failed[index]) errors[index] = err;
+      loaded[index].store(owned[index].get(), std::memory_order_release);
+    }
+    return owned[index];
+  }
+
+  // Fehlertext für ein nicht ladbares Segment (nach load()).
+  std::string error_for(size_t index) {
+    std::lock_guard<std::mutex> lock(load_mutex);
+    return "Shard-Segment " + std::filesystem::path(shards[index].path).filename().string() +
+           " nicht ladbar: " + errors[index];
+  }
+
+  const CatalogSnapshot* shard_for(const std::string& key) {
+    const int32_t index = index_for(key);
+    if (index < 0) return nullptr;
+    const CatalogSnapshot* shard = loaded[index].load(std::memory_order_acquire);
+    if (shard) return shard;
+    return load((size_t)index).get();
+  }
+
+  uint32_t loaded_count() const {
+    uint32_t n = 0;
+    for (size_t i = 0; i < shards.size(); ++i) {
+      if (loaded[i].load(std::memory_order_acquire)) ++n;
+    }
+    return n;
+  }
+};
+
+const std::string* I18nEngine::CatalogSnapshot::find_text(const std::string& key) const {
+  auto it = catalog.find(key);
+  if (it != catalog.end()) return &it->second;
+  if (shards) {
+    const CatalogSnapshot* shard = shards->shard_for(key);
+    return shard ? shard->find_text(key) : nullptr;
+  }
+  if (bundle_texts) return bundle_texts->find(key);
+  if (!lazy) return nullptr;
+  auto lit = lazy_index.find(key);
+  if (lit == lazy_index.end()) return nullptr;
+  return lazy->text(lit->second);
+}
+
+std::string I18nEngine::CatalogSnapshot::damage_for(const std::string& key) const {
+  if (catalog.count(key)) return {};
+  if (shards) {
+    const int32_t index = shards->index_for(key);
+    if (index < 0) return {};
+    const CatalogSnapshot* shard = shards->shard_for(key);
+    return shard ? shard->damage_for(key) : shards->error_for((size_t)index);
+  }
+  if (!lazy) return {};
+  auto lit = lazy_index.find(key);
+  if (lit == lazy_index.end() || lazy->text(lit->second)) return {};
+  return lazy->failure();
+}
+
+const std::set<std::string>* I18nEngine::CatalogSnapshot::find_variants(const std::string& base) const {
+  auto it = plural_variants.find(base);
+  if (it != plural_variants.end()) return &it->second;
+  if (bundle_texts) return bundle_texts->variants(base);
+  if (!shards) return nullptr;
+  const CatalogSnapshot* shard = shards->shard_for(base);
+  return shard ? shard->find_variants(base) : nullptr;
+}
+
+std::shared_ptr<const I18nEngine::CatalogSnapshot> I18nEngine::materialize(std::shared_ptr<const CatalogSnapshot> snapshot,
+                                                                             std::string& err) {
+  // Diagnose und Export arbeiten auf einer vollständig entpackten Kopie, Übersetzungen bleiben lazy.
+  // Fehlt ein Teil, gibt es keine Kopie: check und Export dürfen keinen unvollständigen Katalog sehen.
+  err.clear();
+  if (!snapshot || (!snapshot->lazy && !snapshot->shards && !snapshot->bundle_texts)) return snapshot;
+  auto full = std::make_shared<CatalogSnapshot>();
+  full->catalog = snapshot->catalog;
+  full->labels = snapshot->labels;
+  full->plural_variants = snapshot->plural_variants;
+  full->meta_locale = snapshot->meta_locale;
+  full->meta_fallback = snapshot->meta_fallback;
+  full->meta_note = snapshot->meta_note;
+  full->meta_plural = snapshot->meta_plural;
+  for (const auto& kv : snapshot->lazy_index) {
+    const std::string* text = snapshot->lazy->text(kv.second);
+    if (!text) {
+      err = snapshot->lazy->failure();
+      return {};
+    }
+    full->catalog.emplace(kv.first, *text);
+  }
+  if (snapshot->bundle_texts) {
+    BundleTexts& texts = *snapshot->bundle_texts;
+    full->catalog.reserve(texts.bundle->index.size());
+    for (const auto& kv : texts.bundle->index) {
+      const std::string* text = texts.text(kv.second);
+      if (text) full->catalog.emplace(kv.first, *text);
+    }
+    full->plural_variants = texts.bundle->locale_variants[texts.locale];
+  }
+  if (snapshot->shards) {
+    for (size_t i = 0; i < snapshot->shards->shards.size(); ++i) {
+      auto segment = snapshot->shards->load(i);
+      if (!segment) {
+        err = snapshot->shards->error_for(i);
+        return {};
+      }
+      auto part = materialize(segment, err);
+      if (!part) return {};
+      full->catalog.insert(part->catalog.begin(), part->catalog.end());
+      full->plural_variants.insert(part->plural_variants.begin(), part->plural_variants.end());
+    }
+  }
+  return full;
+}
+
 void set_engine_error(I18nEngine* eng, const std::string& msg) {
   if (eng) eng->set_last_error(msg);
 }
@@ -411,7 +1092,19 @@ void I18nEngine::scan_inline_refs(const std::string& text, std::vector<std::stri
   out_refs.erase(std::unique(out_refs.begin(), out_refs.end()), out_refs.end());
 }
 
-std::string I18nEngine::resolve_arg(const CatalogSnapshot* state,
+const std::string* I18nEngine::find_in_scope(const ResolveScope& scope, const std::string& token, bool count) noexcept {
+  for (size_t i = 0; i < scope.layers.size(); ++i) {
+    const std::string* text = scope.layers[i]->find_text(token);
+    if (text) {
+      if (count) scope.counters[i]->hits.fetch_add(1, std::memory_order_relaxed);
+      return text;
+    }
+    if (count) scope.counters[i]->misses.fetch_add(1, std::memory_order_relaxed);
+  }
+  return nullptr;
+}
+
+std::string I18nEngine::resolve_arg(const ResolveScope& scope,
                                     const std::string& arg,
                                     std::unordered_set<std::string>& seen,
                                     int depth) {
@@ -434,29 +1127,31 @@ std::string I18nEngine::resolve_arg(const CatalogSnapshot* state,
   }
 
   if (!is_hex_token(base)) return arg;
+  if (!find_in_scope(scope, lookup, false)) return arg;
 
-  auto it = state->catalog.find(lookup);
-  if (it == state->catalog.end()) return arg;
-
-  return translate_impl(state, lookup, {}, seen, depth + 1);
+  return translate_impl(scope, lookup, {}, seen, depth + 1);
 }
 
-std::string I18nEngine::translate_impl(const CatalogSnapshot* state,
+std::string I18nEngine::translate_impl(const ResolveScope& scope,
                                        const std::string& token,
                                        const std::vector<std::string>& args,
                                        std::unordered_set<std::string>& seen,
-                                       int depth) {
+                                       int depth,
+                                       bool count_lookup,
+                                       const std::vector<TypedArg>* typed) {
   if (depth > 32) return "⟦RECURSION_LIMIT⟧";
   if (seen.count(token)) return "⟦CYCLE:" + token + "⟧";
   seen.insert(token);
 
-  auto it = state->catalog.find(token);
-  if (it == state->catalog.end()) {
+  // Nur der Top-Level-Lookup zählt Hits/Misses pro Locale, Inline-Refs und Token-Argumente nicht.
+  const std::string* found = find_in_scope(scope, token, count_lookup);
+  if (!found) {
+    report_damage(scope, token);
     seen.erase(token);
     return "⟦" + token + "⟧";
   }
 
-  const std::string& raw = it->second;
+  const std::string& raw = *found;
   std::string out;
   out.reserve(raw.size() + 32);
 
@@ -468,8 +1163,8 @@ std::string I18nEngine::translate_impl(const CatalogSnapshot* state,
 
       if (try_parse_inline_token(raw, i, ref_tok, adv)) {
         // harte Token-Ref: muss im Catalog sein, sonst sichtbarer Marker
-        if (state->catalog.find(ref_tok) == state->catalog.end()) out += "⟦MISSING:@" + ref_tok + "⟧";
-        else out += translate_impl(state, ref_tok, {}, seen, depth + 1);
+        if (!find_in_scope(scope, ref_tok, false)) out += "⟦MISSING:@" + ref_tok + "⟧";
+        else out += translate_impl(scope, ref_tok, {}, seen, depth + 1);
 
         i += adv;
         continue;
@@ -497,8 +1192,14 @@ std::string I18nEngine::translate_impl(const CatalogSnapshot* state,
         ++j;
       }
 
-      if (idx >= 0 && (size_t)idx < args.size()) out += resolve_arg(state, args[(size_t)idx], seen, depth);
-      else out += "⟦arg:" + std::to_string(idx) + "⟧";
+      if (typed) {
+        if (idx >= 0 && (size_t)idx < typed->size()) append_typed_arg(scope, (*typed)[(size_t)idx], out, seen, depth);
+        else out += "⟦arg:" + std::to_string(idx) + "⟧";
+      } else if (idx >= 0 && (size_t)idx < args.size()) {
+        out += resolve_arg(scope, args[(size_t)idx], seen, depth);
+      } else {
+        out += "⟦arg:" + std::to_string(idx) + "⟧";
+      }
 
       i = j;
       continue;
@@ -511,6 +1212,46 @@ std::string I18nEngine::translate_impl(const CatalogSnapshot* state,
   return out;
 }
 
+void I18nEngine::append_typed_arg(const ResolveScope& scope, const TypedArg& arg, std::string& out,
+                                  std::unordered_set<std::string>& seen, int depth) {
+  char buf[128];
+  switch (arg.kind) {
+    case TypedArg::Kind::LITERAL:
+      out.append(arg.text.data(), arg.text.size());
+      return;
+    case TypedArg::Kind::INT: {
+      const auto res = std::to_chars(buf, buf + sizeof(buf), arg.int_value);
+      out.append(buf, res.ptr);
+      return;
+    }
+    case TypedArg::Kind::DOUBLE: {
+      std::to_chars_result res{buf, std::errc::value_too_large};
+      if (arg.precision >= 0) {
+        res = std::to_chars(buf, buf + sizeof(buf), arg.double_value, std::chars_format::fixed,
+                            std::min(arg.precision, 20));
+      }
+      // precision < 0 oder zu groß für feste Schreibweise: kürzeste exakte Darstellung.
+      if (res.ec != std::errc()) res = std::to_chars(buf, buf + sizeof(buf), arg.double_value);
+      out.append(buf, res.ptr);
+      return;
+    }
+    case TypedArg::Kind::TOKEN_ID: {
+      static const char digits[] = "0123456789abcdef";
+      int width = 1;
+      while (width < 16 && (arg.token_id >> (4 * width)) != 0) ++width;
+      width = std::max(width, arg.precision > 0 ? std::min(arg.precision, 32) : 6);
+      std::string token((size_t)width, '0');
+      uint64_t value = arg.token_id;
+      for (int i = width - 1; i >= 0 && value; --i, value >>= 4) token[(size_t)i] = digits[value & 0xF];
+      out += translate_impl(scope, token, {}, seen, depth + 1);
+      return;
+    }
+    case TypedArg::Kind::TOKEN:
+      out += translate_impl(scope, to_lower_ascii(std::string(arg.text)), {}, seen, depth + 1);
+      return;
+  }
+}
+
 std::string I18nEngine::read_file_utf8(const char* path, std::string& err) {
   err.clear();
   std::ifstream f(path, std::ios::binary);
@@ -541,7 +1282,7 @@ bool I18nEngine::load_txt_catalog(std::string src, bool strict) {
   std::string err;
   if (looks_like_binary_catalog(src)) {
     const uint8_t* data = reinterpret_cast<const uint8_t*>(src.data());
-    snapshot = build_snapshot_from_binary(data, src.size(), strict, err);
+    snapshot = build_snapshot_from_binary(data, src.size(), strict, false, err);
   } else {
     strip_utf8_bom(src);
     snapshot = build_snapshot_from_text(std::move(src), strict, err);
@@ -660,7 +1401,8 @@ std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::build_snapshot_from_tex
   return snapshot;
 }
 
-std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::build_snapshot_from_binary(const uint8_t* data, size_t size, bool strict, std::string& err) {
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::build_snapshot_from_binary(const uint8_t* data, size_t size, bool strict,
+                                                                                   bool trusted, std::string& err) {
   err.clear();
   if (size < BINARY_HEADER_SIZE_V1) {
     err = "Binär-Format: Header zu kurz.";
@@ -673,10 +1415,15 @@ std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::build_snapshot_from_bin
   }
 
   const uint8_t version = data[4];
-  if (version != BINARY_VERSION_V1 && version != BINARY_VERSION) {
+  if (version != BINARY_VERSION_V1 && version != BINARY_VERSION && version != BINARY_VERSION_V3) {
     err = "Binär-Format-Version nicht unterstützt.";
     return {};
   }
+  const uint8_t flags = (version >= BINARY_VERSION_V3) ? data[5] : 0;
+  if (flags & ~BINARY_FLAGS_KNOWN) {
+    err = "Binär-Format: Unbekannte Flags.";
+    return {};
+  }
 
   uint8_t plural_rule = 0;
   size_t header_size = (version == BINARY_VERSION_V1) ? BINARY_HEADER_SIZE_V1 : BINARY_HEADER_SIZE_V2;
@@ -730,7 +1477,19 @@ std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::build_snapshot_from_bin
     cursor += note_len;
   }
 
+  uint64_t section_hashes[SECTION_CHECKSUM_COUNT] = {};
   size_t entry_table_offset = metadata_block_offset + metadata_size;
+  if (flags & BINARY_FLAG_SECTION_CHECKSUMS) {
+    if (entry_table_offset + SECTION_CHECKSUM_RECORD_SIZE > size ||
+        read_le_u32(data + entry_table_offset) != SECTION_CHECKSUM_COUNT) {
+      err = "Binär-Format: Sektions-Checksummen fehlen.";
+      return {};
+    }
+    for (uint32_t i = 0; i < SECTION_CHECKSUM_COUNT; ++i) {
+      section_hashes[i] = read_le_u64(data + entry_table_offset + 4 + i * 8);
+    }
+    entry_table_offset += SECTION_CHECKSUM_RECORD_SIZE;
+  }
   size_t offset = entry_table_offset;
 struct EntryInfo {
     std::string base;
@@ -803,19 +1562,124 @@ struct EntryInfo {
     return {};
   }
 
-  uint32_t computed_checksum = 0;
-  if (version == BINARY_VERSION_V1) {
-    computed_checksum = fnv1a32(data + strings_base, string_table_size);
-  } else {
-    computed_checksum = 2166136261u;
-    if (metadata_size > 0) computed_checksum = fnv1a32_append(computed_checksum, data + metadata_block_offset, metadata_size);
-    computed_checksum = fnv1a32_append(computed_checksum, data + entry_table_offset, strings_base - entry_table_offset);
-    computed_checksum = fnv1a32_append(computed_checksum, data + strings_base, string_table_size);
+  // Geprüft wird nur im Strict-Mode; trusted überspringt das Hashing komplett (signierte Release-Pipeline).
+  const bool verify = strict && !trusted;
+  const bool block_checksums = (flags & BINARY_FLAG_BLOCK_CHECKSUMS) != 0;
+  if (block_checksums && (flags & (BINARY_FLAG_COMPRESSED | BINARY_FLAG_SECTION_CHECKSUMS)) !=
+                             (BINARY_FLAG_COMPRESSED | BINARY_FLAG_SECTION_CHECKSUMS)) {
+    err = "Binär-Format: Block-Checksummen ohne komprimierte String-Table.";
+    return {};
+  }
+  // Die String-Table wird erst beim ersten Zugriff geprüft (siehe LazyTexts), hier nur Record, Metadata und Einträge.
+  const bool lazy_verify = verify && (flags & BINARY_FLAG_SECTION_CHECKSUMS);
+  if (lazy_verify) {
+    const size_t record_offset = metadata_block_offset + metadata_size;
+    const bool record_ok = fnv1a32(data + record_offset, SECTION_CHECKSUM_RECORD_SIZE) == checksum;
+    const bool meta_ok = section_hash64(data + metadata_block_offset, metadata_size) == section_hashes[0];
+    const bool entries_ok = section_hash64(data + entry_table_offset, strings_base - entry_table_offset) == section_hashes[1];
+    if (!record_ok || !meta_ok || !entries_ok) {
+      err = "Binär-Format: Checksum stimmt nicht.";
+      return {};
+    }
+  } else if (verify) {
+    uint32_t computed_checksum = 0;
+    if (version == BINARY_VERSION_V1) {
+      computed_checksum = fnv1a32(data + strings_base, string_table_size);
+    } else {
+      computed_checksum = 2166136261u;
+      if (metadata_size > 0) computed_checksum = fnv1a32_append(computed_checksum, data + metadata_block_offset, metadata_size);
+      computed_checksum = fnv1a32_append(computed_checksum, data + entry_table_offset, strings_base - entry_table_offset);
+      computed_checksum = fnv1a32_append(computed_checksum, data + strings_base, string_table_size);
+    }
+    if (computed_checksum != checksum) {
+      err = "Binär-Format: Checksum stimmt nicht.";
+      return {};
+    }
   }
 
-  if (computed_checksum != checksum && strict) {
-    err = "Binär-Format: Checksum stimmt nicht.";
-    return {};
+  std::shared_ptr<LazyTexts> lazy;
+  if (flags & BINARY_FLAG_COMPRESSED) {
+    const uint8_t* section = data + strings_base;
+    if (string_table_size < COMPRESSED_SECTION_HEADER_SIZE) {
+      err = "Binär-Format: Komprimierte String-Table zu kurz.";
+      return {};
+    }
+    lazy = std::make_shared<LazyTexts>();
+    lazy->raw_size = read_le_u32(section);
+    lazy->block_size = read_le_u32(section + 4);
+    const uint32_t block_count = read_le_u32(section + 8);
+    const uint64_t index_end = COMPRESSED_SECTION_HEADER_SIZE + (uint64_t)block_count * (block_checksums ? 16 : 8);
+    if (lazy->block_size == 0 || index_end > string_table_size ||
+        (uint64_t)block_count * lazy->block_size < lazy->raw_size ||
+        (block_count > 0 && (uint64_t)(block_count - 1) * lazy->block_size >= lazy->raw_size)) {
+      err = "Binär-Format: Block-Index inkonsistent.";
+      return {};
+    }
+    if (lazy_verify && block_checksums) {
+      // Der Sektions-Hash deckt hier nur Kopf, Block-Index und Block-Hashes ab, die Blöcke selbst ihr eigener Hash.
+      if (section_hash64(section, (size_t)index_end) != section_hashes[2]) {
+        err = "Binär-Format: Checksum stimmt nicht.";
+        return {};
+      }
+      lazy->block_hashes.reserve(block_count);
+      for (uint32_t b = 0; b < block_count; ++b) {
+        lazy->block_hashes.push_back(read_le_u64(section + COMPRESSED_SECTION_HEADER_SIZE + (size_t)block_count * 8 + b * 8));
+      }
+      lazy->block_state.assign(block_count, 0);
+    } else {
+      lazy->verify_pending = lazy_verify;
+      lazy->expected_hash = section_hashes[2];
+    }
+    lazy->section.assign(section, section + string_table_size);
+    lazy->blocks.reserve(block_count);
+    for (uint32_t b = 0; b < block_count; ++b) {
+      const uint32_t block_offset = read_le_u32(section + COMPRESSED_SECTION_HEADER_SIZE + b * 8);
+      const uint32_t raw_length = read_le_u32(section + COMPRESSED_SECTION_HEADER_SIZE + b * 8 + 4);
+      const uint32_t block_length = raw_length & ~COMPRESSED_BLOCK_STORED;
+      if (block_offset < index_end || (uint64_t)block_offset + block_length > string_table_size) {
+        err = "Binär-Format: Block außerhalb der String-Table.";
+        return {};
+      }
+      lazy->blocks.push_back({ block_offset, block_length, (raw_length & COMPRESSED_BLOCK_STORED) != 0 });
+    }
+  } else if (lazy_verify) {
+    // Unkomprimierte Texte bleiben in der Sektion, bis der erste Zugriff ihre Checksumme geprüft hat.
+    lazy = std::make_shared<LazyTexts>();
+    lazy->plain = true;
+    lazy->raw_size = string_table_size;
+    lazy->section.assign(data + strings_base, data + strings_base + string_table_size);
+    lazy->verify_pending = true;
+    lazy->expected_hash = section_hashes[2];
+  }
+
+  if (lazy) {
+    lazy->entries.reserve(entries.size());
+    lazy->texts.reset(new std::atomic<const std::string*>[entries.size()]);
+    for (size_t i = 0; i < entries.size(); ++i) lazy->texts[i].store(nullptr, std::memory_order_relaxed);
+    for (const auto& entry : entries) {
+      if ((uint64_t)entry.text_offset + entry.text_length > lazy->raw_size) {
+        err = "Binär-Format: Text-Offset außerhalb der String-Table.";
+        return {};
+      }
+      std::string key = entry.base;
+      if (!entry.variant.empty()) {
+        key += '{';
+        key += entry.variant;
+        key += '}';
+        snapshot->plural_variants[entry.base].insert(entry.variant);
+      }
+      if (!snapshot->lazy_index.emplace(std::move(key), (uint32_t)lazy->entries.size()).second) {
+        err = "Binär-Format: Doppelte Einträge.";
+        return {};
+      }
+      lazy->entries.emplace_back(entry.text_offset, entry.text_length);
+    }
+    if (lazy->entries.empty()) {
+      err = "Binär-Format: Kein Eintrag enthalten.";
+      return {};
+    }
+    snapshot->lazy = std::move(lazy);
+    return snapshot;
   }
 
   for (const auto& entry : entries) {
@@ -853,6 +1717,7 @@ struct EntryInfo {
 
 void I18nEngine::install_snapshot(std::shared_ptr<CatalogSnapshot> snapshot) {
   if (!snapshot) return;
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
   meta_locale = snapshot->meta_locale;
   meta_fallback = snapshot->meta_fallback;
   meta_note = snapshot->meta_note;
@@ -860,105 +1725,907 @@ void I18nEngine::install_snapshot(std::shared_ptr<CatalogSnapshot> snapshot) {
   std::atomic_store_explicit(&active_snapshot,
                              std::static_pointer_cast<const CatalogSnapshot>(snapshot),
                              std::memory_order_release);
+  rebuild_scope();
 }
 
-std::shared_ptr<const I18nEngine::CatalogSnapshot> I18nEngine::acquire_snapshot() const noexcept {
-  return std::atomic_load_explicit(&active_snapshot, std::memory_order_acquire);
-}
-
-bool I18nEngine::is_binary_catalog_path(const std::string& path) noexcept {
-  const size_t dot_pos = path.find_last_of('.');
-  if (dot_pos == std::string::npos) return false;
-  std::string ext = path.substr(dot_pos);
-  for (char& c : ext) c = (char)std::tolower((unsigned char)c);
-  return ext == ".i18n" || ext == ".bin";
+std::shared_ptr<I18nEngine::LocaleCounters> I18nEngine::counters_for(const std::string& locale) {
+  auto& slot = locale_counters[locale];
+  if (!slot) slot = std::make_shared<LocaleCounters>();
+  return slot;
 }
-
-bool I18nEngine::load_txt_file(const char* path, bool strict) {
-  clear_last_error();
-  if (!path) { set_last_error("path == nullptr"); return false; }
 
-  std::string err;
-  std::shared_ptr<CatalogSnapshot> snapshot;
-  const std::string path_str = path;
+void I18nEngine::rebuild_scope() {
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  auto primary = acquire_snapshot();
+  if (!primary) return;
+
+  auto scope = std::make_shared<ResolveScope>();
+  scope->results = std::make_shared<ResultCache>();
+  std::unordered_set<std::string> used;
+  auto add_layer = [&](const std::string& name, std::shared_ptr<const CatalogSnapshot> snap) {
+    if (!snap || !used.insert(name).second) return;
+    scope->layers.push_back(std::move(snap));
+    scope->counters.push_back(counters_for(name));
+  };
 
-  if (is_binary_catalog_path(path_str)) {
-    FileMapping mapping;
-    if (!mapping.map(std::filesystem::path(path_str), err)) {
-      set_last_error(err);
-      return false;
-    }
-    snapshot = build_snapshot_from_binary(reinterpret_cast<const uint8_t*>(mapping.data), mapping.size, strict, err);
-    if (!snapshot) {
-      set_last_error(err);
-      return false;
+  add_layer(primary->meta_locale, primary);
+  if (fallback_chain_configured) {
+    for (const auto& name : fallback_chain) {
+      auto it = locale_snapshots.find(name);
+      if (it != locale_snapshots.end()) add_layer(name, it->second);
     }
   } else {
-    std::string data = read_file_utf8(path, err);
-    if (!err.empty()) { set_last_error(err); return false; }
-    strip_utf8_bom(data);
-    snapshot = build_snapshot_from_text(std::move(data), strict, err);
-    if (!snapshot) {
-      set_last_error(err);
-      return false;
+    // Ohne explizite Kette folgt die Engine den @meta fallback=-Verweisen der geladenen Locales.
+    std::string next = primary->meta_fallback;
+    while (!next.empty() && !used.count(next)) {
+      auto it = locale_snapshots.find(next);
+      if (it == locale_snapshots.end()) break;
+      add_layer(next, it->second);
+      next = it->second->meta_fallback;
     }
   }
 
-  current_path = path;
-  current_strict = strict;
-  install_snapshot(snapshot);
-  return true;
+  scope->generation = generation.load(std::memory_order_relaxed) + 1;
+  std::atomic_store_explicit(&active_scope,
+                             std::static_pointer_cast<const ResolveScope>(scope),
+                             std::memory_order_release);
+  generation.fetch_add(1, std::memory_order_release);
 }
 
-bool I18nEngine::reload() {
-  if (current_path.empty()) { set_last_error("No file loaded yet"); return false; }
-  // Nutzt den gespeicherten Pfad und Strict-Mode
-  return load_txt_file(current_path.c_str(), current_strict);
+uint64_t I18nEngine::get_generation() const noexcept {
+  return generation.load(std::memory_order_acquire);
 }
-
-std::string I18nEngine::translate(const std::string& token_in, const std::vector<std::string>& args) {
-  auto snapshot = acquire_snapshot();
-  if (!snapshot) return "⟦NO_CATALOG⟧";
-  std::string token = to_lower_ascii(token_in);
-  std::unordered_set<std::string> seen;
-  return translate_impl(snapshot.get(), token, args, seen, 0);
+
+std::unique_ptr<I18nEngine> I18nEngine::clone() {
+  auto copy = std::make_unique<I18nEngine>();
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  copy->active_snapshot = acquire_snapshot();
+  copy->locale_snapshots = locale_snapshots;
+  copy->fallback_chain = fallback_chain;
+  copy->fallback_chain_configured = fallback_chain_configured;
+  copy->current_path = current_path;
+  copy->current_strict = current_strict;
+  copy->current_trusted = current_trusted;
+  copy->current_stamp = current_stamp;
+  copy->applied_patches = applied_patches;
+  copy->active_bundle = active_bundle;
+  copy->current_bundle_locale = current_bundle_locale;
+  copy->cache_dir = cache_dir;
+  copy->result_cache_bytes.store(result_cache_bytes.load(std::memory_order_relaxed), std::memory_order_relaxed);
+  copy->meta_locale = meta_locale;
+  copy->meta_fallback = meta_fallback;
+  copy->meta_note = meta_note;
+  copy->meta_plural = meta_plural;
+  copy->rebuild_scope();
+  return copy;
 }
 
-std::string I18nEngine::translate_plural(const std::string& token_in,
-                                         int count,
-                                         const std::vector<std::string>& args) {
-  auto snapshot = acquire_snapshot();
-  if (!snapshot) return "⟦NO_CATALOG⟧";
-  std::string normalized = to_lower_ascii(token_in);
-  std::string base;
-  std::string variant;
-  std::string lookup;
-  if (parse_variant_suffix(normalized, base, variant) && !variant.empty()) {
-    lookup = base + "{" + variant + "}";
-  } else {
-    base = normalized;
-    const std::string desired = base + "{" + pick_variant_name(meta_plural, count) + "}";
-    if (snapshot->catalog.find(desired) != snapshot->catalog.end()) {
-      lookup = desired;
-    } else if (snapshot->catalog.find(base + "{other}") != snapshot->catalog.end()) {
-      lookup = base + "{other}";
-    } else {
-      const auto it = snapshot->plural_variants.find(base);
-      if (it != snapshot->plural_variants.end() && !it->second.empty()) {
-        lookup = base + '{' + *it->second.begin() + '}';
-      } else {
-        lookup = base;
+bool I18nEngine::preload() {
+  clear_last_error();
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  auto active = acquire_snapshot();
+  if (!active) { set_last_error("No catalog loaded"); return false; }
+  std::string err;
+  auto full = materialize(active, err);
+  if (!full) { set_last_error(err); return false; }
+  for (auto& kv : locale_snapshots) {
+    auto layer = materialize(kv.second, err);
+    if (!layer) { set_last_error(err); return false; }
+    kv.second = std::move(layer);
+  }
+  if (full != active) std::atomic_store_explicit(&active_snapshot, full, std::memory_order_release);
+  rebuild_scope();
+  return true;
+}
+
+std::shared_ptr<const I18nEngine::CatalogSnapshot> I18nEngine::acquire_snapshot() const noexcept {
+  return std::atomic_load_explicit(&active_snapshot, std::memory_order_acquire);
+}
+
+std::shared_ptr<const I18nEngine::ResolveScope> I18nEngine::acquire_scope() const noexcept {
+  return std::atomic_load_explicit(&active_scope, std::memory_order_acquire);
+}
+
+bool I18nEngine::is_binary_catalog_path(const std::string& path) noexcept {
+  const size_t dot_pos = path.find_last_of('.');
+  if (dot_pos == std::string::npos) return false;
+  std::string ext = path.substr(dot_pos);
+  for (char& c : ext) c = (char)std::tolower((unsigned char)c);
+  return ext == ".i18n" || ext == ".bin";
+}
+
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::load_snapshot_from_file(const std::string& path, bool strict, bool trusted,
+                                                                                std::string& err, SourceStamp* stamp) {
+  err.clear();
+  if (std::filesystem::path(path).extension() == ".i18ns") return load_sharded_manifest(path, strict, trusted, err);
+  if (is_binary_catalog_path(path)) {
+    FileMapping mapping;
+    if (!mapping.map(std::filesystem::path(path), err)) return {};
+    return build_snapshot_from_binary(reinterpret_cast<const uint8_t*>(mapping.data), mapping.size, strict, trusted, err);
+  }
+
+  std::string data = read_file_utf8(path.c_str(), err);
+  if (!err.empty()) return {};
+  if (stamp) {
+    stamp->hash = section_hash64(reinterpret_cast<const uint8_t*>(data.data()), data.size());
+    stamp->hashed = true;
+  }
+  strip_utf8_bom(data);
+  return build_snapshot_from_text(std::move(data), strict, err);
+}
+
+namespace {
+
+// Index eines Cache-Eintrags (<key>.i18nc): Quelle (Größe, mtime, Inhalts-Hash), Bindung an das Binary
+// (<key>.i18n, Größe + Header-Checksum) und die Labels, die das Binary-Format nicht trägt.
+struct CacheStamp {
+  uint64_t source_size = 0;
+  int64_t source_mtime = 0;
+  uint64_t source_hash = 0;
+  uint64_t binary_size = 0;
+  uint32_t binary_checksum = 0;
+  std::vector<std::pair<std::string, std::string>> labels;
+};
+
+bool read_cache_stamp(const std::filesystem::path& index_path, bool strict, CacheStamp& stamp) {
+  std::ifstream f(index_path, std::ios::binary);
+  if (!f) return false;
+  const std::string raw((std::istreambuf_iterator<char>(f)), std::istreambuf_iterator<char>());
+  const uint8_t* data = reinterpret_cast<const uint8_t*>(raw.data());
+  const size_t size = raw.size();
+  if (size < CACHE_HEADER_SIZE + 4 || std::memcmp(data, CACHE_MAGIC, 4) != 0 || data[4] != CACHE_VERSION) return false;
+  if (data[5] != (strict ? 1 : 0)) return false;
+  if (fnv1a32_append(2166136261u, data, size - 4) != read_le_u32(data + size - 4)) return false;
+  stamp.source_size = read_le_u64(data + 8);
+  stamp.source_mtime = (int64_t)read_le_u64(data + 16);
+  stamp.source_hash = read_le_u64(data + 24);
+  stamp.binary_size = read_le_u64(data + 32);
+  stamp.binary_checksum = read_le_u32(data + 40);
+  const uint32_t label_count = read_le_u32(data + 44);
+  size_t offset = CACHE_HEADER_SIZE;
+  const size_t end = size - 4;
+  stamp.labels.clear();
+  stamp.labels.reserve(label_count);
+  for (uint32_t i = 0; i < label_count; ++i) {
+    if (offset + 1 > end) return false;
+    const size_t key_len = data[offset++];
+    if (offset + key_len + 2 > end) return false;
+    std::string key(reinterpret_cast<const char*>(data + offset), key_len);
+    offset += key_len;
+    const size_t label_len = read_le_u16(data + offset);
+    offset += 2;
+    if (offset + label_len > end) return false;
+    stamp.labels.emplace_back(std::move(key), std::string(reinterpret_cast<const char*>(data + offset), label_len));
+    offset += label_len;
+  }
+  return offset == end;
+}
+
+bool write_cache_stamp(const std::filesystem::path& index_path, bool strict, const CacheStamp& stamp) {
+  std::vector<uint8_t> out;
+  out.insert(out.end(), CACHE_MAGIC, CACHE_MAGIC + 4);
+  out.push_back(CACHE_VERSION);
+  out.push_back(strict ? 1 : 0);
+  out.push_back(0);
+  out.push_back(0);
+  append_le_u64(out, stamp.source_size);
+  append_le_u64(out, (uint64_t)stamp.source_mtime);
+  append_le_u64(out, stamp.source_hash);
+  append_le_u64(out, stamp.binary_size);
+  append_le_u32(out, stamp.binary_checksum);
+  append_le_u32(out, (uint32_t)stamp.labels.size());
+  for (const auto& kv : stamp.labels) {
+    const size_t key_len = std::min(kv.first.size(), (size_t)std::numeric_limits<uint8_t>::max());
+    const size_t label_len = std::min(kv.second.size(), (size_t)std::numeric_limits<uint16_t>::max());
+    out.push_back((uint8_t)key_len);
+    out.insert(out.end(), kv.first.begin(), kv.first.begin() + key_len);
+    append_le_u16(out, (uint16_t)label_len);
+    out.insert(out.end(), kv.second.begin(), kv.second.begin() + label_len);
+  }
+  append_le_u32(out, fnv1a32_append(2166136261u, out.data(), out.size()));
+
+  AtomicFileWriter writer;
+  std::string err;
+  if (!writer.open(index_path, err)) return false;
+  writer.write(out.data(), out.size());
+  return writer.commit(err);
+}
+
+} // namespace
+
+void I18nEngine::set_cache_dir(const std::string& dir) {
+  cache_dir = dir;
+}
+
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::load_snapshot_cached(const std::string& path, bool strict,
+                                                                             bool trusted, std::string& err,
+                                                                             SourceStamp* source_stamp) const {
+  namespace fs = std::filesystem;
+  const fs::path source(path);
+  if (cache_dir.empty() || is_binary_catalog_path(path) || source.extension() == ".i18ns") {
+    return load_snapshot_from_file(path, strict, trusted, err, source_stamp);
+  }
+  err.clear();
+  std::error_code ec;
+  const uint64_t source_size = (uint64_t)fs::file_size(source, ec);
+  const auto write_time = ec ? fs::file_time_type() : fs::last_write_time(source, ec);
+  if (ec) return load_snapshot_from_file(path, strict, trusted, err, source_stamp);
+  const int64_t source_mtime = (int64_t)write_time.time_since_epoch().count();
+
+  // Schlüssel wie bei .pyc: absoluter Pfad + Strict-Mode, Gültigkeit über Größe/mtime bzw. Inhalts-Hash.
+  const std::string absolute = fs::absolute(source, ec).lexically_normal().string();
+  char key[24];
+  std::snprintf(key, sizeof(key), "%016llx.%c",
+                (unsigned long long)section_hash64(reinterpret_cast<const uint8_t*>(absolute.data()), absolute.size()),
+                strict ? 's' : 'n');
+  const fs::path index_path = fs::path(cache_dir) / (std::string(key) + ".i18nc");
+  const fs::path binary_path = fs::path(cache_dir) / (std::string(key) + ".i18n");
+
+  std::string data;
+  bool data_read = false;
+  uint64_t source_hash = 0;
+  CacheStamp stamp;
+  if (read_cache_stamp(index_path, strict, stamp) && stamp.source_size == source_size) {
+    bool fresh = stamp.source_mtime == source_mtime;
+    if (!fresh) {
+      data = read_file_utf8(path.c_str(), err);
+      if (!err.empty()) return {};
+      data_read = true;
+      source_hash = section_hash64(reinterpret_cast<const uint8_t*>(data.data()), data.size());
+      fresh = source_hash == stamp.source_hash;
+    }
+    if (fresh) {
+      source_hash = stamp.source_hash;
+      FileMapping mapping;
+      std::string cache_err;
+      if (mapping.map(binary_path, cache_err) && mapping.size == stamp.binary_size &&
+          read_le_u32(reinterpret_cast<const uint8_t*>(mapping.data) + 16) == stamp.binary_checksum) {
+        auto snapshot = build_snapshot_from_binary(reinterpret_cast<const uint8_t*>(mapping.data), mapping.size, true,
+                                                   false, cache_err);
+        if (snapshot) {
+          for (auto& kv : stamp.labels) snapshot->labels.emplace(std::move(kv.first), std::move(kv.second));
+          if (stamp.source_mtime != source_mtime) {
+            // Nur berührt, nicht geändert (z. B. git checkout): Stempel nachziehen, damit der Hash entfällt.
+            stamp.source_mtime = source_mtime;
+            stamp.labels.assign(snapshot->labels.begin(), snapshot->labels.end());
+            write_cache_stamp(index_path, strict, stamp);
+          }
+          if (source_stamp) {
+            source_stamp->hash = source_hash;
+            source_stamp->hashed = true;
+          }
+          return snapshot;
+        }
+      }
+    }
+  }
+
+  if (!data_read) {
+    data = read_file_utf8(path.c_str(), err);
+    if (!err.empty()) return {};
+    source_hash = section_hash64(reinterpret_cast<const uint8_t*>(data.data()), data.size());
+  }
+  strip_utf8_bom(data);
+  auto snapshot = build_snapshot_from_text(std::move(data), strict, err);
+  if (!snapshot) return {};
+  if (source_stamp) {
+    source_stamp->hash = source_hash;
+    source_stamp->hashed = true;
+  }
+
+  // Cache schreiben ist best effort: Fehler (z. B. schreibgeschütztes Verzeichnis) ändern das Laden nicht.
+  if (write_binary_snapshot(*snapshot, binary_path.string().c_str(), EXPORT_SECTION_CHECKSUMS)) {
+    FileMapping written;
+    std::string cache_err;
+    if (written.map(binary_path, cache_err)) {
+      CacheStamp fresh;
+      fresh.source_size = source_size;
+      fresh.source_mtime = source_mtime;
+      fresh.source_hash = source_hash;
+      fresh.binary_size = written.size;
+      fresh.binary_checksum = read_le_u32(reinterpret_cast<const uint8_t*>(written.data) + 16);
+      fresh.labels.assign(snapshot->labels.begin(), snapshot->labels.end());
+      write_cache_stamp(index_path, strict, fresh);
+    }
+  }
+  return snapshot;
+}
+
+bool I18nEngine::load_txt_file(const char* path, bool strict, bool trusted) {
+  return load_txt_source(path, strict, trusted, {});
+}
+
+bool I18nEngine::load_txt_source(const char* path, bool strict, bool trusted, const std::vector<std::string>& patches) {
+  clear_last_error();
+  if (!path) { set_last_error("path == nullptr"); return false; }
+
+  // Stempel vor dem Lesen: ändert sich die Datei währenddessen, lädt reload_if_changed eher einmal zu viel.
+  SourceStamp stamp = stamp_source(path);
+  std::string err;
+  auto snapshot = load_snapshot_cached(path, strict, trusted, err, &stamp);
+  if (!snapshot || !apply_patches(snapshot, patches, err)) {
+    set_last_error(err);
+    return false;
+  }
+  publish_source(path, strict, trusted, patches, stamp, std::move(snapshot));
+  return true;
+}
+
+void I18nEngine::publish_source(const std::string& path, bool strict, bool trusted,
+                                const std::vector<std::string>& patches, const SourceStamp& stamp,
+                                std::shared_ptr<CatalogSnapshot> snapshot) {
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  current_stamp = stamp;
+  current_path = path;
+  applied_patches = patches;
+  current_strict = strict;
+  current_trusted = trusted;
+  active_bundle.reset();
+  current_bundle_locale.clear();
+  install_snapshot(std::move(snapshot));
+}
+
+bool I18nEngine::stat_source(const std::string& path, SourceStamp& stamp) {
+  std::error_code ec;
+  const std::filesystem::path source(path);
+  stamp.size = (uint64_t)std::filesystem::file_size(source, ec);
+  if (ec) return false;
+  const auto write_time = std::filesystem::last_write_time(source, ec);
+  if (ec) return false;
+  stamp.mtime = (int64_t)write_time.time_since_epoch().count();
+  return true;
+}
+
+I18nEngine::SourceStamp I18nEngine::stamp_source(const std::string& path) {
+  // Nur stat: Laden soll die Quelle (ggf. GB-große Binaries) nicht ein zweites Mal komplett lesen.
+  SourceStamp stamp;
+  stamp.valid = stat_source(path, stamp);
+  return stamp;
+}
+
+bool I18nEngine::hash_source(const std::string& path, SourceStamp& stamp) {
+  stamp.hashed = false;
+  if (stamp.size == 0) {
+    stamp.hash = section_hash64(nullptr, 0);
+  } else {
+    FileMapping mapping;
+    std::string err;
+    if (!mapping.map(std::filesystem::path(path), err) || mapping.size != stamp.size) return false;
+    stamp.hash = section_hash64(reinterpret_cast<const uint8_t*>(mapping.data), mapping.size);
+  }
+  stamp.hashed = true;
+  return true;
+}
+
+int I18nEngine::reload_if_changed() {
+  clear_last_error();
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  if (current_path.empty()) { set_last_error("No file loaded yet"); return -1; }
+  SourceStamp now;
+  if (!stat_source(current_path, now)) {
+    set_last_error("Datei konnte nicht geöffnet werden.");
+    return -1;
+  }
+  now.valid = true;
+  // Shard-Manifeste und Bundles: der Roh-Hash der Datei deckt nicht den ganzen Inhalt ab, also nur stat.
+  if (active_bundle || std::filesystem::path(current_path).extension() == ".i18ns") {
+    if (current_stamp.valid && now.size == current_stamp.size && now.mtime == current_stamp.mtime) return 0;
+    return reload() ? 1 : -1;
+  }
+  if (current_stamp.valid && now.size == current_stamp.size) {
+    if (now.mtime == current_stamp.mtime) {
+      // Binaries werden beim Laden nicht gehasht: Roh-Hash nachholen, solange die Datei unverändert ist.
+      SourceStamp after;
+      if (!current_stamp.hashed && hash_source(current_path, now) && stat_source(current_path, after) &&
+          after.size == now.size && after.mtime == now.mtime) {
+        current_stamp = now;
+      }
+      return 0;
+    }
+    // Nur berührt (z. B. git checkout)? Roh-Hash der Bytes vergleichen, ohne zu parsen.
+    if (current_stamp.hashed && hash_source(current_path, now) && now.hash == current_stamp.hash) {
+      current_stamp = now;
+      return 0;
+    }
+  }
+
+  // Geändert: einmal parsen und über denselben Weg wie load_txt_source veröffentlichen.
+  std::string err;
+  SourceStamp stamp = now;
+  stamp.hashed = false;
+  auto fresh = load_snapshot_cached(current_path, current_strict, current_trusted, err, &stamp);
+  if (!fresh || !apply_patches(fresh, applied_patches, err)) {
+    set_last_error(err);
+    return -1;
+  }
+  publish_source(current_path, current_strict, current_trusted, applied_patches, stamp, std::move(fresh));
+  return 1;
+}
+
+struct I18nEngine::ResultCache {
+  std::mutex mutex;
+  std::list<std::pair<std::string, std::string>> lru; // vorne = zuletzt benutzt
+  std::unordered_map<std::string_view, std::list<std::pair<std::string, std::string>>::iterator> index;
+  uint64_t bytes = 0;
+  bool damaged = false; // Ergebnisse unlesbarer Einträge werden nicht gecacht, sonst fehlt beim Treffer der Fehler.
+
+  static uint64_t cost(const std::pair<std::string, std::string>& entry) {
+    return entry.first.size() + entry.second.size() + RESULT_CACHE_ENTRY_OVERHEAD;
+  }
+
+  // Gibt die Zahl verdrängter Einträge zurück.
+  uint64_t trim(uint64_t budget) {
+    uint64_t evicted = 0;
+    while (bytes > budget && !lru.empty()) {
+      bytes -= cost(lru.back());
+      index.erase(lru.back().first);
+      lru.pop_back();
+      ++evicted;
+    }
+    return evicted;
+  }
+};
+
+struct I18nEngine::ReloadWorker {
+  std::mutex mutex;
+  std::condition_variable wake;
+  std::vector<ReloadCallback> pending;
+  bool stop = false;
+  std::thread thread;
+};
+
+I18nEngine::I18nEngine() = default;
+
+I18nEngine::~I18nEngine() {
+  if (!reload_worker) return;
+  {
+    std::lock_guard<std::mutex> lock(reload_worker->mutex);
+    reload_worker->stop = true;
+  }
+  reload_worker->wake.notify_one();
+  reload_worker->thread.join();
+}
+
+bool I18nEngine::reload_async(ReloadCallback done) {
+  clear_last_error();
+  {
+    std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+    if (current_path.empty()) { set_last_error("No file loaded yet"); return false; }
+  }
+  if (!reload_worker) {
+    reload_worker = std::make_unique<ReloadWorker>();
+    reload_worker->thread = std::thread([this] { run_reload_worker(); });
+  }
+  {
+    std::lock_guard<std::mutex> lock(reload_worker->mutex);
+    reload_worker->pending.push_back(std::move(done));
+  }
+  reload_worker->wake.notify_one();
+  return true;
+}
+
+void I18nEngine::run_reload_worker() {
+  ReloadWorker& worker = *reload_worker;
+  for (;;) {
+    std::vector<ReloadCallback> batch;
+    bool stopping;
+    {
+      std::unique_lock<std::mutex> lock(worker.mutex);
+      worker.wake.wait(lock, [&] { return worker.stop || !worker.pending.empty(); });
+      batch.swap(worker.pending);
+      stopping = worker.stop;
+    }
+    if (stopping) {
+      for (auto& done : batch) if (done) done(false, "Engine wird freigegeben.");
+      return;
+    }
+    // Alle bis hierher eingegangenen Anfragen teilen sich einen Parse-Lauf.
+    std::string err;
+    const bool ok = reload_in_background(err);
+    for (auto& done : batch) if (done) done(ok, err);
+  }
+}
+
+bool I18nEngine::reload_in_background(std::string& err) {
+  std::string path;
+  std::string bundle_locale;
+  std::vector<std::string> patches;
+  bool strict;
+  bool trusted;
+  bool is_bundle;
+  {
+    std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+    path = current_path;
+    bundle_locale = current_bundle_locale;
+    patches = applied_patches;
+    strict = current_strict;
+    trusted = current_trusted;
+    is_bundle = active_bundle != nullptr;
+  }
+
+  // Lesen und Parsen ohne Lock: Übersetzungen und andere Aufrufe laufen auf dem alten Snapshot weiter.
+  SourceStamp stamp = stamp_source(path);
+  std::shared_ptr<const BundleView> bundle;
+  std::shared_ptr<CatalogSnapshot> snapshot;
+  if (is_bundle) {
+    bundle = open_bundle(path, strict, err);
+    if (!bundle) return false;
+  } else {
+    snapshot = load_snapshot_cached(path, strict, trusted, err, &stamp);
+    if (!snapshot || !apply_patches(snapshot, patches, err)) return false;
+  }
+
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  if (current_path != path) {
+    err = "Reload verworfen: Zwischenzeitlich wurde ein anderer Katalog geladen.";
+    return false;
+  }
+  if (applied_patches != patches) {
+    err = "Reload verworfen: Zwischenzeitlich wurde ein Patch angewendet.";
+    return false;
+  }
+  if (is_bundle) {
+    if (!install_bundle_locale(std::move(bundle), bundle_locale, err, patches)) return false;
+  } else {
+    install_snapshot(snapshot);
+  }
+  current_stamp = stamp;
+  return true;
+}
+
+bool I18nEngine::reload() {
+  if (current_path.empty()) { set_last_error("No file loaded yet"); return false; }
+  // Kopien: die Loader überschreiben current_path und applied_patches.
+  const std::string path = current_path;
+  const std::vector<std::string> patches = applied_patches;
+  if (active_bundle) return load_bundle_source(path.c_str(), current_bundle_locale.c_str(), current_strict, patches);
+  // Nutzt den gespeicherten Pfad und Strict-Mode, angewendete Patches bleiben erhalten
+  return load_txt_source(path.c_str(), current_strict, current_trusted, patches);
+}
+
+bool I18nEngine::load_locale_file(const char* path, bool strict) {
+  clear_last_error();
+  if (!path) { set_last_error("path == nullptr"); return false; }
+
+  std::string err;
+  auto snapshot = load_snapshot_cached(path, strict, false, err);
+  if (!snapshot) {
+    set_last_error(err);
+    return false;
+  }
+
+  std::string name = snapshot->meta_locale;
+  if (name.empty()) name = std::filesystem::path(path).stem().string();
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  locale_snapshots[name] = std::move(snapshot);
+  rebuild_scope();
+  return true;
+}
+
+void I18nEngine::set_fallback_chain(const std::string& chain) {
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  fallback_chain.clear();
+  size_t start = 0;
+  while (start <= chain.size()) {
+    size_t end = chain.find_first_of(",;>", start);
+    if (end == std::string::npos) end = chain.size();
+    std::string name = chain.substr(start, end - start);
+    trim_inplace(name);
+    if (!name.empty()) fallback_chain.push_back(std::move(name));
+    start = end + 1;
+  }
+  fallback_chain_configured = !fallback_chain.empty();
+  rebuild_scope();
+}
+
+std::string I18nEngine::get_fallback_chain() const {
+  auto scope = acquire_scope();
+  std::string out;
+  if (!scope) return out;
+  for (const auto& layer : scope->layers) {
+    if (!out.empty()) out += ',';
+    out += layer->meta_locale;
+  }
+  return out;
+}
+
+bool I18nEngine::get_locale_stats(const std::string& locale, uint64_t& out_hits, uint64_t& out_misses) const {
+  out_hits = 0;
+  out_misses = 0;
+  std::string name = locale;
+  if (name.empty()) {
+    auto primary = acquire_snapshot();
+    if (!primary) return false;
+    name = primary->meta_locale;
+  }
+  auto it = locale_counters.find(name);
+  if (it == locale_counters.end()) return false;
+  out_hits = it->second->hits.load(std::memory_order_relaxed);
+  out_misses = it->second->misses.load(std::memory_order_relaxed);
+  return true;
+}
+
+void I18nEngine::set_result_cache(uint64_t max_bytes) {
+  result_cache_bytes.store(max_bytes, std::memory_order_relaxed);
+  auto scope = acquire_scope();
+  if (!scope) return;
+  std::lock_guard<std::mutex> lock(scope->results->mutex);
+  result_cache_evictions.fetch_add(scope->results->trim(max_bytes), std::memory_order_relaxed);
+}
+
+void I18nEngine::get_result_cache_stats(uint64_t& out_hits, uint64_t& out_misses, uint64_t& out_evictions,
+                                        uint64_t& out_bytes) const {
+  out_hits = result_cache_hits.load(std::memory_order_relaxed);
+  out_misses = result_cache_misses.load(std::memory_order_relaxed);
+  out_evictions = result_cache_evictions.load(std::memory_order_relaxed);
+  out_bytes = 0;
+  auto scope = acquire_scope();
+  if (!scope) return;
+  std::lock_guard<std::mutex> lock(scope->results->mutex);
+  out_bytes = scope->results->bytes;
+}
+
+std::string I18nEngine::result_key(char kind, int count, const std::string& token, const std::vector<std::string>& args) {
+  size_t size = 1 + sizeof(count) + token.size();
+  for (const auto& arg : args) size += arg.size() + 1;
+  std::string key;
+  key.reserve(size);
+  key += kind;
+  key.append(reinterpret_cast<const char*>(&count), sizeof(count));
+  key += token;
+  // Argumente kommen als C-Strings an und enthalten daher kein NUL.
+  for (const auto& arg : args) {
+    key += '\0';
+    key += arg;
+  }
+  return key;
+}
+
+bool I18nEngine::cached_result(const ResolveScope& scope, const std::string& key, std::string& out) {
+  auto& cache = *scope.results;
+  std::lock_guard<std::mutex> lock(cache.mutex);
+  auto it = cache.index.find(key);
+  if (it == cache.index.end()) {
+    result_cache_misses.fetch_add(1, std::memory_order_relaxed);
+    return false;
+  }
+  cache.lru.splice(cache.lru.begin(), cache.lru, it->second);
+  out = it->second->second;
+  result_cache_hits.fetch_add(1, std::memory_order_relaxed);
+  return true;
+}
+
+void I18nEngine::store_result(const ResolveScope& scope, std::string key, const std::string& value, uint64_t budget) {
+  if (key.size() + value.size() + RESULT_CACHE_ENTRY_OVERHEAD > budget) return;
+  auto& cache = *scope.results;
+  std::lock_guard<std::mutex> lock(cache.mutex);
+  if (cache.damaged || cache.index.count(key)) return;
+  cache.lru.emplace_front(std::move(key), value);
+  cache.index.emplace(cache.lru.front().first, cache.lru.begin());
+  cache.bytes += ResultCache::cost(cache.lru.front());
+  result_cache_evictions.fetch_add(cache.trim(budget), std::memory_order_relaxed);
+}
+
+void I18nEngine::report_damage(const ResolveScope& scope, const std::string& token) {
+  // Ein vorhandener, aber unlesbarer Eintrag wird wie ein fehlender gerendert, der Grund landet in last_error.
+  for (const auto& layer : scope.layers) {
+    std::string why = layer->damage_for(token);
+    if (why.empty()) continue;
+    set_last_error(std::move(why));
+    std::lock_guard<std::mutex> lock(scope.results->mutex);
+    scope.results->damaged = true;
+    return;
+  }
+}
+
+bool I18nEngine::translate_plural_column(const std::string& token_in, const void* counts, int count_bytes,
+                                         size_t rows, const char* const* args, size_t arg_columns,
+                                         std::string& arena, std::vector<size_t>& lengths) {
+  arena.clear();
+  lengths.assign(rows, 0);
+  if (count_bytes != 4 && count_bytes != 8) {
+    set_last_error("count_bytes muss 4 oder 8 sein");
+    return false;
+  }
+  auto scope = acquire_scope();
+  if (!scope) {
+    set_last_error("No catalog loaded");
+    return false;
+  }
+  const std::string normalized = to_lower_ascii(token_in);
+  const PluralRule rule = scope->layers.front()->meta_plural;
+
+  // Höchstens eine Form pro Pluralkategorie; pick_variant_name liefert feste Literale, Vergleich per Zeiger genügt.
+  struct Form {
+    const char* name;
+    std::string lookup;
+    bool fixed;
+    std::string text;
+  };
+  std::vector<Form> forms;
+  std::vector<std::string> row_args(arg_columns);
+  std::unordered_set<std::string> seen;
+
+  for (size_t row = 0; row < rows; ++row) {
+    const int64_t n = count_bytes == 8 ? static_cast<const int64_t*>(counts)[row]
+                                       : static_cast<const int32_t*>(counts)[row];
+    // Große Werte behalten n % 100 (alle Regeln prüfen höchstens mod 10/100) und bleiben > 2.
+    const int count = n < 0 ? -1 : n > 1000000000 ? 1000000000 + (int)(n % 100) : (int)n;
+    const char* name = pick_variant_name(rule, count);
+    Form* form = nullptr;
+    for (auto& f : forms) {
+      if (f.name == name) { form = &f; break; }
+    }
+    if (!form) {
+      Form f{name, plural_lookup(*scope, normalized, count), true, std::string()};
+      const std::string* raw = find_in_scope(*scope, f.lookup, false);
+      if (raw) {
+        for (size_t i = 0; i + 1 < raw->size(); ++i) {
+          if ((*raw)[i] == '%' && is_digit((unsigned char)(*raw)[i + 1])) { f.fixed = false; break; }
+        }
       }
+      if (f.fixed) f.text = translate_impl(*scope, f.lookup, {}, seen, 0);
+      forms.push_back(std::move(f));
+      form = &forms.back();
     }
+
+    const size_t start = arena.size();
+    if (form->fixed) {
+      arena += form->text;
+    } else {
+      for (size_t col = 0; col < arg_columns; ++col) {
+        const char* arg = args ? args[col * rows + row] : nullptr;
+        row_args[col].assign(arg ? arg : "");
+      }
+      arena += translate_impl(*scope, form->lookup, row_args, seen, 0);
+    }
+    lengths[row] = arena.size() - start;
+    arena += '\0';
+  }
+  return true;
+}
+
+std::string I18nEngine::typed_result_key(char kind, int count, const std::string& token,
+                                         const std::vector<TypedArg>& args) {
+  std::string key = result_key(kind, count, token, {});
+  for (const auto& arg : args) {
+    key += '\0';
+    key += (char)arg.kind;
+    switch (arg.kind) {
+      case TypedArg::Kind::LITERAL:
+      case TypedArg::Kind::TOKEN:
+        key.append(arg.text.data(), arg.text.size());
+        break;
+      case TypedArg::Kind::INT:
+        key.append(reinterpret_cast<const char*>(&arg.int_value), sizeof(arg.int_value));
+        break;
+      case TypedArg::Kind::DOUBLE:
+        key.append(reinterpret_cast<const char*>(&arg.double_value), sizeof(arg.double_value));
+        key.append(reinterpret_cast<const char*>(&arg.precision), sizeof(arg.precision));
+        break;
+      case TypedArg::Kind::TOKEN_ID:
+        key.append(reinterpret_cast<const char*>(&arg.token_id), sizeof(arg.token_id));
+        key.append(reinterpret_cast<const char*>(&arg.precision), sizeof(arg.precision));
+        break;
+    }
+  }
+  return key;
+}
+
+std::string I18nEngine::translate_ex(const std::string& token_in, const std::vector<TypedArg>& args, bool count_stats) {
+  return translate_typed(acquire_scope(), token_in, false, 0, args, count_stats);
+}
+
+std::string I18nEngine::translate_plural_ex(const std::string& token_in, int count, const std::vector<TypedArg>& args,
+                                            bool count_stats) {
+  return translate_typed(acquire_scope(), token_in, true, count, args, count_stats);
+}
+
+std::string I18nEngine::translate_typed(const std::shared_ptr<const ResolveScope>& scope, const std::string& token_in,
+                                        bool plural, int count, const std::vector<TypedArg>& args, bool count_stats) {
+  if (!scope) return "⟦NO_CATALOG⟧";
+  const std::string normalized = to_lower_ascii(token_in);
+  const uint64_t budget = result_cache_bytes.load(std::memory_order_relaxed);
+  std::string key;
+  std::string out;
+  if (budget) {
+    key = typed_result_key(plural ? 'P' : 'T', plural ? count : 0, normalized, args);
+    if (cached_result(*scope, key, out)) return out;
+  }
+  const std::string lookup = plural ? plural_lookup(*scope, normalized, count) : normalized;
+  std::unordered_set<std::string> seen;
+  out = translate_impl(*scope, lookup, {}, seen, 0, count_stats, &args);
+  if (budget) store_result(*scope, std::move(key), out, budget);
+  return out;
+}
+
+I18nEngine::PinnedScope I18nEngine::pin_scope() const noexcept {
+  return acquire_scope();
+}
+
+uint64_t I18nEngine::pinned_generation(const PinnedScope& scope) noexcept {
+  return scope ? scope->generation : 0;
+}
+
+std::string I18nEngine::translate(const std::string& token_in, const std::vector<std::string>& args, bool count_stats) {
+  return translate(acquire_scope(), token_in, args, count_stats);
+}
+
+std::string I18nEngine::translate(const PinnedScope& scope, const std::string& token_in,
+                                  const std::vector<std::string>& args, bool count_stats) {
+  if (!scope) return "⟦NO_CATALOG⟧";
+  std::string token = to_lower_ascii(token_in);
+  const uint64_t budget = result_cache_bytes.load(std::memory_order_relaxed);
+  std::string key;
+  std::string out;
+  if (budget) {
+    key = result_key('t', 0, token, args);
+    if (cached_result(*scope, key, out)) return out;
+  }
+  std::unordered_set<std::string> seen;
+  out = translate_impl(*scope, token, args, seen, 0, count_stats);
+  if (budget) store_result(*scope, std::move(key), out, budget);
+  return out;
+}
+
+bool I18nEngine::has_token(const std::string& token_in) const {
+  auto scope = acquire_scope();
+  if (!scope) return false;
+  const std::string token = to_lower_ascii(token_in);
+  for (const auto& layer : scope->layers) {
+    if (layer->find_text(token)) return true;
+    const auto* variants = layer->find_variants(token);
+    if (variants && !variants->empty()) return true;
+  }
+  return false;
+}
+
+std::string I18nEngine::plural_lookup(const ResolveScope& scope, const std::string& normalized, int count) {
+  std::string base;
+  std::string variant;
+  if (parse_variant_suffix(normalized, base, variant) && !variant.empty()) return base + "{" + variant + "}";
+  base = normalized;
+  const std::string desired = base + "{" + pick_variant_name(scope.layers.front()->meta_plural, count) + "}";
+  if (find_in_scope(scope, desired, false)) return desired;
+  if (find_in_scope(scope, base + "{other}", false)) return base + "{other}";
+  for (const auto& layer : scope.layers) {
+    const auto* variants = layer->find_variants(base);
+    if (variants && !variants->empty()) return base + '{' + *variants->begin() + '}';
   }
+  return base;
+}
+
+std::string I18nEngine::translate_plural(const std::string& token_in,
+                                         int count,
+                                         const std::vector<std::string>& args,
+                                         bool count_stats) {
+  return translate_plural(acquire_scope(), token_in, count, args, count_stats);
+}
 
+std::string I18nEngine::translate_plural(const PinnedScope& scope,
+                                         const std::string& token_in,
+                                         int count,
+                                         const std::vector<std::string>& args,
+                                         bool count_stats) {
+  if (!scope) return "⟦NO_CATALOG⟧";
+  std::string normalized = to_lower_ascii(token_in);
+  const uint64_t budget = result_cache_bytes.load(std::memory_order_relaxed);
+  std::string key;
+  std::string out;
+  if (budget) {
+    key = result_key('p', count, normalized, args);
+    if (cached_result(*scope, key, out)) return out;
+  }
   std::unordered_set<std::string> seen;
-  return translate_impl(snapshot.get(), lookup, args, seen, 0);
+  out = translate_impl(*scope, plural_lookup(*scope, normalized, count), args, seen, 0, count_stats);
+  if (budget) store_result(*scope, std::move(key), out, budget);
+  return out;
 }
 
 std::string I18nEngine::dump_table() const {
-  auto snapshot = acquire_snapshot();
-  if (!snapshot) return "Catalog not loaded\n";
+  std::string err;
+  auto snapshot = materialize(acquire_snapshot(), err);
+  if (!snapshot) return err.empty() ? "Catalog not loaded\n" : err + "\n";
   const auto& catalog = snapshot->catalog;
   const auto& labels = snapshot->labels;
 
@@ -999,8 +2666,9 @@ std::string I18nEngine::find_any(const std::string& query) const {
   std::string out;
 
   // Determinismus: Sortiere Keys
-  auto snapshot = acquire_snapshot();
-  if (!snapshot) return "(no catalog loaded)\n";
+  std::string err;
+  auto snapshot = materialize(acquire_snapshot(), err);
+  if (!snapshot) return err.empty() ? "(no catalog loaded)\n" : err + "\n";
   const auto& catalog = snapshot->catalog;
   const auto& labels = snapshot->labels;
 
@@ -1038,9 +2706,11 @@ std::string I18nEngine::find_any(const std::string& query) const {
 std::string I18nEngine::check_catalog_report(int& out_code) const {
   out_code = 0;
 
-  auto snapshot = acquire_snapshot();
+  std::string err;
+  auto snapshot = materialize(acquire_snapshot(), err);
   if (!snapshot) {
     out_code = 2;
+    if (!err.empty()) return "CHECK: FAIL\nGrund: " + err + "\n";
     return "CHECK: FAIL\nGrund: Katalog ist leer oder nicht geladen.\n";
   }
 
@@ -1257,19 +2927,40 @@ uint32_t I18nEngine::fnv1a32(const uint8_t* data, size_t len) noexcept {
   return hash;
 }
 
-bool I18nEngine::export_binary_catalog(const char* path) const {
-  if (!path) return false;
-  auto snapshot = acquire_snapshot();
-  if (!snapshot || snapshot->catalog.empty()) return false;
-
-  const auto& catalog = snapshot->catalog;
+bool I18nEngine::export_binary_catalog(const char* path, uint32_t flags) const {
+  std::string err;
+  return export_binary_catalog(path, flags, err);
+}
 
-  struct ExportEntry {
-    std::string base;
-    std::string variant;
-    std::string text;
+bool I18nEngine::export_binary_catalog(const char* path, uint32_t flags, std::string& err) const {
+  err.clear();
+  if (!path) { err = "path == nullptr"; return false; }
+  auto snapshot = materialize(acquire_snapshot(), err);
+  if (!snapshot) {
+    if (err.empty()) err = "Export: Kein Katalog geladen.";
+    return false;
+  }
+  if (!write_binary_snapshot(*snapshot, path, flags)) {
+    err = "Export: Datei konnte nicht geschrieben werden.";
+    return false;
+  }
+  return true;
+}
+
+bool I18nEngine::write_binary_snapshot(const CatalogSnapshot& snapshot, const char* path, uint32_t flags) {
+  if (snapshot.catalog.empty()) return false;
+  const auto& catalog = snapshot.catalog;
+  const std::string& meta_locale = snapshot.meta_locale;
+  const std::string& meta_fallback = snapshot.meta_fallback;
+  const std::string& meta_note = snapshot.meta_note;
+  const PluralRule meta_plural = snapshot.meta_plural;
+
+  // Einträge verweisen auf die Texte des Snapshots, es wird nichts kopiert.
+  struct ExportEntry {
+    std::string base;
+    std::string variant;
+    const std::string* text;
     uint32_t text_offset;
-    uint32_t text_length;
   };
 
   std::vector<ExportEntry> entries;
@@ -1285,7 +2976,7 @@ bool I18nEngine::export_binary_catalog(const char* path) const {
 
     if (base.empty() || !is_hex_token(base)) return false;
 
-    entries.push_back({ base, variant, kv.second, 0, 0 });
+    entries.push_back({ base, variant, &kv.second, 0 });
   }
 
   std::sort(entries.begin(), entries.end(), [](const ExportEntry& a, const ExportEntry& b) {
@@ -1293,30 +2984,61 @@ bool I18nEngine::export_binary_catalog(const char* path) const {
     return a.variant < b.variant;
   });
 
-  uint32_t current_offset = 0;
-  for (auto& entry : entries) {
-    entry.text_offset = current_offset;
-    entry.text_length = (uint32_t)entry.text.size();
-    current_offset += entry.text_length;
-  }
-
-  std::vector<uint8_t> entry_table;
-  entry_table.reserve(entries.size() * 64);
-
-  for (const auto& entry : entries) {
-    entry_table.push_back((uint8_t)entry.base.size());
-    entry_table.insert(entry_table.end(), entry.base.begin(), entry.base.end());
-    entry_table.push_back((uint8_t)entry.variant.size());
-    entry_table.insert(entry_table.end(), entry.variant.begin(), entry.variant.end());
-    append_le_u32(entry_table, entry.text_offset);
-    append_le_u32(entry_table, entry.text_length);
-  }
-
-  std::vector<uint8_t> string_table;
-  string_table.reserve(current_offset);
-  for (const auto& entry : entries) {
-    string_table.insert(string_table.end(), entry.text.begin(), entry.text.end());
+  std::vector<const std::string*> texts;
+  texts.reserve(entries.size());
+  for (const auto& entry : entries) texts.push_back(entry.text);
+  StringTableLayout layout;
+  plan_string_table(texts, (flags & EXPORT_SHARE_SUFFIXES) != 0, layout);
+  if (layout.size > std::numeric_limits<uint32_t>::max()) return false;
+  for (size_t i = 0; i < entries.size(); ++i) entries[i].text_offset = layout.offsets[i];
+
+  uint64_t entry_table_size = 0;
+  for (const auto& entry : entries) entry_table_size += 2 + entry.base.size() + entry.variant.size() + 8;
+
+  uint8_t flags_byte = 0;
+  std::vector<uint8_t> block_index;
+  std::vector<uint8_t> block_data;
+  const bool section_checksums = (flags & EXPORT_SECTION_CHECKSUMS) != 0;
+  if (flags & EXPORT_COMPRESS) {
+    // Feste Blöcke + Block-Index; Einträge adressieren weiter den unkomprimierten Offset.
+    // Nur die komprimierten Blöcke liegen im Speicher, da der Index vor ihnen steht.
+    const uint32_t raw_size = (uint32_t)layout.size;
+    const uint32_t block_count = (raw_size + COMPRESSED_BLOCK_SIZE - 1) / COMPRESSED_BLOCK_SIZE;
+    append_le_u32(block_index, raw_size);
+    append_le_u32(block_index, COMPRESSED_BLOCK_SIZE);
+    append_le_u32(block_index, block_count);
+    // Mit Sektions-Checksummen folgt dem Index ein 64-Bit-Hash pro Block, geprüft beim ersten Entpacken.
+    const uint32_t data_base = (uint32_t)(COMPRESSED_SECTION_HEADER_SIZE + (size_t)block_count * (section_checksums ? 16 : 8));
+    std::vector<uint8_t> block_hashes;
+    std::vector<uint8_t> raw;
+    raw.reserve(COMPRESSED_BLOCK_SIZE);
+    std::vector<uint8_t> packed;
+    auto flush_block = [&]() {
+      lz_compress(raw.data(), raw.size(), packed);
+      append_le_u32(block_index, data_base + (uint32_t)block_data.size());
+      const bool keep_raw = packed.size() >= raw.size();
+      const std::vector<uint8_t>& stored = keep_raw ? raw : packed;
+      append_le_u32(block_index, keep_raw ? (uint32_t)raw.size() | COMPRESSED_BLOCK_STORED : (uint32_t)packed.size());
+      if (section_checksums) append_le_u64(block_hashes, section_hash64(stored.data(), stored.size()));
+      block_data.insert(block_data.end(), stored.begin(), stored.end());
+      raw.clear();
+    };
+    for (const std::string* text : layout.emitted) {
+      size_t pos = 0;
+      while (pos < text->size()) {
+        const size_t take = std::min(text->size() - pos, (size_t)COMPRESSED_BLOCK_SIZE - raw.size());
+        raw.insert(raw.end(), text->begin() + pos, text->begin() + pos + take);
+        pos += take;
+        if (raw.size() == COMPRESSED_BLOCK_SIZE) flush_block();
+      }
+    }
+    if (!raw.empty()) flush_block();
+    block_index.insert(block_index.end(), block_hashes.begin(), block_hashes.end());
+    flags_byte |= BINARY_FLAG_COMPRESSED;
+    if (section_checksums) flags_byte |= BINARY_FLAG_BLOCK_CHECKSUMS;
   }
+  const uint64_t string_table_size = (flags & EXPORT_COMPRESS) ? block_index.size() + block_data.size() : layout.size;
+  if (string_table_size > std::numeric_limits<uint32_t>::max()) return false;
 
   const size_t cap_locale = std::min(meta_locale.size(), (size_t)std::numeric_limits<uint16_t>::max());
   const size_t cap_fallback = std::min(meta_fallback.size(), (size_t)std::numeric_limits<uint16_t>::max());
@@ -1335,10 +3057,63 @@ bool I18nEngine::export_binary_catalog(const char* path) const {
   if (note_len > 0) metadata_block.insert(metadata_block.end(), meta_note.begin(), meta_note.begin() + note_len);
   const uint32_t metadata_size = (uint32_t)metadata_block.size();
 
+  if (section_checksums) flags_byte |= BINARY_FLAG_SECTION_CHECKSUMS;
+
+  // Header und Sektions-Record werden als Platzhalter geschrieben und am Ende gepatcht,
+  // alle Sektionen laufen einmal durch die Checksummen und direkt in die Datei.
+  AtomicFileWriter out;
+  std::string err;
+  if (!out.open(std::filesystem::path(path), err)) return false;
+
   uint32_t checksum = 2166136261u;
-  if (metadata_size > 0) checksum = fnv1a32_append(checksum, metadata_block.data(), metadata_block.size());
-  checksum = fnv1a32_append(checksum, entry_table.data(), entry_table.size());
-  checksum = fnv1a32_append(checksum, string_table.data(), string_table.size());
+  SectionHasher meta_hash(metadata_size);
+  SectionHasher entry_hash(entry_table_size);
+  // Bei Block-Checksummen sichert der Sektions-Hash nur Kopf, Index und Block-Hashes.
+  const bool hash_blocks = (flags_byte & BINARY_FLAG_BLOCK_CHECKSUMS) != 0;
+  SectionHasher string_hash(hash_blocks ? block_index.size() : string_table_size);
+  auto emit = [&](SectionHasher& section, const uint8_t* data, size_t len) {
+    if (section_checksums) section.update(data, len);
+    else checksum = fnv1a32_append(checksum, data, len);
+    out.write(data, len);
+  };
+
+  const uint8_t placeholder[BINARY_HEADER_SIZE + SECTION_CHECKSUM_RECORD_SIZE] = {};
+  out.write(placeholder, BINARY_HEADER_SIZE);
+  emit(meta_hash, metadata_block.data(), metadata_block.size());
+  if (section_checksums) out.write(placeholder, SECTION_CHECKSUM_RECORD_SIZE);
+
+  std::vector<uint8_t> row;
+  for (const auto& entry : entries) {
+    row.clear();
+    row.push_back((uint8_t)entry.base.size());
+    row.insert(row.end(), entry.base.begin(), entry.base.end());
+    row.push_back((uint8_t)entry.variant.size());
+    row.insert(row.end(), entry.variant.begin(), entry.variant.end());
+    append_le_u32(row, entry.text_offset);
+    append_le_u32(row, (uint32_t)entry.text->size());
+    emit(entry_hash, row.data(), row.size());
+  }
+
+  if (flags & EXPORT_COMPRESS) {
+    emit(string_hash, block_index.data(), block_index.size());
+    if (hash_blocks) out.write(block_data.data(), block_data.size());
+    else emit(string_hash, block_data.data(), block_data.size());
+  } else {
+    for (const std::string* text : layout.emitted) {
+      emit(string_hash, reinterpret_cast<const uint8_t*>(text->data()), text->size());
+    }
+  }
+
+  if (section_checksums) {
+    // Header-Checksum sichert nur den Sektions-Record, die Sektionen tragen eigene 64-Bit-Hashes.
+    std::vector<uint8_t> section_record;
+    append_le_u32(section_record, SECTION_CHECKSUM_COUNT);
+    append_le_u64(section_record, meta_hash.finish());
+    append_le_u64(section_record, entry_hash.finish());
+    append_le_u64(section_record, string_hash.finish());
+    checksum = fnv1a32(section_record.data(), section_record.size());
+    out.write_at((uint64_t)BINARY_HEADER_SIZE + metadata_size, section_record.data(), section_record.size());
+  }
 
   uint8_t plural_rule = static_cast<uint8_t>(meta_plural);
   if (plural_rule > static_cast<uint8_t>(PluralRule::ARABIC)) plural_rule = static_cast<uint8_t>(PluralRule::DEFAULT);
@@ -1346,29 +3121,919 @@ bool I18nEngine::export_binary_catalog(const char* path) const {
   std::vector<uint8_t> header;
   header.reserve(BINARY_HEADER_SIZE);
   header.insert(header.end(), BINARY_MAGIC, BINARY_MAGIC + 4);
-  header.push_back(BINARY_VERSION);
-  header.push_back(0);
+  // Releases ohne Flags bleiben Version 2, damit ältere Loader sie weiterhin lesen.
+  header.push_back(flags_byte ? BINARY_VERSION_V3 : BINARY_VERSION);
+  header.push_back(flags_byte);
   header.push_back(plural_rule);
   header.push_back(0);
   append_le_u32(header, (uint32_t)entries.size());
-  append_le_u32(header, (uint32_t)string_table.size());
+  append_le_u32(header, (uint32_t)string_table_size);
   append_le_u32(header, checksum);
   append_le_u32(header, metadata_size);
+  out.write_at(0, header.data(), header.size());
+
+  return out.commit(err);
+}
+
+std::shared_ptr<const I18nEngine::BundleView> I18nEngine::open_bundle(const std::string& path, bool strict, std::string& err) const {
+  err.clear();
+  auto bundle = std::make_shared<BundleView>();
+  bundle->path = path;
+  if (!bundle->mapping.map(std::filesystem::path(path), err)) return {};
+
+  const uint8_t* data = bundle->data();
+  const size_t size = bundle->mapping.size;
+  if (size < BUNDLE_HEADER_SIZE) {
+    err = "Bundle: Header zu kurz.";
+    return {};
+  }
+  if (std::memcmp(data, BUNDLE_MAGIC, 4) != 0) {
+    err = "Unbekanntes Bundle-Format.";
+    return {};
+  }
+  if (data[4] != BUNDLE_VERSION) {
+    err = "Bundle-Version nicht unterstützt.";
+    return {};
+  }
+
+  const uint32_t locale_count = read_le_u32(data + 8);
+  const uint32_t token_count = read_le_u32(data + 12);
+  const uint32_t pool_size = read_le_u32(data + 16);
+  const uint32_t checksum = read_le_u32(data + 20);
+  if (locale_count == 0 || token_count == 0) {
+    err = "Bundle: Keine Locale oder kein Token enthalten.";
+    return {};
+  }
+
+  size_t offset = BUNDLE_HEADER_SIZE;
+  bundle->locales.reserve(locale_count);
+  for (uint32_t i = 0; i < locale_count; ++i) {
+    if (offset + BUNDLE_LOCALE_HEADER_SIZE > size) {
+      err = "Bundle: Locale-Tabelle zu kurz.";
+      return {};
+    }
+    const uint16_t name_len = read_le_u16(data + offset);
+    const uint16_t fallback_len = read_le_u16(data + offset + 2);
+    const uint16_t note_len = read_le_u16(data + offset + 4);
+    BundleView::LocaleInfo info;
+    info.plural = data[offset + 6];
+    offset += BUNDLE_LOCALE_HEADER_SIZE;
+    if (offset + (size_t)name_len + fallback_len + note_len > size) {
+      err = "Bundle: Locale-Eintrag überschreitet Daten.";
+      return {};
+    }
+    info.name.assign(reinterpret_cast<const char*>(data + offset), name_len);
+    offset += name_len;
+    info.fallback.assign(reinterpret_cast<const char*>(data + offset), fallback_len);
+    offset += fallback_len;
+    info.note.assign(reinterpret_cast<const char*>(data + offset), note_len);
+    offset += note_len;
+    if (info.name.empty() || bundle->find_locale(info.name) != bundle->locales.size()) {
+      err = "Bundle: Locale-Name leer oder doppelt.";
+      return {};
+    }
+    bundle->locales.push_back(std::move(info));
+  }
+
+  bundle->tokens.reserve(token_count);
+  bundle->variants.reserve(token_count);
+  for (uint32_t i = 0; i < token_count; ++i) {
+    if (offset >= size) {
+      err = "Bundle: Token-Index zu kurz.";
+      return {};
+    }
+    const uint8_t token_len = data[offset++];
+    if (token_len < 6 || token_len > 32 || offset + token_len >= size) {
+      err = "Bundle: Ungültige Token-Länge.";
+      return {};
+    }
+    std::string base(reinterpret_cast<const char*>(data + offset), token_len);
+    offset += token_len;
+    const uint8_t variant_len = data[offset++];
+    if (offset + variant_len > size) {
+      err = "Bundle: Variant-Länge überschreitet Daten.";
+      return {};
+    }
+    std::string variant(reinterpret_cast<const char*>(data + offset), variant_len);
+    offset += variant_len;
+    base = to_lower_ascii(base);
+    variant = to_lower_ascii(variant);
+    if (!is_hex_token(base) || (!variant.empty() && !is_variant_valid(variant))) {
+      err = "Bundle: Token oder Variant ungültig.";
+      return {};
+    }
+    std::string key = base;
+    if (!variant.empty()) {
+      key += '{';
+      key += variant;
+      key += '}';
+    }
+    if (!bundle->index.emplace(std::move(key), i).second) {
+      err = "Bundle: Doppelte Einträge.";
+      return {};
+    }
+    bundle->tokens.push_back(std::move(base));
+    bundle->variants.push_back(std::move(variant));
+  }
+
+  const uint64_t columns_size = (uint64_t)locale_count * token_count * BUNDLE_SLOT_SIZE;
+  if (offset + columns_size + pool_size != size) {
+    err = "Bundle: Offset-Spalten oder String-Pool inkonsistent.";
+    return {};
+  }
+  bundle->columns_offset = offset;
+  bundle->pool_offset = offset + (size_t)columns_size;
+  bundle->pool_size = pool_size;
+
+  if (strict && fnv1a32(data + BUNDLE_HEADER_SIZE, size - BUNDLE_HEADER_SIZE) != checksum) {
+    err = "Bundle: Checksum stimmt nicht.";
+    return {};
+  }
+
+  // Offsets werden hier einmal geprüft, damit Locale-Wechsel und Lookups sie direkt verwenden können.
+  bundle->locale_variants.resize(locale_count);
+  bundle->entry_counts.assign(locale_count, 0);
+  for (uint32_t l = 0; l < locale_count; ++l) {
+    const uint8_t* column = bundle->column(l);
+    for (uint32_t i = 0; i < token_count; ++i) {
+      const uint32_t text_offset = read_le_u32(column + (size_t)i * BUNDLE_SLOT_SIZE);
+      const uint32_t text_length = read_le_u32(column + (size_t)i * BUNDLE_SLOT_SIZE + 4);
+      if (text_offset == BUNDLE_MISSING) continue;
+      if ((uint64_t)text_offset + text_length > pool_size) {
+        err = "Bundle: Text-Offset außerhalb des String-Pools.";
+        return {};
+      }
+      ++bundle->entry_counts[l];
+      if (!bundle->variants[i].empty()) bundle->locale_variants[l][bundle->tokens[i]].insert(bundle->variants[i]);
+    }
+  }
+  return bundle;
+}
+
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::build_snapshot_from_bundle(
+    const std::shared_ptr<const BundleView>& bundle, size_t locale_index, std::string& err) const {
+  err.clear();
+  if (!bundle->entry_counts[locale_index]) {
+    err = "Bundle: Locale enthält keine Einträge.";
+    return {};
+  }
+  const auto& info = bundle->locales[locale_index];
+  auto snapshot = std::make_shared<CatalogSnapshot>();
+  snapshot->meta_locale = info.name;
+  snapshot->meta_fallback = info.fallback;
+  snapshot->meta_note = info.note;
+  snapshot->meta_plural = PluralRule::DEFAULT;
+  if (info.plural <= static_cast<uint8_t>(PluralRule::ARABIC)) {
+    snapshot->meta_plural = static_cast<PluralRule>(info.plural);
+  }
+  snapshot->bundle_texts = std::make_shared<BundleTexts>(bundle, locale_index);
+  return snapshot;
+}
+
+bool I18nEngine::install_bundle_locale(std::shared_ptr<const BundleView> bundle, const std::string& locale,
+                                       std::string& err, const std::vector<std::string>& patches) {
+  const size_t index = locale.empty() ? 0 : bundle->find_locale(locale);
+  if (index >= bundle->locales.size()) {
+    err = "Bundle: Locale nicht enthalten: " + locale;
+    return false;
+  }
+
+  auto primary = build_snapshot_from_bundle(bundle, index, err);
+  if (!primary || !apply_patches(primary, patches, err)) return false;
 
-  std::vector<uint8_t> buffer;
-  buffer.reserve(header.size() + metadata_block.size() + entry_table.size() + string_table.size());
-  buffer.insert(buffer.end(), header.begin(), header.end());
-  if (metadata_size > 0) buffer.insert(buffer.end(), metadata_block.begin(), metadata_block.end());
-  buffer.insert(buffer.end(), entry_table.begin(), entry_table.end());
-  buffer.insert(buffer.end(), string_table.begin(), string_table.end());
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
 
-  std::filesystem::path out_path(path);
-  if (out_path.has_parent_path()) {
-    std::filesystem::create_directories(out_path.parent_path());
+  // Fallback-Ebenen aus demselben Bundle bereitstellen, damit die Kette ohne weitere Dateien auflöst.
+  std::vector<std::string> chain = fallback_chain;
+  if (!fallback_chain_configured) {
+    std::string next = primary->meta_fallback;
+    while (!next.empty() && std::find(chain.begin(), chain.end(), next) == chain.end()) {
+      chain.push_back(next);
+      const size_t at = bundle->find_locale(next);
+      next = at < bundle->locales.size() ? bundle->locales[at].fallback : std::string();
+    }
+  }
+  for (const auto& name : chain) {
+    const size_t at = bundle->find_locale(name);
+    if (at >= bundle->locales.size() || at == index) continue;
+    auto layer = build_snapshot_from_bundle(bundle, at, err);
+    if (!layer) return false;
+    locale_snapshots[name] = std::move(layer);
   }
 
-  std::ofstream out(out_path, std::ios::binary);
-  if (!out) return false;
-  out.write(reinterpret_cast<const char*>(buffer.data()), (std::streamsize)buffer.size());
-  return out.good();
+  current_path = bundle->path;
+  current_bundle_locale = bundle->locales[index].name;
+  active_bundle = std::move(bundle);
+  applied_patches = patches;
+  install_snapshot(primary);
+  return true;
+}
+
+bool I18nEngine::load_bundle_file(const char* path, const char* locale, bool strict) {
+  return load_bundle_source(path, locale, strict, {});
+}
+
+bool I18nEngine::load_bundle_source(const char* path, const char* locale, bool strict,
+                                    const std::vector<std::string>& patches) {
+  clear_last_error();
+  if (!path) { set_last_error("path == nullptr"); return false; }
+
+  const SourceStamp stamp = stamp_source(path);
+  std::string err;
+  auto bundle = open_bundle(path, strict, err);
+  if (!bundle) {
+    set_last_error(err);
+    return false;
+  }
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  if (!install_bundle_locale(std::move(bundle), locale ? locale : "", err, patches)) {
+    set_last_error(err);
+    return false;
+  }
+  current_stamp = stamp;
+  current_strict = strict;
+  return true;
+}
+
+bool I18nEngine::select_bundle_locale(const char* locale) {
+  clear_last_error();
+  if (!active_bundle) { set_last_error("Kein Bundle geladen"); return false; }
+  if (!locale || !*locale) { set_last_error("locale == nullptr"); return false; }
+  std::string err;
+  if (!install_bundle_locale(active_bundle, locale, err)) {
+    set_last_error(err);
+    return false;
+  }
+  return true;
+}
+
+std::string I18nEngine::get_bundle_locales() const {
+  std::string out;
+  if (!active_bundle) return out;
+  for (const auto& info : active_bundle->locales) {
+    if (!out.empty()) out += ',';
+    out += info.name;
+  }
+  return out;
+}
+
+bool I18nEngine::export_bundle(const char* path, std::string& err) const {
+  err.clear();
+  if (!path) { err = "path == nullptr"; return false; }
+
+  // Aktive Locale plus alle per load_locale_file geladenen Locales, sortiert nach Name.
+  std::vector<std::shared_ptr<const CatalogSnapshot>> snapshots;
+  auto primary = materialize(acquire_snapshot(), err);
+  if (!primary && !err.empty()) return false;
+  if (primary) snapshots.push_back(primary);
+  for (const auto& kv : locale_snapshots) {
+    if (primary && kv.first == primary->meta_locale) continue;
+    auto layer = materialize(kv.second, err);
+    if (!layer) return false;
+    snapshots.push_back(std::move(layer));
+  }
+  if (snapshots.empty()) { err = "Bundle: Kein Katalog geladen."; return false; }
+  for (const auto& snap : snapshots) {
+    if (snap->meta_locale.empty()) { err = "Bundle: Katalog ohne @meta locale."; return false; }
+  }
+  std::sort(snapshots.begin(), snapshots.end(), [](const auto& a, const auto& b) {
+    return a->meta_locale < b->meta_locale;
+  });
+
+  struct TokenKey {
+    std::string base;
+    std::string variant;
+    std::string key;
+  };
+  std::vector<TokenKey> tokens;
+  std::unordered_set<std::string> known;
+  for (const auto& snap : snapshots) {
+    for (const auto& kv : snap->catalog) {
+      if (!known.insert(kv.first).second) continue;
+      TokenKey entry;
+      if (!parse_variant_suffix(kv.first, entry.base, entry.variant)) {
+        entry.base = kv.first;
+        entry.variant.clear();
+      }
+      if (entry.base.empty() || !is_hex_token(entry.base)) {
+        err = "Bundle: Token ist kein Hex-String: " + kv.first;
+        return false;
+      }
+      entry.key = kv.first;
+      tokens.push_back(std::move(entry));
+    }
+  }
+  std::sort(tokens.begin(), tokens.end(), [](const TokenKey& a, const TokenKey& b) {
+    if (a.base != b.base) return a.base < b.base;
+    return a.variant < b.variant;
+  });
+
+  std::vector<uint8_t> body;
+  for (const auto& snap : snapshots) {
+    const std::string* fields[3] = { &snap->meta_locale, &snap->meta_fallback, &snap->meta_note };
+    uint16_t lens[3];
+    for (int i = 0; i < 3; ++i) {
+      lens[i] = (uint16_t)std::min(fields[i]->size(), (size_t)std::numeric_limits<uint16_t>::max());
+      append_le_u16(body, lens[i]);
+    }
+    uint8_t plural_rule = static_cast<uint8_t>(snap->meta_plural);
+    if (plural_rule > static_cast<uint8_t>(PluralRule::ARABIC)) plural_rule = static_cast<uint8_t>(PluralRule::DEFAULT);
+    body.push_back(plural_rule);
+    body.push_back(0);
+    for (int i = 0; i < 3; ++i) body.insert(body.end(), fields[i]->begin(), fields[i]->begin() + lens[i]);
+  }
+
+  for (const auto& token : tokens) {
+    body.push_back((uint8_t)token.base.size());
+    body.insert(body.end(), token.base.begin(), token.base.end());
+    body.push_back((uint8_t)token.variant.size());
+    body.insert(body.end(), token.variant.begin(), token.variant.end());
+  }
+
+  // Gleiche Texte (Markennamen, Zahlen, unübersetzte Strings) landen nur einmal im Pool.
+  std::vector<const std::string*> texts;
+  for (const auto& snap : snapshots) {
+    for (const auto& token : tokens) {
+      const auto it = snap->catalog.find(token.key);
+      texts.push_back(it == snap->catalog.end() ? nullptr : &it->second);
+    }
+  }
+  std::vector<const std::string*> present;
+  for (const auto* text : texts) {
+    if (text) present.push_back(text);
+  }
+  StringTableLayout pool;
+  plan_string_table(present, true, pool);
+  if (pool.size >= BUNDLE_MISSING) { err = "Bundle: String-Pool zu groß."; return false; }
+  size_t next_present = 0;
+  for (const auto* text : texts) {
+    if (!text) {
+      append_le_u32(body, BUNDLE_MISSING);
+      append_le_u32(body, 0);
+      continue;
+    }
+    append_le_u32(body, pool.offsets[next_present++]);
+    append_le_u32(body, (uint32_t)text->size());
+  }
+  uint32_t checksum = fnv1a32(body.data(), body.size());
+  for (const std::string* text : pool.emitted) {
+    checksum = fnv1a32_append(checksum, reinterpret_cast<const uint8_t*>(text->data()), text->size());
+  }
+
+  std::vector<uint8_t> header;
+  header.reserve(BUNDLE_HEADER_SIZE);
+  header.insert(header.end(), BUNDLE_MAGIC, BUNDLE_MAGIC + 4);
+  header.push_back(BUNDLE_VERSION);
+  header.push_back(0);
+  header.push_back(0);
+  header.push_back(0);
+  append_le_u32(header, (uint32_t)snapshots.size());
+  append_le_u32(header, (uint32_t)tokens.size());
+  append_le_u32(header, (uint32_t)pool.size);
+  append_le_u32(header, checksum);
+
+  AtomicFileWriter out;
+  if (!out.open(std::filesystem::path(path), err)) return false;
+  out.write(header.data(), header.size());
+  out.write(body.data(), body.size());
+  for (const std::string* text : pool.emitted) out.write(text->data(), text->size());
+  if (!out.commit(err)) {
+    err = "Bundle: " + err;
+    return false;
+  }
+  return true;
+}
+
+uint64_t I18nEngine::content_hash(const CatalogSnapshot& snapshot) {
+  // Logischer Inhalt (Meta + sortierte Einträge), unabhängig von Export-Flags wie Kompression oder Suffix-Sharing.
+  std::vector<const std::pair<const std::string, std::string>*> rows;
+  rows.reserve(snapshot.catalog.size());
+  for (const auto& kv : snapshot.catalog) rows.push_back(&kv);
+  std::sort(rows.begin(), rows.end(), [](const auto* a, const auto* b) { return a->first < b->first; });
+
+  const std::string* meta[3] = { &snapshot.meta_locale, &snapshot.meta_fallback, &snapshot.meta_note };
+  uint64_t total = 1;
+  for (const auto* field : meta) total += 4 + field->size();
+  for (const auto* row : rows) total += 8 + row->first.size() + row->second.size();
+
+  SectionHasher hasher(total);
+  uint8_t len_buf[4];
+  auto put = [&](const std::string& value) {
+    const uint32_t len = (uint32_t)value.size();
+    for (int k = 0; k < 4; ++k) len_buf[k] = (uint8_t)(len >> (8 * k));
+    hasher.update(len_buf, 4);
+    hasher.update(reinterpret_cast<const uint8_t*>(value.data()), value.size());
+  };
+  for (const auto* field : meta) put(*field);
+  const uint8_t plural = static_cast<uint8_t>(snapshot.meta_plural);
+  hasher.update(&plural, 1);
+  for (const auto* row : rows) {
+    put(row->first);
+    put(row->second);
+  }
+  return hasher.finish();
+}
+
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::apply_patch_to(const CatalogSnapshot& base,
+                                                                       const uint8_t* data,
+                                                                       size_t size,
+                                                                       std::string& err) {
+  err.clear();
+  if (size < PATCH_HEADER_SIZE || std::memcmp(data, PATCH_MAGIC, 4) != 0) {
+    err = "Patch: Unbekanntes Format.";
+    return {};
+  }
+  if (data[4] != PATCH_VERSION) {
+    err = "Patch: Version nicht unterstützt.";
+    return {};
+  }
+  const uint32_t op_count = read_le_u32(data + 8);
+  const uint32_t ops_size = read_le_u32(data + 12);
+  const uint32_t ops_checksum = read_le_u32(data + 16);
+  const uint64_t base_hash = read_le_u64(data + 20);
+  const uint64_t target_hash = read_le_u64(data + 28);
+  if (PATCH_HEADER_SIZE + (uint64_t)ops_size != size) {
+    err = "Patch: Länge inkonsistent.";
+    return {};
+  }
+  const uint8_t* ops = data + PATCH_HEADER_SIZE;
+  if (fnv1a32(ops, ops_size) != ops_checksum) {
+    err = "Patch: Checksum stimmt nicht.";
+    return {};
+  }
+  if (content_hash(base) != base_hash) {
+    err = "Patch: Basis-Katalog passt nicht zum Patch.";
+    return {};
+  }
+
+  auto next = std::make_shared<CatalogSnapshot>();
+  next->catalog = base.catalog;
+  next->labels = base.labels;
+  next->plural_variants = base.plural_variants;
+  next->meta_locale = base.meta_locale;
+  next->meta_fallback = base.meta_fallback;
+  next->meta_note = base.meta_note;
+  next->meta_plural = base.meta_plural;
+
+  size_t offset = 0;
+  auto read_key = [&](std::string& key) -> bool {
+    if (offset >= ops_size) return false;
+    const uint8_t len = ops[offset++];
+    if (offset + len > ops_size) return false;
+    key.assign(reinterpret_cast<const char*>(ops + offset), len);
+    offset += len;
+    return true;
+  };
+  auto read_text = [&](std::string& text, size_t len_bytes) -> bool {
+    if (offset + len_bytes > ops_size) return false;
+    const uint32_t len = (len_bytes == 2) ? read_le_u16(ops + offset) : read_le_u32(ops + offset);
+    offset += len_bytes;
+    if (offset + len > ops_size) return false;
+    text.assign(reinterpret_cast<const char*>(ops + offset), len);
+    offset += len;
+    return true;
+  };
+
+  for (uint32_t i = 0; i < op_count; ++i) {
+    if (offset >= ops_size) { err = "Patch: Operationen abgeschnitten."; return {}; }
+    const uint8_t op = ops[offset++];
+    if (op == PATCH_OP_META) {
+      if (!read_text(next->meta_locale, 2) || !read_text(next->meta_fallback, 2) ||
+          !read_text(next->meta_note, 2) || offset >= ops_size) {
+        err = "Patch: Meta-Operation ungültig.";
+        return {};
+      }
+      const uint8_t plural = ops[offset++];
+      next->meta_plural = plural <= static_cast<uint8_t>(PluralRule::ARABIC) ? static_cast<PluralRule>(plural)
+                                                                             : PluralRule::DEFAULT;
+      continue;
+    }
+
+    std::string key;
+    if (!read_key(key)) { err = "Patch: Token ungültig."; return {}; }
+    std::string base_token;
+    std::string variant;
+    const bool has_variant = parse_variant_suffix(key, base_token, variant) && !variant.empty();
+    if (op == PATCH_OP_UPSERT) {
+      std::string text;
+      if (!read_text(text, 4)) { err = "Patch: Text ungültig."; return {}; }
+      next->catalog[key] = std::move(text);
+      if (has_variant) next->plural_variants[base_token].insert(variant);
+    } else if (op == PATCH_OP_DELETE) {
+      next->catalog.erase(key);
+      next->labels.erase(key);
+      if (has_variant) {
+        auto it = next->plural_variants.find(base_token);
+        if (it != next->plural_variants.end()) {
+          it->second.erase(variant);
+          if (it->second.empty()) next->plural_variants.erase(it);
+        }
+      }
+    } else {
+      err = "Patch: Unbekannte Operation.";
+      return {};
+    }
+  }
+  if (offset != ops_size) {
+    err = "Patch: Überzählige Daten.";
+    return {};
+  }
+  if (content_hash(*next) != target_hash) {
+    err = "Patch: Ergebnis-Checksum stimmt nicht.";
+    return {};
+  }
+  return next;
+}
+
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::load_patch_base(const char* path, std::string& err) {
+  // Patches vergleichen immer verifizierte Kataloge: Strict-Mode prüft die Checksum der Binärdatei.
+  auto snapshot = load_snapshot_from_file(path, true, false, err);
+  if (!snapshot || (!snapshot->lazy && !snapshot->shards)) return snapshot;
+  auto full = materialize(snapshot, err);
+  return std::const_pointer_cast<CatalogSnapshot>(full);
+}
+
+bool I18nEngine::make_patch(const char* old_path, const char* new_path, const char* patch_path, std::string& err) {
+  err.clear();
+  if (!old_path || !new_path || !patch_path) { err = "path == nullptr"; return false; }
+  auto old_snap = load_patch_base(old_path, err);
+  if (!old_snap) return false;
+  auto new_snap = load_patch_base(new_path, err);
+  if (!new_snap) return false;
+
+  std::vector<const std::string*> old_keys;
+  std::vector<const std::string*> new_keys;
+  for (const auto& kv : old_snap->catalog) old_keys.push_back(&kv.first);
+  for (const auto& kv : new_snap->catalog) new_keys.push_back(&kv.first);
+  auto by_value = [](const std::string* a, const std::string* b) { return *a < *b; };
+  std::sort(old_keys.begin(), old_keys.end(), by_value);
+  std::sort(new_keys.begin(), new_keys.end(), by_value);
+
+  std::vector<uint8_t> ops;
+  uint32_t op_count = 0;
+  auto put_short = [&](const std::string& value) {
+    const uint16_t len = (uint16_t)std::min(value.size(), (size_t)std::numeric_limits<uint16_t>::max());
+    append_le_u16(ops, len);
+    ops.insert(ops.end(), value.begin(), value.begin() + len);
+  };
+  if (old_snap->meta_locale != new_snap->meta_locale || old_snap->meta_fallback != new_snap->meta_fallback ||
+      old_snap->meta_note != new_snap->meta_note || old_snap->meta_plural != new_snap->meta_plural) {
+    ops.push_back(PATCH_OP_META);
+    put_short(new_snap->meta_locale);
+    put_short(new_snap->meta_fallback);
+    put_short(new_snap->meta_note);
+    ops.push_back(static_cast<uint8_t>(new_snap->meta_plural));
+    ++op_count;
+  }
+
+  auto put_key = [&](uint8_t op, const std::string& key) {
+    ops.push_back(op);
+    ops.push_back((uint8_t)key.size());
+    ops.insert(ops.end(), key.begin(), key.end());
+    ++op_count;
+  };
+  auto put_upsert = [&](const std::string& key) {
+    const std::string& text = new_snap->catalog.at(key);
+    put_key(PATCH_OP_UPSERT, key);
+    append_le_u32(ops, (uint32_t)text.size());
+    ops.insert(ops.end(), text.begin(), text.end());
+  };
+
+  // Merge über beide sortierten Schlüssellisten.
+  size_t i = 0;
+  size_t j = 0;
+  while (i < old_keys.size() || j < new_keys.size()) {
+    if (j >= new_keys.size() || (i < old_keys.size() && *old_keys[i] < *new_keys[j])) {
+      put_key(PATCH_OP_DELETE, *old_keys[i++]);
+    } else if (i >= old_keys.size() || *new_keys[j] < *old_keys[i]) {
+      put_upsert(*new_keys[j++]);
+    } else {
+      if (old_snap->catalog.at(*old_keys[i]) != new_snap->catalog.at(*new_keys[j])) put_upsert(*new_keys[j]);
+      ++i;
+      ++j;
+    }
+  }
+
+  std::vector<uint8_t> header;
+  header.insert(header.end(), PATCH_MAGIC, PATCH_MAGIC + 4);
+  header.push_back(PATCH_VERSION);
+  header.push_back(0);
+  header.push_back(0);
+  header.push_back(0);
+  append_le_u32(header, op_count);
+  append_le_u32(header, (uint32_t)ops.size());
+  append_le_u32(header, fnv1a32(ops.data(), ops.size()));
+  append_le_u64(header, content_hash(*old_snap));
+  append_le_u64(header, content_hash(*new_snap));
+
+  AtomicFileWriter out;
+  if (!out.open(std::filesystem::path(patch_path), err)) return false;
+  out.write(header.data(), header.size());
+  out.write(ops.data(), ops.size());
+  return out.commit(err);
+}
+
+bool I18nEngine::apply_patch_file(const char* base_path, const char* patch_path, const char* out_path,
+                                  uint32_t export_flags, std::string& err) {
+  err.clear();
+  if (!base_path || !patch_path || !out_path) { err = "path == nullptr"; return false; }
+  auto base = load_patch_base(base_path, err);
+  if (!base) return false;
+  FileMapping mapping;
+  if (!mapping.map(std::filesystem::path(patch_path), err)) return false;
+  auto next = apply_patch_to(*base, reinterpret_cast<const uint8_t*>(mapping.data), mapping.size, err);
+  if (!next) return false;
+  if (!write_binary_snapshot(*next, out_path, export_flags)) {
+    err = "Patch: Ergebnis konnte nicht geschrieben werden.";
+    return false;
+  }
+  return true;
+}
+
+bool I18nEngine::apply_patch(const char* patch_path) {
+  clear_last_error();
+  if (!patch_path) { set_last_error("path == nullptr"); return false; }
+  std::string err;
+  auto active = materialize(acquire_snapshot(), err);
+  if (!active) { set_last_error(err.empty() ? "Kein Katalog geladen" : err); return false; }
+
+  FileMapping mapping;
+  if (!mapping.map(std::filesystem::path(patch_path), err)) {
+    set_last_error(err);
+    return false;
+  }
+  auto next = apply_patch_to(*active, reinterpret_cast<const uint8_t*>(mapping.data), mapping.size, err);
+  if (!next) {
+    set_last_error(err);
+    return false;
+  }
+  std::error_code ec;
+  const std::filesystem::path absolute = std::filesystem::absolute(std::filesystem::path(patch_path), ec);
+  std::lock_guard<std::recursive_mutex> lock(publish_mutex);
+  applied_patches.push_back(ec ? std::string(patch_path) : absolute.string());
+  install_snapshot(next);
+  return true;
+}
+
+bool I18nEngine::apply_patches(std::shared_ptr<CatalogSnapshot>& snapshot, const std::vector<std::string>& patches,
+                               std::string& err) {
+  for (const auto& path : patches) {
+    FileMapping mapping;
+    if (!mapping.map(std::filesystem::path(path), err)) {
+      err = "Patch " + path + ": " + err;
+      return false;
+    }
+    const uint8_t* data = reinterpret_cast<const uint8_t*>(mapping.data);
+    auto base = materialize(snapshot, err);
+    if (!base) return false;
+    // Enthält die neue Basis den Patch bereits (Zielstand erreicht), wird er übersprungen.
+    if (mapping.size >= PATCH_HEADER_SIZE && std::memcmp(data, PATCH_MAGIC, 4) == 0 &&
+        read_le_u64(data + 28) == content_hash(*base)) {
+      continue;
+    }
+    auto next = apply_patch_to(*base, data, mapping.size, err);
+    if (!next) {
+      err = "Patch " + path + " nicht erneut anwendbar: " + err;
+      return false;
+    }
+    snapshot = std::move(next);
+  }
+  return true;
+}
+
+std::shared_ptr<I18nEngine::CatalogSnapshot> I18nEngine::load_sharded_manifest(const std::string& path, bool strict,
+                                                                              bool trusted, std::string& err) {
+  err.clear();
+  FileMapping mapping;
+  if (!mapping.map(std::filesystem::path(path), err)) return {};
+  const uint8_t* data = reinterpret_cast<const uint8_t*>(mapping.data);
+  const size_t size = mapping.size;
+  if (size < SHARD_HEADER_SIZE + METADATA_HEADER_SIZE || std::memcmp(data, SHARD_MAGIC, 4) != 0) {
+    err = "Shard-Manifest: Unbekanntes Format.";
+    return {};
+  }
+  if (data[4] != SHARD_VERSION) {
+    err = "Shard-Manifest: Version nicht unterstützt.";
+    return {};
+  }
+  auto set = std::make_shared<ShardSet>();
+  set->prefix_len = data[5];
+  set->strict = strict;
+  set->trusted = trusted;
+  if (set->prefix_len == 0 || set->prefix_len > SHARD_PREFIX_MAX) {
+    err = "Shard-Manifest: Ungültige Präfix-Länge.";
+    return {};
+  }
+  const uint8_t plural_rule = data[6];
+  const uint32_t shard_count = read_le_u32(data + 8);
+  const uint32_t checksum = read_le_u32(data + 12);
+  if (strict && !trusted && fnv1a32(data + SHARD_HEADER_SIZE, size - SHARD_HEADER_SIZE) != checksum) {
+    err = "Shard-Manifest: Checksum stimmt nicht.";
+    return {};
+  }
+
+  auto snapshot = std::make_shared<CatalogSnapshot>();
+  snapshot->meta_plural = plural_rule <= static_cast<uint8_t>(PluralRule::ARABIC) ? static_cast<PluralRule>(plural_rule)
+                                                                                  : PluralRule::DEFAULT;
+  size_t offset = SHARD_HEADER_SIZE;
+  const uint16_t locale_len = read_le_u16(data + offset);
+  const uint16_t fallback_len = read_le_u16(data + offset + 2);
+  const uint16_t note_len = read_le_u16(data + offset + 4);
+  offset += METADATA_HEADER_SIZE;
+  if (offset + (size_t)locale_len + fallback_len + note_len > size) {
+    err = "Shard-Manifest: Metadata block überläuft.";
+    return {};
+  }
+  snapshot->meta_locale.assign(reinterpret_cast<const char*>(data + offset), locale_len);
+  offset += locale_len;
+  snapshot->meta_fallback.assign(reinterpret_cast<const char*>(data + offset), fallback_len);
+  offset += fallback_len;
+  snapshot->meta_note.assign(reinterpret_cast<const char*>(data + offset), note_len);
+  offset += note_len;
+
+  const std::filesystem::path base_dir = std::filesystem::path(path).parent_path();
+  set->by_prefix.assign((size_t)1 << (4 * set->prefix_len), -1);
+  for (uint32_t i = 0; i < shard_count; ++i) {
+    if (offset + set->prefix_len + 14 > size) {
+      err = "Shard-Manifest: Segment-Tabelle zu kurz.";
+      return {};
+    }
+    ShardSet::Shard shard;
+    shard.prefix.assign(reinterpret_cast<const char*>(data + offset), set->prefix_len);
+    offset += set->prefix_len;
+    shard.entry_count = read_le_u32(data + offset);
+    shard.hash = read_le_u64(data + offset + 4);
+    const uint16_t name_len = read_le_u16(data + offset + 12);
+    offset += 14;
+    if (offset + name_len > size) {
+      err = "Shard-Manifest: Segment-Name überschreitet Daten.";
+      return {};
+    }
+    const std::string name(reinterpret_cast<const char*>(data + offset), name_len);
+    offset += name_len;
+    if (name.empty() || name.find_first_of("/\\") != std::string::npos) {
+      err = "Shard-Manifest: Ungültiger Segment-Name.";
+      return {};
+    }
+    shard.path = (base_dir / name).string();
+    size_t slot = 0;
+    if (!ShardSet::prefix_slot(shard.prefix, set->prefix_len, slot) || set->by_prefix[slot] != -1) {
+      err = "Shard-Manifest: Präfix doppelt oder ungültig.";
+      return {};
+    }
+    set->by_prefix[slot] = (int32_t)set->shards.size();
+    set->shards.push_back(std::move(shard));
+  }
+  if (offset != size) {
+    err = "Shard-Manifest: Überzählige Daten.";
+    return {};
+  }
+
+  set->loaded.reset(new std::atomic<const CatalogSnapshot*>[set->shards.size()]);
+  for (size_t i = 0; i < set->shards.size(); ++i) set->loaded[i].store(nullptr, std::memory_order_relaxed);
+  set->owned.resize(set->shards.size());
+  set->failed.assign(set->shards.size(), false);
+  set->errors.resize(set->shards.size());
+  snapshot->shards = std::move(set);
+  return snapshot;
+}
+
+bool I18nEngine::export_sharded(const char* path, uint32_t prefix_len, uint32_t flags, std::string& err) const {
+  err.clear();
+  if (!path) { err = "path == nullptr"; return false; }
+  if (prefix_len == 0 || prefix_len > SHARD_PREFIX_MAX) { err = "Shard-Export: Präfix-Länge muss 1..4 sein."; return false; }
+  auto snapshot = materialize(acquire_snapshot(), err);
+  if (!snapshot && !err.empty()) return false;
+  if (!snapshot || snapshot->catalog.empty()) { err = "Shard-Export: Kein Katalog geladen."; return false; }
+
+  // Segmente nach Präfix gruppieren (sortiert für deterministische Reihenfolge im Manifest).
+  std::map<std::string, std::shared_ptr<CatalogSnapshot>> groups;
+  for (const auto& kv : snapshot->catalog) {
+    size_t slot = 0;
+    if (!ShardSet::prefix_slot(kv.first, prefix_len, slot)) {
+      err = "Shard-Export: Token ist kein Hex-String: " + kv.first;
+      return false;
+    }
+    auto& group = groups[kv.first.substr(0, prefix_len)];
+    if (!group) {
+      group = std::make_shared<CatalogSnapshot>();
+      group->meta_locale = snapshot->meta_locale;
+      group->meta_fallback = snapshot->meta_fallback;
+      group->meta_note = snapshot->meta_note;
+      group->meta_plural = snapshot->meta_plural;
+    }
+    group->catalog.emplace(kv.first, kv.second);
+  }
+
+  const std::filesystem::path manifest_path(path);
+  const std::filesystem::path base_dir = manifest_path.parent_path();
+  const std::string stem = manifest_path.stem().string();
+  std::vector<uint8_t> body;
+  const std::string* meta[3] = { &snapshot->meta_locale, &snapshot->meta_fallback, &snapshot->meta_note };
+  uint16_t lens[3];
+  for (int i = 0; i < 3; ++i) {
+    lens[i] = (uint16_t)std::min(meta[i]->size(), (size_t)std::numeric_limits<uint16_t>::max());
+    append_le_u16(body, lens[i]);
+  }
+  for (int i = 0; i < 3; ++i) body.insert(body.end(), meta[i]->begin(), meta[i]->begin() + lens[i]);
+
+  for (const auto& kv : groups) {
+    // Name nach Inhalt + Flags: ein neuer Export überschreibt nie ein Segment, das ein älteres Manifest
+    // referenziert (gleicher Name = gleiche Bytes). Alte Segmente bleiben liegen, bis sie entfernt werden.
+    char version[17];
+    std::snprintf(version, sizeof(version), "%016llx",
+                  (unsigned long long)(content_hash(*kv.second) ^ ((uint64_t)flags * 0x9E3779B97F4A7C15ull)));
+    const std::string name = stem + "." + kv.first + "." + version + ".i18n";
+    const std::filesystem::path segment_path = base_dir / name;
+    FileMapping written;
+    if (!write_binary_snapshot(*kv.second, segment_path.string().c_str(), flags) || !written.map(segment_path, err)) {
+      err = "Shard-Export: Segment konnte nicht geschrieben werden: " + name;
+      return false;
+    }
+    body.insert(body.end(), kv.first.begin(), kv.first.end());
+    append_le_u32(body, (uint32_t)kv.second->catalog.size());
+    append_le_u64(body, section_hash64(reinterpret_cast<const uint8_t*>(written.data), written.size));
+    append_le_u16(body, (uint16_t)name.size());
+    body.insert(body.end(), name.begin(), name.end());
+  }
+
+  uint8_t plural_rule = static_cast<uint8_t>(snapshot->meta_plural);
+  if (plural_rule > static_cast<uint8_t>(PluralRule::ARABIC)) plural_rule = static_cast<uint8_t>(PluralRule::DEFAULT);
+  std::vector<uint8_t> header;
+  header.insert(header.end(), SHARD_MAGIC, SHARD_MAGIC + 4);
+  header.push_back(SHARD_VERSION);
+  header.push_back((uint8_t)prefix_len);
+  header.push_back(plural_rule);
+  header.push_back(0);
+  append_le_u32(header, (uint32_t)groups.size());
+  append_le_u32(header, fnv1a32(body.data(), body.size()));
+
+  // Manifest zuletzt und atomar: Leser des alten Manifests behalten ihre (unveränderten) Segmente.
+  AtomicFileWriter out;
+  if (!out.open(manifest_path, err)) return false;
+  out.write(header.data(), header.size());
+  out.write(body.data(), body.size());
+  return out.commit(err);
+}
+
+bool I18nEngine::get_shard_stats(uint32_t& out_loaded, uint32_t& out_total) const {
+  out_loaded = 0;
+  out_total = 0;
+  auto snapshot = acquire_snapshot();
+  if (!snapshot || !snapshot->shards) return false;
+  out_loaded = snapshot->shards->loaded_count();
+  out_total = (uint32_t)snapshot->shards->shards.size();
+  return true;
+}
+
+bool I18nEngine::export_subset(const char* path, const std::vector<std::string>& roots, uint32_t flags,
+                               size_t& out_kept, std::string& err) const {
+  err.clear();
+  out_kept = 0;
+  if (!path) { err = "path == nullptr"; return false; }
+  auto snapshot = materialize(acquire_snapshot(), err);
+  if (!snapshot && !err.empty()) return false;
+  if (!snapshot || snapshot->catalog.empty()) { err = "Subset-Export: Kein Katalog geladen."; return false; }
+  const auto& catalog = snapshot->catalog;
+
+  auto subset = std::make_shared<CatalogSnapshot>();
+  subset->meta_locale = snapshot->meta_locale;
+  subset->meta_fallback = snapshot->meta_fallback;
+  subset->meta_note = snapshot->meta_note;
+  subset->meta_plural = snapshot->meta_plural;
+
+  // Gleicher Referenzgraph wie im Check (scan_inline_refs), hier als Breitensuche ab den Wurzeln.
+  // Ein Token zieht immer Basis und alle Plural-Varianten mit, da translate_plural sie zur Laufzeit wählt.
+  std::vector<std::string> queue;
+  std::unordered_set<std::string> seen;
+  auto visit = [&](const std::string& name) {
+    std::string base;
+    std::string variant;
+    if (!parse_variant_suffix(name, base, variant)) base = name;
+    if (!seen.insert(base).second) return;
+    if (catalog.count(base)) queue.push_back(base);
+    auto it = snapshot->plural_variants.find(base);
+    if (it == snapshot->plural_variants.end()) return;
+    for (const auto& v : it->second) queue.push_back(base + '{' + v + '}');
+  };
+  for (const auto& root : roots) {
+    if (!root.empty()) visit(to_lower_ascii(root));
+  }
+
+  std::vector<std::string> refs;
+  for (size_t i = 0; i < queue.size(); ++i) {
+    auto it = catalog.find(queue[i]);
+    if (it == catalog.end()) continue;
+    subset->catalog.emplace(it->first, it->second);
+    scan_inline_refs(it->second, refs);
+    for (const auto& r : refs) visit(r);
+  }
+
+  if (subset->catalog.empty()) { err = "Subset-Export: Keine der Wurzeln ist im Katalog."; return false; }
+  if (!write_binary_snapshot(*subset, path, flags)) {
+    err = "Subset-Export fehlgeschlagen.";
+    return false;
+  }
+  out_kept = subset->catalog.size();
+  return true;
 }
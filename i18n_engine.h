@@ -1,5 +1,6 @@
 #pragma once
 #include <string>
+#include <string_view>
 #include <vector>
 #include <unordered_map>
 #include <unordered_set>
@@ -8,6 +9,7 @@
 #include <cstdint>
 #include <memory>
 #include <atomic>
+#include <mutex>
 
 class I18nEngine {
 private:
@@ -17,20 +19,98 @@ private:
     ARABIC  = 2
   };
 
+  // Komprimierte String-Table (Binary v3), Blöcke werden erst beim ersten Zugriff entpackt.
+  struct LazyTexts;
+  // Texte einer Bundle-Locale, direkt aus den gemappten Offset-Spalten gelesen.
+  struct BundleTexts;
+  // Nach Token-Präfix aufgeteilter Katalog (Manifest .i18ns + Segmente), Segmente werden beim ersten Treffer geladen.
+  struct ShardSet;
+  // Engine-eigener Thread für reload_async (wird beim ersten Aufruf gestartet).
+  struct ReloadWorker;
+  // LRU-Cache fertiger Übersetzungen (Token + Argumente), lebt genau so lange wie sein ResolveScope.
+  struct ResultCache;
+
   struct CatalogSnapshot {
     std::unordered_map<std::string, std::string> catalog;
+    std::unordered_map<std::string, uint32_t> lazy_index;
+    std::shared_ptr<LazyTexts> lazy;
+    std::shared_ptr<ShardSet> shards;
+    std::shared_ptr<BundleTexts> bundle_texts;
     std::unordered_map<std::string, std::string> labels;
     std::unordered_map<std::string, std::set<std::string>> plural_variants;
     std::string meta_locale;
     std::string meta_fallback;
     std::string meta_note;
     PluralRule meta_plural = PluralRule::DEFAULT;
+
+    const std::string* find_text(const std::string& key) const;
+    const std::set<std::string>* find_variants(const std::string& base) const;
+    // Fehlertext, wenn der Eintrag existiert, sein Text aber nicht lesbar ist (Checksum, defektes Segment).
+    std::string damage_for(const std::string& key) const;
+  };
+
+public:
+  // Typisiertes Argument für translate_ex (entspricht i18n_arg); text zeigt auf Speicher des Aufrufers.
+  struct TypedArg {
+    enum class Kind : uint8_t { LITERAL, INT, DOUBLE, TOKEN_ID, TOKEN };
+    Kind kind = Kind::LITERAL;
+    int32_t precision = -1;
+    std::string_view text;
+    int64_t int_value = 0;
+    double double_value = 0.0;
+    uint64_t token_id = 0;
+  };
+
+private:
+  struct LocaleCounters {
+    std::atomic<uint64_t> hits{0};
+    std::atomic<uint64_t> misses{0};
   };
 
+  // Aktiver Snapshot + aufgelöste Fallback-Kette, wird bei jeder Änderung neu gebaut und atomar getauscht.
+  struct ResolveScope {
+    std::vector<std::shared_ptr<const CatalogSnapshot>> layers;
+    std::vector<std::shared_ptr<LocaleCounters>> counters;
+    uint64_t generation = 0;
+    std::shared_ptr<ResultCache> results;
+  };
+
+  // Gemapptes Multi-Locale-Bundle (I18B), bleibt für Locale-Wechsel ohne I/O geöffnet.
+  struct BundleView;
+
   std::shared_ptr<const CatalogSnapshot> active_snapshot;
+  std::shared_ptr<const ResolveScope> active_scope;
+  std::unordered_map<std::string, std::shared_ptr<const CatalogSnapshot>> locale_snapshots;
+  std::unordered_map<std::string, std::shared_ptr<LocaleCounters>> locale_counters;
+  std::vector<std::string> fallback_chain;
+  bool fallback_chain_configured = false;
   std::string last_error;
   std::string current_path;
   bool current_strict = false;
+  bool current_trusted = false;
+  std::shared_ptr<const BundleView> active_bundle;
+  // Stat-Daten der Quelldatei zum Zeitpunkt des Ladens (für reload_if_changed) und, falls bekannt, der Roh-Hash
+  // ihrer Bytes: Text-Quellen liefern ihn beim Parsen mit, Binaries werden erst in reload_if_changed gehasht.
+  struct SourceStamp {
+    bool valid = false;
+    bool hashed = false;
+    uint64_t size = 0;
+    int64_t mtime = 0;
+    uint64_t hash = 0;
+  };
+  SourceStamp current_stamp;
+  // Per apply_patch angewendete Patches (absolute Pfade, in Reihenfolge); Reloads wenden sie erneut an.
+  std::vector<std::string> applied_patches;
+  std::atomic<uint64_t> generation{0};
+  // Serialisiert das Veröffentlichen (Snapshot, Scope, Pfad/Stempel) zwischen API-Aufrufen und dem Reload-Worker.
+  std::recursive_mutex publish_mutex;
+  std::unique_ptr<ReloadWorker> reload_worker;
+  std::string cache_dir;
+  std::atomic<uint64_t> result_cache_bytes{0};
+  std::atomic<uint64_t> result_cache_hits{0};
+  std::atomic<uint64_t> result_cache_misses{0};
+  std::atomic<uint64_t> result_cache_evictions{0};
+  std::string current_bundle_locale;
   std::string meta_locale;
   std::string meta_fallback;
   std::string meta_note;
@@ -68,23 +148,81 @@ private:
   friend void set_engine_error(I18nEngine* eng, const std::string& msg);
   friend void clear_engine_error(I18nEngine* eng);
 
-  std::string resolve_arg(const CatalogSnapshot* state,
+  static std::string plural_lookup(const ResolveScope& scope, const std::string& normalized, int count);
+  static std::string result_key(char kind, int count, const std::string& token, const std::vector<std::string>& args);
+  bool cached_result(const ResolveScope& scope, const std::string& key, std::string& out);
+  void store_result(const ResolveScope& scope, std::string key, const std::string& value, uint64_t budget);
+  void report_damage(const ResolveScope& scope, const std::string& token);
+  static const std::string* find_in_scope(const ResolveScope& scope, const std::string& token, bool count) noexcept;
+  std::string resolve_arg(const ResolveScope& scope,
                           const std::string& arg,
                           std::unordered_set<std::string>& seen,
                           int depth);
-  std::string translate_impl(const CatalogSnapshot* state,
+  std::string translate_impl(const ResolveScope& scope,
                              const std::string& token,
                              const std::vector<std::string>& args,
                              std::unordered_set<std::string>& seen,
-                             int depth);
+                             int depth,
+                             bool count_lookup = false,
+                             const std::vector<TypedArg>* typed = nullptr);
+  void append_typed_arg(const ResolveScope& scope, const TypedArg& arg, std::string& out,
+                        std::unordered_set<std::string>& seen, int depth);
+  static std::string typed_result_key(char kind, int count, const std::string& token, const std::vector<TypedArg>& args);
+  std::string translate_typed(const std::shared_ptr<const ResolveScope>& scope, const std::string& token_in,
+                              bool plural, int count, const std::vector<TypedArg>& args, bool count_stats);
 
-  std::shared_ptr<CatalogSnapshot> build_snapshot_from_text(std::string&& src, bool strict, std::string& err);
-  std::shared_ptr<CatalogSnapshot> build_snapshot_from_binary(const uint8_t* data, size_t size, bool strict,
+  static std::shared_ptr<CatalogSnapshot> build_snapshot_from_text(std::string&& src, bool strict, std::string& err);
+  static std::shared_ptr<CatalogSnapshot> build_snapshot_from_binary(const uint8_t* data, size_t size, bool strict, bool trusted,
                                                               std::string& err);
+  static std::shared_ptr<CatalogSnapshot> load_snapshot_from_file(const std::string& path, bool strict, bool trusted,
+                                                           std::string& err, SourceStamp* stamp = nullptr);
+  std::shared_ptr<const BundleView> open_bundle(const std::string& path, bool strict, std::string& err) const;
+  std::shared_ptr<CatalogSnapshot> build_snapshot_from_bundle(const std::shared_ptr<const BundleView>& bundle,
+                                                              size_t locale_index, std::string& err) const;
+  bool install_bundle_locale(std::shared_ptr<const BundleView> bundle, const std::string& locale, std::string& err,
+                             const std::vector<std::string>& patches = {});
+  bool load_txt_source(const char* path, bool strict, bool trusted, const std::vector<std::string>& patches);
+  void publish_source(const std::string& path, bool strict, bool trusted, const std::vector<std::string>& patches,
+                      const SourceStamp& stamp, std::shared_ptr<CatalogSnapshot> snapshot);
+  bool load_bundle_source(const char* path, const char* locale, bool strict, const std::vector<std::string>& patches);
+  static bool apply_patches(std::shared_ptr<CatalogSnapshot>& snapshot, const std::vector<std::string>& patches,
+                            std::string& err);
+  bool reload_in_background(std::string& err);
+  void run_reload_worker();
   void install_snapshot(std::shared_ptr<CatalogSnapshot> snapshot);
+  std::shared_ptr<LocaleCounters> counters_for(const std::string& locale);
+  void rebuild_scope();
   std::shared_ptr<const CatalogSnapshot> acquire_snapshot() const noexcept;
+  // Vollständig entpackte Kopie; nullptr + err, wenn ein Segment oder Block fehlt bzw. defekt ist.
+  static std::shared_ptr<const CatalogSnapshot> materialize(std::shared_ptr<const CatalogSnapshot> snapshot,
+                                                            std::string& err);
+  std::shared_ptr<const ResolveScope> acquire_scope() const noexcept;
   static bool is_binary_catalog_path(const std::string& path) noexcept;
+  static bool stat_source(const std::string& path, SourceStamp& stamp);
+  static SourceStamp stamp_source(const std::string& path);
+  static bool hash_source(const std::string& path, SourceStamp& stamp);
+  std::shared_ptr<CatalogSnapshot> load_snapshot_cached(const std::string& path, bool strict, bool trusted,
+                                                       std::string& err, SourceStamp* stamp = nullptr) const;
+  static std::shared_ptr<CatalogSnapshot> load_sharded_manifest(const std::string& path, bool strict, bool trusted,
+                                                                std::string& err);
+  static bool write_binary_snapshot(const CatalogSnapshot& snapshot, const char* path, uint32_t flags);
+  static uint64_t content_hash(const CatalogSnapshot& snapshot);
+  static std::shared_ptr<CatalogSnapshot> apply_patch_to(const CatalogSnapshot& base, const uint8_t* data, size_t size,
+                                                         std::string& err);
+  std::shared_ptr<CatalogSnapshot> load_patch_base(const char* path, std::string& err);
 public:
+  using ReloadCallback = std::function<void(bool ok, const std::string& err)>;
+
+  I18nEngine();
+  ~I18nEngine();
+  I18nEngine(const I18nEngine&) = delete;
+  I18nEngine& operator=(const I18nEngine&) = delete;
+
+  // Flags für export_binary_catalog (entsprechen I18N_EXPORT_* in i18n_api.h).
+  static constexpr uint32_t EXPORT_SHARE_SUFFIXES = 1u;
+  static constexpr uint32_t EXPORT_COMPRESS = 2u;
+  static constexpr uint32_t EXPORT_SECTION_CHECKSUMS = 4u;
+
   enum class PublicPluralRule : uint8_t {
     DEFAULT = 0,
     SLAVIC  = 1,
@@ -97,12 +235,69 @@ public:
   const std::string& get_meta_note() const noexcept;
   PublicPluralRule get_meta_plural_rule() const noexcept;
   bool load_txt_catalog(std::string src, bool strict);
-  bool load_txt_file(const char* path, bool strict);
+  bool load_txt_file(const char* path, bool strict, bool trusted = false);
   bool reload();
-  std::string translate(const std::string& token_in, const std::vector<std::string>& args);
-  std::string translate_plural(const std::string& token_in, int count, const std::vector<std::string>& args);
+  // Parst im Worker-Thread, der alte Snapshot bleibt bis zum atomaren Tausch aktiv. Gleichzeitige Anfragen
+  // werden zu einem Lauf zusammengefasst; done läuft im Worker-Thread (auch beim Freigeben der Engine).
+  bool reload_async(ReloadCallback done);
+  bool load_locale_file(const char* path, bool strict);
+  void set_fallback_chain(const std::string& chain);
+  std::string get_fallback_chain() const;
+  bool get_locale_stats(const std::string& locale, uint64_t& out_hits, uint64_t& out_misses) const;
+  std::string translate(const std::string& token_in, const std::vector<std::string>& args, bool count_stats = true);
+  std::string translate_plural(const std::string& token_in, int count, const std::vector<std::string>& args,
+                               bool count_stats = true);
+  // Wie translate/translate_plural, aber ohne Token-Heuristik: Literale und Zahlen werden direkt eingesetzt,
+  // nur TOKEN_ID/TOKEN werden aufgelöst.
+  std::string translate_ex(const std::string& token_in, const std::vector<TypedArg>& args, bool count_stats = true);
+  std::string translate_plural_ex(const std::string& token_in, int count, const std::vector<TypedArg>& args,
+                                  bool count_stats = true);
+  // Spaltenweise Pluralübersetzung: counts = rows Ganzzahlen (count_bytes 4 oder 8), args spaltenweise
+  // (args[col * rows + row]). Die Variante wird einmal pro Pluralform aufgelöst, Formen ohne %N nur einmal gerendert.
+  // Ergebnisse landen NUL-getrennt in arena, lengths[row] = Länge ohne NUL.
+  bool translate_plural_column(const std::string& token_in, const void* counts, int count_bytes, size_t rows,
+                               const char* const* args, size_t arg_columns, std::string& arena,
+                               std::vector<size_t>& lengths);
+  // Festgehaltener Stand (Snapshot + Fallback-Kette): Übersetzungen darüber sehen keine späteren Reloads.
+  using PinnedScope = std::shared_ptr<const ResolveScope>;
+  PinnedScope pin_scope() const noexcept;
+  static uint64_t pinned_generation(const PinnedScope& scope) noexcept;
+  std::string translate(const PinnedScope& scope, const std::string& token_in, const std::vector<std::string>& args,
+                        bool count_stats = true);
+  std::string translate_plural(const PinnedScope& scope, const std::string& token_in, int count,
+                               const std::vector<std::string>& args, bool count_stats = true);
+  // Token (oder Basis mit Plural-Varianten) in der aktiven Locale bzw. ihrer Fallback-Kette vorhanden?
+  bool has_token(const std::string& token_in) const;
   std::string dump_table() const;
   std::string find_any(const std::string& query) const;
   std::string check_catalog_report(int& out_code) const;
-  bool export_binary_catalog(const char* path) const;
+  bool export_binary_catalog(const char* path, uint32_t flags = 0) const;
+  bool export_binary_catalog(const char* path, uint32_t flags, std::string& err) const;
+  bool load_bundle_file(const char* path, const char* locale, bool strict);
+  bool select_bundle_locale(const char* locale);
+  std::string get_bundle_locales() const;
+  bool export_bundle(const char* path, std::string& err) const;
+  // 1 = neuer Snapshot veröffentlicht, 0 = Datei unverändert (nur stat bzw. Hash geprüft), -1 = Fehler.
+  int reload_if_changed();
+  // Zählt jede Veröffentlichung eines Snapshots bzw. einer Fallback-Kette.
+  uint64_t get_generation() const noexcept;
+  // Neue Instanz mit eigenem Fehlerzustand und eigenen Locale-Zählern, die alle Snapshots dieser Instanz teilt.
+  std::unique_ptr<I18nEngine> clone();
+  // Optionaler Ergebnis-Cache, begrenzt auf max_bytes (0 = aus); jeder neue Snapshot beginnt mit leerem Cache.
+  void set_result_cache(uint64_t max_bytes);
+  void get_result_cache_stats(uint64_t& out_hits, uint64_t& out_misses, uint64_t& out_evictions,
+                              uint64_t& out_bytes) const;
+  // Entpackt Lazy-Blöcke und lädt alle Shards aller Locales vorab (z. B. vor fork(), damit Kinder nur lesen).
+  bool preload();
+  // Opt-in: kompilierte Snapshots von .txt-Katalogen unter `dir` ablegen und beim nächsten Laden mappen ("" = aus).
+  void set_cache_dir(const std::string& dir);
+  bool export_sharded(const char* path, uint32_t prefix_len, uint32_t flags, std::string& err) const;
+  bool get_shard_stats(uint32_t& out_loaded, uint32_t& out_total) const;
+  // Nur die von `roots` über @-Referenzen erreichbaren Tokens (inkl. Plural-Varianten) exportieren.
+  bool export_subset(const char* path, const std::vector<std::string>& roots, uint32_t flags,
+                     size_t& out_kept, std::string& err) const;
+  bool make_patch(const char* old_path, const char* new_path, const char* patch_path, std::string& err);
+  bool apply_patch_file(const char* base_path, const char* patch_path, const char* out_path, uint32_t export_flags,
+                        std::string& err);
+  bool apply_patch(const char* patch_path);
 };
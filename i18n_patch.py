@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import argparse
+import ctypes
+from pathlib import Path
+
+from i18n_crypt import (
+    EXPORT_COMPRESS,
+    EXPORT_SECTION_CHECKSUMS,
+    EXPORT_SHARE_SUFFIXES,
+    last_error,
+    load_library,
+    resolve_engine_path,
+)
+
+
+def setup(lib):
+    lib.i18n_new.restype = ctypes.c_void_p
+    lib.i18n_free.argtypes = [ctypes.c_void_p]
+    lib.i18n_last_error_copy.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+    lib.i18n_make_patch.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
+    lib.i18n_make_patch.restype = ctypes.c_int
+    lib.i18n_apply_patch_file.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int
+    ]
+    lib.i18n_apply_patch_file.restype = ctypes.c_int
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Erzeugt Delta-Patches (.i18p) zwischen zwei Katalog-Releases und wendet sie an."
+    )
+    parser.add_argument("--library", type=Path, help="Pfad zur i18n-Engine (.dll oder .so)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    diff = sub.add_parser("diff", help="Patch von OLD nach NEW erzeugen")
+    diff.add_argument("old", type=Path, help="Bisheriges Release (.i18n oder .txt)")
+    diff.add_argument("new", type=Path, help="Neues Release (.i18n oder .txt)")
+    diff.add_argument("patch", type=Path, help="Ausgabe-Patch (.i18p)")
+
+    apply = sub.add_parser("apply", help="Patch auf BASE anwenden und als Binary schreiben")
+    apply.add_argument("base", type=Path, help="Bisheriges Release (.i18n)")
+    apply.add_argument("patch", type=Path, help="Patch-Datei (.i18p)")
+    apply.add_argument("output", type=Path, help="Ausgabe-Binärdatei (.i18n)")
+    apply.add_argument("--share-suffixes", action="store_true", help="wie i18n_crypt.py --share-suffixes")
+    apply.add_argument("--compress", action="store_true", help="wie i18n_crypt.py --compress")
+    apply.add_argument("--section-checksums", action="store_true", help="wie i18n_crypt.py --section-checksums")
+    args = parser.parse_args()
+
+    lib = load_library(resolve_engine_path(args.library))
+    setup(lib)
+    engine = lib.i18n_new()
+    if not engine:
+        raise SystemExit("Konnte Engine nicht initialisieren.")
+
+    try:
+        if args.command == "diff":
+            res = lib.i18n_make_patch(
+                engine,
+                str(args.old).encode("utf-8"),
+                str(args.new).encode("utf-8"),
+                str(args.patch).encode("utf-8"),
+            )
+            if res < 0:
+                raise SystemExit(f"Fehler beim Diff: {last_error(engine, lib)}")
+            print(f"Patch erzeugt: {args.patch} ({args.patch.stat().st_size} Bytes)")
+        else:
+            flags = 0
+            if args.share_suffixes:
+                flags |= EXPORT_SHARE_SUFFIXES
+            if args.compress:
+                flags |= EXPORT_COMPRESS
+            if args.section_checksums:
+                flags |= EXPORT_SECTION_CHECKSUMS
+            res = lib.i18n_apply_patch_file(
+                engine,
+                str(args.base).encode("utf-8"),
+                str(args.patch).encode("utf-8"),
+                str(args.output).encode("utf-8"),
+                flags,
+            )
+            if res < 0:
+                raise SystemExit(f"Fehler beim Anwenden: {last_error(engine, lib)}")
+            print(f"Patch angewendet: {args.output}")
+    finally:
+        lib.i18n_free(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+import argparse
+import ctypes
+import json
+import os
+import socketserver
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from i18n_crypt import last_error, load_library, resolve_engine_path
+
+BATCH_NO_COUNT = -2147483648
+
+
+def setup(lib):
+    lib.i18n_new.restype = ctypes.c_void_p
+    lib.i18n_free.argtypes = [ctypes.c_void_p]
+    lib.i18n_last_error_copy.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+    lib.i18n_load_txt_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    lib.i18n_load_txt_file.restype = ctypes.c_int
+    lib.i18n_load_locale_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    lib.i18n_load_locale_file.restype = ctypes.c_int
+    lib.i18n_reload_if_changed.argtypes = [ctypes.c_void_p]
+    lib.i18n_reload_if_changed.restype = ctypes.c_int
+    lib.i18n_get_generation.argtypes = [ctypes.c_void_p]
+    lib.i18n_get_generation.restype = ctypes.c_uint64
+    lib.i18n_has_token.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.i18n_has_token.restype = ctypes.c_int
+    lib.i18n_translate_batch.argtypes = [
+        ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_char_p), ctypes.c_char_p, ctypes.c_int,
+        ctypes.POINTER(ctypes.c_int)
+    ]
+    lib.i18n_translate_batch.restype = ctypes.c_int
+    for name in ("i18n_get_meta_locale_copy", "i18n_get_meta_fallback_copy", "i18n_get_meta_note_copy",
+                 "i18n_get_fallback_chain_copy"):
+        getattr(lib, name).argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        getattr(lib, name).restype = ctypes.c_int
+    lib.i18n_get_meta_plural_rule.argtypes = [ctypes.c_void_p]
+    lib.i18n_get_meta_plural_rule.restype = ctypes.c_int
+
+
+class TranslationService:
+    """Eine Engine pro Prozess. Native Aufrufe laufen unter einem Lock (die Engine ist nicht threadsicher),
+    dafür bündelt jeder Request beliebig viele Einträge in einen Batch-Aufruf."""
+
+    def __init__(self, lib, catalog, locales=(), strict=False, cache_size=65536):
+        self.lib = lib
+        self.engine = lib.i18n_new()
+        if not self.engine:
+            raise RuntimeError("Konnte Engine nicht initialisieren.")
+        self.lock = threading.Lock()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_generation = None
+        if lib.i18n_load_txt_file(self.engine, str(catalog).encode("utf-8"), 1 if strict else 0) < 0:
+            raise RuntimeError(f"Fehler beim Laden: {last_error(self.engine, lib)}")
+        for path in locales:
+            if lib.i18n_load_locale_file(self.engine, str(path).encode("utf-8"), 1 if strict else 0) < 0:
+                raise RuntimeError(f"Fehler beim Laden von {path}: {last_error(self.engine, lib)}")
+
+    def close(self):
+        if self.engine:
+            self.lib.i18n_free(self.engine)
+            self.engine = None
+
+    def _sync_cache(self):
+        # Jede neue Generation (Reload, Locale) macht den Antwort-Cache ungültig.
+        generation = self.lib.i18n_get_generation(self.engine)
+        if generation != self.cache_generation:
+            self.cache.clear()
+            self.cache_generation = generation
+
+    def translate(self, items, plural):
+        if not isinstance(items, list):
+            raise TypeError("items muss eine Liste sein")
+        keys = []
+        for item in items:
+            if not isinstance(item, dict):
+                raise TypeError(f"Eintrag ist kein Objekt: {item!r}")
+            args = tuple(str(a) for a in item.get("args", ()))
+            count = int(item["count"]) if plural else None
+            # Übergabe als int32; BATCH_NO_COUNT selbst ist als Anzahl reserviert.
+            if count is not None and not BATCH_NO_COUNT < count <= 2**31 - 1:
+                raise ValueError(f"count außerhalb des int32-Bereichs: {count}")
+            keys.append((str(item["token"]).lower(), args, count))
+
+        with self.lock:
+            self._sync_cache()
+            results = [self.cache.get(key) for key in keys]
+            misses = [i for i, text in enumerate(results) if text is None]
+            if misses:
+                for i, text in zip(misses, self._native_batch([keys[i] for i in misses])):
+                    results[i] = text
+                    self.cache[keys[i]] = text
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+            for key in keys:
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+        return results
+
+    def _native_batch(self, keys):
+        n = len(keys)
+        tokens = (ctypes.c_char_p * n)(*[k[0].encode("utf-8") for k in keys])
+        counts = (ctypes.c_int * n)(*[BATCH_NO_COUNT if k[2] is None else k[2] for k in keys])
+        arg_counts = (ctypes.c_int * n)(*[len(k[1]) for k in keys])
+        flat = [a.encode("utf-8") for k in keys for a in k[1]]
+        args = (ctypes.c_char_p * max(len(flat), 1))(*flat)
+        lengths = (ctypes.c_int * n)()
+        size = 128 * n
+        while True:
+            buf = ctypes.create_string_buffer(size)
+            needed = self.lib.i18n_translate_batch(self.engine, n, tokens, counts, arg_counts, args, buf, size, lengths)
+            if needed < 0:
+                raise RuntimeError(last_error(self.engine, self.lib))
+            if needed <= size:
+                break
+            size = needed
+        raw = buf.raw
+        out = []
+        offset = 0
+        for length in lengths:
+            out.append(raw[offset:offset + length].decode("utf-8"))
+            offset += length + 1
+        return out
+
+    def has(self, tokens):
+        if not isinstance(tokens, list):
+            raise TypeError("tokens muss eine Liste sein")
+        with self.lock:
+            return [self.lib.i18n_has_token(self.engine, str(t).encode("utf-8")) == 1 for t in tokens]
+
+    def meta(self):
+        def copy(name):
+            buf = ctypes.create_string_buffer(1024)
+            getattr(self.lib, name)(self.engine, buf, len(buf))
+            return buf.value.decode("utf-8")
+
+        with self.lock:
+            chain = copy("i18n_get_fallback_chain_copy")
+            return {
+                "locale": copy("i18n_get_meta_locale_copy"),
+                "fallback": copy("i18n_get_meta_fallback_copy"),
+                "note": copy("i18n_get_meta_note_copy"),
+                "plural": self.lib.i18n_get_meta_plural_rule(self.engine),
+                "chain": chain.split(",") if chain else [],
+                "generation": self.lib.i18n_get_generation(self.engine),
+            }
+
+    def reload_if_changed(self):
+        with self.lock:
+            rc = self.lib.i18n_reload_if_changed(self.engine)
+            if rc < 0:
+                raise RuntimeError(last_error(self.engine, self.lib))
+            return rc == 1
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive; Pipelining: Anfragen werden der Reihe nach aus dem Puffer gelesen
+    disable_nagle_algorithm = True
+    server_version = "i18nServer/1"
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length < 0:
+            # Ohne gültige Länge ist das Ende des Bodys unbekannt: 400 und Verbindung schließen.
+            self.close_connection = True
+            raise ValueError(f"Content-Length negativ: {length}")
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/meta":
+            self._send(200, service.meta())
+        elif self.path == "/health":
+            self._send(200, {"ok": True})
+        else:
+            self._send(404, {"error": f"Unbekannter Endpunkt: {self.path}"})
+
+    def do_POST(self):
+        service = self.server.service
+        try:
+            request = self._read_json()
+            if self.path == "/translate":
+                self._send(200, {"results": service.translate(request["items"], plural=False)})
+            elif self.path == "/plural":
+                self._send(200, {"results": service.translate(request["items"], plural=True)})
+            elif self.path == "/has":
+                self._send(200, {"results": service.has(request["tokens"])})
+            elif self.path == "/reload":
+                self._send(200, {"reloaded": service.reload_if_changed(), **service.meta()})
+            else:
+                self._send(404, {"error": f"Unbekannter Endpunkt: {self.path}"})
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send(400, {"error": f"Ungültige Anfrage: {exc}"})
+        except RuntimeError as exc:
+            self._send(500, {"error": str(exc)})
+
+
+class UnixTranslationHandler(TranslationHandler):
+    disable_nagle_algorithm = False  # TCP_NODELAY existiert für Unix-Sockets nicht
+
+
+class UnixTranslationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def watch_loop(service, interval, stop):
+    # Hot Reload: stat-basiertes Polling, neu geparst wird nur bei tatsächlicher Änderung.
+    while not stop.wait(interval):
+        try:
+            if service.reload_if_changed():
+                print("Katalog neu geladen.")
+        except RuntimeError as exc:
+            print(f"Reload fehlgeschlagen: {exc}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokaler Übersetzungsdienst (HTTP/1.1 über TCP oder Unix-Socket).")
+    parser.add_argument("catalog", type=Path, help="Katalog (.txt, .i18n, .i18ns)")
+    parser.add_argument("--locale", dest="locales", type=Path, action="append", default=[],
+                        help="Weitere Locale für die Fallback-Kette (mehrfach möglich)")
+    parser.add_argument("--library", type=Path, help="Pfad zur i18n-Engine (.dll oder .so)")
+    parser.add_argument("--strict", action="store_true", help="strict=1 beim Laden")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP-Adresse (Standard: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP-Port (Standard: 8765)")
+    parser.add_argument("--unix", type=Path, help="Unix-Socket statt TCP")
+    parser.add_argument("--watch", type=float, default=1.0, metavar="SEK",
+                        help="Intervall für Hot Reload per i18n_reload_if_changed (0 = aus)")
+    parser.add_argument("--cache-size", type=int, default=65536, help="Einträge im Antwort-Cache")
+    parser.add_argument("--verbose", action="store_true", help="Requests protokollieren")
+    args = parser.parse_args()
+
+    lib = load_library(resolve_engine_path(args.library))
+    setup(lib)
+    try:
+        service = TranslationService(lib, args.catalog, args.locales, args.strict, args.cache_size)
+    except RuntimeError as exc:
+        raise SystemExit(str(exc))
+
+    if args.unix:
+        if args.unix.exists():
+            args.unix.unlink()
+        server = UnixTranslationServer(str(args.unix), UnixTranslationHandler)
+        where = f"unix:{args.unix}"
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), TranslationHandler)
+        where = f"http://{args.host}:{server.server_address[1]}"
+    server.service = service
+    server.verbose = args.verbose
+
+    stop = threading.Event()
+    if args.watch > 0:
+        threading.Thread(target=watch_loop, args=(service, args.watch, stop), daemon=True).start()
+
+    print(f"i18n-Server läuft auf {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        if args.unix and args.unix.exists():
+            os.unlink(args.unix)
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
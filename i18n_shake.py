@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import argparse
+import ctypes
+import re
+from pathlib import Path
+
+from i18n_crypt import (
+    EXPORT_COMPRESS,
+    EXPORT_SECTION_CHECKSUMS,
+    EXPORT_SHARE_SUFFIXES,
+    last_error,
+    load_library,
+    resolve_engine_path,
+)
+
+# String-Literale, die wie ein Token aussehen ("a1b2c3", 'deadbeef{one}').
+TOKEN_LITERAL = re.compile(r"""["']([0-9A-Fa-f]{6,32}(?:\{[A-Za-z_]+\})?)["']""")
+
+
+def read_token_list(path):
+    tokens = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            tokens.extend(line.replace(",", " ").split())
+    return tokens
+
+
+def scan_sources(path):
+    files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+    tokens = []
+    for source in files:
+        text = source.read_text(encoding="utf-8", errors="ignore")
+        tokens.extend(match.group(1) for match in TOKEN_LITERAL.finditer(text))
+    return tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Exportiert nur die von einer Wurzelmenge erreichbaren Tokens (Tree-Shaking über @-Referenzen)."
+    )
+    parser.add_argument("input", type=Path, help="Katalog (.txt oder .i18n)")
+    parser.add_argument("output", type=Path, help="Ausgabe-Binärdatei (.i18n)")
+    parser.add_argument("--library", type=Path, help="Pfad zur i18n-Engine (.dll oder .so)")
+    parser.add_argument("--strict", action="store_true", help="strict=1 während des Ladens erzwingen")
+    parser.add_argument("--root", action="append", default=[], help="Wurzel-Token (mehrfach möglich)")
+    parser.add_argument("--tokens", type=Path, action="append", default=[],
+                        help="Datei mit Wurzel-Tokens (eines pro Zeile, # Kommentare)")
+    parser.add_argument("--scan", type=Path, action="append", default=[],
+                        help="Python-Datei oder Verzeichnis nach Token-Literalen durchsuchen")
+    parser.add_argument("--share-suffixes", action="store_true", help="wie i18n_crypt.py --share-suffixes")
+    parser.add_argument("--compress", action="store_true", help="wie i18n_crypt.py --compress")
+    parser.add_argument("--section-checksums", action="store_true", help="wie i18n_crypt.py --section-checksums")
+    args = parser.parse_args()
+
+    roots = list(args.root)
+    for path in args.tokens:
+        roots.extend(read_token_list(path))
+    for path in args.scan:
+        roots.extend(scan_sources(path))
+    roots = sorted(set(roots))
+    if not roots:
+        raise SystemExit("Keine Wurzel-Tokens angegeben (--root, --tokens oder --scan).")
+
+    lib = load_library(resolve_engine_path(args.library))
+    lib.i18n_new.restype = ctypes.c_void_p
+    lib.i18n_free.argtypes = [ctypes.c_void_p]
+    lib.i18n_last_error_copy.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+    lib.i18n_load_txt_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    lib.i18n_load_txt_file.restype = ctypes.c_int
+    lib.i18n_export_subset.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    lib.i18n_export_subset.restype = ctypes.c_int
+
+    engine = lib.i18n_new()
+    if not engine:
+        raise SystemExit("Konnte Engine nicht initialisieren.")
+
+    try:
+        res = lib.i18n_load_txt_file(engine, str(args.input).encode("utf-8"), 1 if args.strict else 0)
+        if res < 0:
+            raise SystemExit(f"Fehler beim Laden: {last_error(engine, lib)}")
+
+        flags = 0
+        if args.share_suffixes:
+            flags |= EXPORT_SHARE_SUFFIXES
+        if args.compress:
+            flags |= EXPORT_COMPRESS
+        if args.section_checksums:
+            flags |= EXPORT_SECTION_CHECKSUMS
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        kept = lib.i18n_export_subset(
+            engine, str(args.output).encode("utf-8"), ",".join(roots).encode("utf-8"), flags
+        )
+        if kept < 0:
+            raise SystemExit(f"Fehler beim Export: {last_error(engine, lib)}")
+        print(f"Subset erzeugt: {args.output} ({kept} Einträge aus {len(roots)} Wurzeln)")
+    finally:
+        lib.i18n_free(engine)
+
+
+if __name__ == "__main__":
+    main()
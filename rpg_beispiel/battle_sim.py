@@ -0,0 +1,300 @@
+import argparse
+import contextlib
+import copy
+import io
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+import game
+from i18n_wrapper import I18nEngine
+
+ACTION_ATTACK = 1
+ACTION_HEAVY = 2
+ACTION_REPAIR = 3
+ACTION_SKILL = 4
+MAX_ROUNDS = 200
+BATCH_SIZE = 1 << 16
+STATE_COLUMNS = {"atk": "atk", "hp": "player_hp", "crit_chance": "crit"}
+
+
+def attack_policy(state, rng):
+    return np.full(state["size"], ACTION_ATTACK, dtype=np.int8)
+
+
+def heavy_policy(state, rng):
+    return np.full(state["size"], ACTION_HEAVY, dtype=np.int8)
+
+
+def balanced_policy(state, rng):
+    actions = np.full(state["size"], ACTION_ATTACK, dtype=np.int8)
+    actions[state["player_hp"] < state["max_hp"] * 0.35] = ACTION_REPAIR
+    if state["round"] == 0:
+        actions[state["skill_ready"]] = ACTION_SKILL
+    return actions
+
+
+def random_policy(state, rng):
+    return rng.integers(ACTION_ATTACK, ACTION_SKILL + 1, size=state["size"], dtype=np.int8)
+
+
+POLICIES = {
+    "attack": attack_policy,
+    "heavy": heavy_policy,
+    "balanced": balanced_policy,
+    "random": random_policy,
+}
+
+
+def player_for_level(level: int, template: game.Player | None = None):
+    player = copy.deepcopy(template) if template else game.Player("Sim")
+    while player.lvl < level:
+        game.apply_level_up(player)
+    player.hp = player.max_hp
+    return player
+
+
+def resolve_script_clauses(engine: I18nEngine, token: str | None):
+    if not token:
+        return []
+    script = game.resolve_catalog_token(engine, token)
+    if "⟦" in script:
+        return []
+    return list(game.iter_script_clauses(game.parse_script(script)[1]))
+
+
+def prepare_battle(engine: I18nEngine, template: game.Player, is_boss=False):
+    # Deterministischer Teil von run_battle: dieselben Aggregations-, Script- und Skalierungsregeln, ohne Ausgabe.
+    player = copy.deepcopy(template)
+    with contextlib.redirect_stdout(io.StringIO()):
+        event = game.get_active_world_event() or {}
+        item_effects = game.aggregate_equipped_item_effects(engine, player)
+        calr_script = game.compose_calr_script(engine, player)
+        calr_effects = game.execute_dynamic_script(player, calr_script, engine, "CALR") if calr_script else None
+        scaling_script = game.compose_enemy_scaling_script(engine, player)
+        scaling_effects = (
+            game.execute_dynamic_script(player, scaling_script, engine, "SCALING") if scaling_script else None
+        )
+        penalty = player.trait_stability_penalty() + item_effects.get("stability_penalty", 0)
+        for trait in game.TRAIT_CONFIG:
+            if player.has_trait(trait["id"]) and trait.get("module_token"):
+                effects = game.execute_token_script(player, engine, trait["module_token"])
+                penalty += effects.get("stability_penalty", 0)
+    story_effects = player.story_effects or {}
+    penalty += story_effects.get("stab_sub", 0)
+
+    if item_effects.get("hp_add", 0):
+        player.hp = min(player.max_hp, player.hp + item_effects["hp_add"])
+    if item_effects.get("hp_sub", 0):
+        player.hp = max(0, player.hp - item_effects["hp_sub"])
+
+    base_hp, base_atk = game.enemy_base_stats(player, is_boss)
+    enemy_hp, enemy_atk = game.apply_enemy_effects(
+        base_hp, base_atk, [calr_effects, scaling_effects, story_effects, item_effects]
+    )
+    skill_available = bool(player.active_skill_token and player.active_skill_token in player.skill_tokens)
+    return {
+        "level": player.lvl,
+        "is_boss": is_boss,
+        "stability_shift": event.get("stability_shift", 0),
+        "event_physics": event.get("physics_bonus", 0),
+        "stability_penalty": penalty,
+        "player_hp": player.hp,
+        "max_hp": player.max_hp,
+        "atk": player.atk,
+        "crit": player.crit_chance,
+        "atk_add": item_effects.get("atk_add", 0),
+        "atk_mul": item_effects.get("atk_mul", 1.0),
+        "crit_add": item_effects.get("crit_add", 0),
+        "crit_mul": item_effects.get("crit_mul", 1.0),
+        "trait_multiplier": player.trait_damage_multiplier(),
+        "enemy_hit": max(1, int(enemy_atk - int(item_effects.get("def_add", 0)))),
+        "enemy_hp": enemy_hp,
+        "phase_threshold": base_hp / 2,
+        "skill_available": skill_available,
+        "skill_clauses": resolve_script_clauses(engine, player.active_skill_token) if skill_available else [],
+        "boss_clauses": resolve_script_clauses(engine, "000B50") if is_boss else [],
+    }
+
+
+def vector_script_op(current, op: str, val: float, max_hp, mask):
+    if op == "add":
+        updated = current + val
+    elif op == "mul":
+        updated = current * val
+    elif op == "heal":
+        updated = np.minimum(max_hp, current + val)
+    else:
+        updated = np.maximum(0, current - val)
+    return np.where(mask, updated, current)
+
+
+def apply_player_clauses(state, clauses, mask):
+    for key, val in clauses:
+        spec = game.SCRIPT_PLAYER_OPS.get(key)
+        if not spec:
+            continue
+        attr, op, _ = spec
+        column = STATE_COLUMNS[attr]
+        state[column] = vector_script_op(state[column], op, val, state["max_hp"], mask)
+
+
+def simulate_batch(setup: dict, size: int, policy, rng, max_rounds=MAX_ROUNDS):
+    if setup["is_boss"]:
+        stability = np.full(size, game.BATTLE_BOSS_STABILITY, dtype=np.float64)
+    else:
+        low, high = game.BATTLE_STABILITY_RANGE
+        stability = rng.integers(low, high + 1, size=size).astype(np.float64)
+    stability += setup["stability_shift"]
+    stability = np.maximum(game.BATTLE_STABILITY_FLOOR, stability - setup["stability_penalty"])
+    low, high = game.BATTLE_PHYSICS_BONUS_RANGE
+    physics = np.where(
+        stability < game.BATTLE_PHYSICS_THRESHOLD,
+        rng.integers(low, high + 1, size=size),
+        setup["event_physics"],
+    )
+
+    state = {
+        "size": size,
+        "round": 0,
+        "max_hp": float(setup["max_hp"]),
+        "player_hp": np.full(size, float(setup["player_hp"])),
+        "atk": np.full(size, float(setup["atk"])),
+        "crit": np.full(size, float(setup["crit"])),
+        "enemy_hp": np.full(size, float(setup["enemy_hp"])),
+        "skill_ready": np.full(size, setup["skill_available"]),
+        "active": np.ones(size, dtype=bool),
+    }
+    phase_done = np.full(size, not setup["is_boss"])
+    rounds = np.zeros(size, dtype=np.int32)
+    dealt = np.zeros(size)
+    taken = np.zeros(size)
+    spread = game.BATTLE_ATTACK_SPREAD
+    enemy_hit = setup["enemy_hit"]
+
+    for round_no in range(max_rounds):
+        active = (state["enemy_hp"] > 0) & (state["player_hp"] > 0)
+        if not active.any():
+            break
+        state["round"] = round_no
+        state["active"] = active
+        if setup["is_boss"]:
+            phase = active & ~phase_done & (state["enemy_hp"] <= setup["phase_threshold"])
+            if phase.any():
+                apply_player_clauses(state, setup["boss_clauses"], phase)
+                phase_done |= phase
+
+        actions = policy(state, rng)
+        rounds += active
+        use_skill = active & state["skill_ready"] & (actions == ACTION_SKILL)
+        if use_skill.any():
+            apply_player_clauses(state, setup["skill_clauses"], use_skill)
+            state["skill_ready"] = state["skill_ready"] & ~use_skill
+        acting = active & ~use_skill
+
+        current_atk = np.trunc(
+            (state["atk"] + setup["atk_add"] + physics) * setup["atk_mul"] * setup["trait_multiplier"]
+        )
+        dmg = np.where(
+            acting & (actions == ACTION_ATTACK),
+            current_atk + rng.integers(-spread, spread + 1, size=size),
+            0.0,
+        )
+        heavy = acting & (actions == ACTION_HEAVY) & (rng.random(size) > game.BATTLE_HEAVY_MISS_CHANCE)
+        dmg = np.where(heavy, np.trunc(current_atk * game.BATTLE_HEAVY_MULTIPLIER), dmg)
+        dmg = np.maximum(dmg, 0.0)
+        repair = acting & (actions == ACTION_REPAIR)
+        state["player_hp"] = np.where(
+            repair, np.minimum(state["max_hp"], state["player_hp"] + game.BATTLE_REPAIR_HP), state["player_hp"]
+        )
+
+        crit = (state["crit"] + setup["crit_add"]) * setup["crit_mul"]
+        dmg = np.where((dmg > 0) & (rng.random(size) < crit), dmg * 2, dmg)
+        state["enemy_hp"] -= dmg
+        dealt += dmg
+
+        strikes = acting & (state["enemy_hp"] > 0)
+        state["player_hp"] -= strikes * enemy_hit
+        taken += strikes * enemy_hit
+
+    wins = state["enemy_hp"] <= 0
+    timeouts = (state["enemy_hp"] > 0) & (state["player_hp"] > 0)
+    return wins, timeouts, rounds, dealt, taken
+
+
+def distribution(values):
+    return {
+        "mean": float(values.mean()),
+        "p10": float(np.percentile(values, 10)),
+        "p50": float(np.percentile(values, 50)),
+        "p90": float(np.percentile(values, 90)),
+        "max": float(values.max()),
+    }
+
+
+def run_balance(engine: I18nEngine, levels, battles: int, policy="balanced", seed=0, is_boss=False,
+                template: game.Player | None = None, batch_size=BATCH_SIZE):
+    policy_fn = POLICIES[policy] if isinstance(policy, str) else policy
+    results = []
+    for level in levels:
+        rng = np.random.default_rng([seed, level])
+        setup = prepare_battle(engine, player_for_level(level, template), is_boss)
+        parts = []
+        remaining = battles
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            parts.append(simulate_batch(setup, size, policy_fn, rng))
+            remaining -= size
+        wins, timeouts, rounds, dealt, taken = (np.concatenate(column) for column in zip(*parts))
+        results.append({
+            "level": level,
+            "battles": battles,
+            "win_rate": float(wins.mean()),
+            "timeout_rate": float(timeouts.mean()),
+            "rounds": dict(distribution(rounds), histogram=np.bincount(rounds).tolist()),
+            "damage_dealt": distribution(dealt),
+            "damage_taken": distribution(taken),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Kampf-Simulator für Balance-Läufe.")
+    parser.add_argument("--catalog", type=Path, default=game.BASE_DIR / "game catalogs" / "fantasy_rpg_catalog.txt")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--battles", type=int, default=100000, help="Kämpfe pro Level")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="balanced")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--boss", action="store_true")
+    parser.add_argument("--savegame", action="store_true", help="Spielerstand aus dem Savegame als Vorlage nutzen")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    game.set_active_catalog_context(args.catalog)
+    engine = I18nEngine()
+    engine.load_file(str(args.catalog))
+    game.update_catalog_cache_from_text(args.catalog.read_text(encoding="utf-8"))
+    template = game.Player.load_game() if args.savegame else None
+
+    started = time.perf_counter()
+    results = run_balance(engine, args.levels, args.battles, args.policy, args.seed, args.boss, template)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    total = args.battles * len(args.levels)
+    print(f"{total} Kämpfe in {elapsed:.2f}s ({total / max(elapsed, 1e-9) * 60:,.0f}/min), Policy={args.policy}")
+    for entry in results:
+        rounds = entry["rounds"]
+        print(
+            f"Level {entry['level']:>3}: Win {entry['win_rate']:.1%} | Timeout {entry['timeout_rate']:.1%} | "
+            f"Runden p50={rounds['p50']:.0f} p90={rounds['p90']:.0f} | "
+            f"Schaden p50={entry['damage_dealt']['p50']:.0f} | erlitten p50={entry['damage_taken']['p50']:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
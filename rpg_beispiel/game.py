@@ -6,6 +6,8 @@ import time
 import subprocess
 import sys
 from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
 from pathlib import Path
 
 from i18n_wrapper import I18nEngine
@@ -35,8 +37,12 @@ CATALOG_CACHE = {}
 SELECTION_CACHE = {}
  
 sector_registry = OrderedDict()
+SECTOR_PREWARM = {}
+SECTOR_PREWARM_POOL = None
+SECTOR_PREWARM_SERIAL = count(1)
 STORY_DIR = BASE_DIR / "story_chapters"
 DEFAULT_STORY_CHAPTER = 1
+STORY_GRAPH_CACHE = {}
 
 
 def parse_catalog_lines(raw_text: str, target: dict):
@@ -455,6 +461,7 @@ def expand_sectors_for_level(player: Player, engine: I18nEngine):
             name_label = translate_with_fallback(engine, template["name_token"])
             type_label = translate_with_fallback(engine, template["type_token"])
             print(translate_with_fallback(engine, UI_TOKENS["sector_discovered"], [name_label, type_label]))
+            schedule_sector_prewarm(engine, player)
             return new_id
     return None
 
@@ -1020,32 +1027,140 @@ def apply_shard_token(engine: I18nEngine, player: Player, token_id: str, announc
     return True
 
 
-def refresh_runtime_catalog(engine: I18nEngine, player: Player):
-    layers = [ACTIVE_CATALOG.read_text()]
-    if player.current_shard_file and player.current_shard_file.exists():
-        layers.append(player.current_shard_file.read_text())
+def runtime_catalog_sources(player: Player, shard_file: Path | None):
+    sources = [ACTIVE_CATALOG]
+    if shard_file and shard_file.exists():
+        sources.append(shard_file)
     for pkg_id in player.knowledge_packages:
         pkg = KNOWLEDGE_PACKAGES.get(pkg_id)
         if pkg and pkg["file"].exists():
-            layers.append(pkg["file"].read_text())
+            sources.append(pkg["file"])
     event = get_active_world_event()
     if event:
         path = event.get("file")
         if path and path.exists():
-            layers.append(path.read_text())
+            sources.append(path)
 
     story_path = story_chapter_path(player)
     if story_path.exists():
-        layers.append(story_path.read_text())
-    payload = "\n".join(layers)
-    update_catalog_cache_from_text(payload)
-    RUNTIME_CATALOG.write_text(payload, encoding="utf-8")
-    binary_created = create_binary_package(RUNTIME_CATALOG, RUNTIME_CATALOG_BIN)
-    if binary_created and RUNTIME_CATALOG_BIN.exists():
-        engine.load_file(str(RUNTIME_CATALOG_BIN))
+        sources.append(story_path)
+    return sources
+
+
+def runtime_catalog_key(sources):
+    key = []
+    for path in sources:
+        stat = path.stat()
+        key.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def sector_catalog_path(sector_id: str, serial: int):
+    # Eigene Datei pro Job: ein abgelöster, noch laufender Job schreibt nie in die Datei seines Nachfolgers.
+    return RUNTIME_CATALOG.with_name(f"{RUNTIME_CATALOG.stem}_{sector_id}_{serial}.txt")
+
+
+def remove_runtime_catalogs():
+    for path in (RUNTIME_CATALOG, RUNTIME_CATALOG_BIN):
+        if path.exists():
+            path.unlink()
+    # Vorgewärmte Sektor-Kataloge (compile_sector_catalog, <stem>_<sektor>_<job>): statische IDs aus der
+    # Registry, dynamische DYNnn.
+    prefix = f"{RUNTIME_CATALOG.stem}_"
+    for path in BASE_DIR.glob(f"{prefix}*"):
+        sector_id, _, serial = path.stem[len(prefix):].rpartition("_")
+        if path.suffix not in (".txt", ".i18n") or not serial.isdigit():
+            continue
+        if sector_id in sector_registry or sector_id.startswith("DYN"):
+            path.unlink()
+
+
+def compile_sector_catalog(sector_id: str, serial: int, sources, lib_path: str):
+    payload = "\n".join(path.read_text() for path in sources)
+    txt_path = sector_catalog_path(sector_id, serial)
+    bin_path = txt_path.with_suffix(".i18n")
+    txt_path.write_text(payload, encoding="utf-8")
+    staged = I18nEngine(lib_path)
+    loaded = create_binary_package(txt_path, bin_path) and staged.load_file(str(bin_path))
+    if not loaded:
+        loaded = staged.load_file(str(txt_path))
+    cache = {}
+    parse_catalog_lines(payload, cache)
+    # Wie im synchronen Pfad: scheitert der Engine-Load, bleibt der bisherige Snapshot aktiv.
+    return {"engine": staged if loaded else None, "cache": cache}
+
+
+def sector_prewarm_pool():
+    global SECTOR_PREWARM_POOL
+    if SECTOR_PREWARM_POOL is None:
+        SECTOR_PREWARM_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sector-prewarm")
+    return SECTOR_PREWARM_POOL
+
+
+def reachable_sectors(player: Player):
+    # Ziele aus show_navigation: Shard-Sektoren nur mit vorhandener Datei (sonst scheitert apply_shard_token),
+    # dynamische Sektoren aus expand_sectors_for_level immer (ihr erster Refresh übernimmt den Katalog).
+    for sector_id, info in sector_registry.items():
+        if sector_id == player.current_sector_id:
+            continue
+        if info.get("dynamic"):
+            yield sector_id, info
+        elif info.get("token") and info.get("file") and Path(info["file"]).exists():
+            yield sector_id, info
+
+
+def schedule_sector_prewarm(engine: I18nEngine, player: Player):
+    reachable = dict(reachable_sectors(player))
+    for sector_id in list(SECTOR_PREWARM):
+        if sector_id not in reachable:
+            pending = SECTOR_PREWARM.pop(sector_id)
+            pending["future"].cancel()
+    for sector_id, info in reachable.items():
+        try:
+            sources = runtime_catalog_sources(player, info.get("file"))
+            key = runtime_catalog_key(sources)
+        except OSError:
+            continue
+        pending = SECTOR_PREWARM.get(sector_id)
+        if pending and pending["key"] == key:
+            continue
+        if pending:
+            pending["future"].cancel()
+        future = sector_prewarm_pool().submit(
+            compile_sector_catalog, sector_id, next(SECTOR_PREWARM_SERIAL), sources, engine.lib_path
+        )
+        SECTOR_PREWARM[sector_id] = {"key": key, "future": future}
+
+
+def take_prewarmed_catalog(sector_id: str, key):
+    pending = SECTOR_PREWARM.pop(sector_id, None)
+    if not pending or pending["key"] != key:
+        return None
+    try:
+        return pending["future"].result()
+    except Exception:
+        return None
+
+
+def refresh_runtime_catalog(engine: I18nEngine, player: Player):
+    sources = runtime_catalog_sources(player, player.current_shard_file)
+    prewarmed = take_prewarmed_catalog(player.current_sector_id, runtime_catalog_key(sources))
+    if prewarmed:
+        if prewarmed["engine"]:
+            engine.adopt(prewarmed["engine"])
+        CATALOG_CACHE.clear()
+        CATALOG_CACHE.update(prewarmed["cache"])
     else:
-        engine.load_file(str(RUNTIME_CATALOG))
+        payload = "\n".join(path.read_text() for path in sources)
+        update_catalog_cache_from_text(payload)
+        RUNTIME_CATALOG.write_text(payload, encoding="utf-8")
+        binary_created = create_binary_package(RUNTIME_CATALOG, RUNTIME_CATALOG_BIN)
+        if binary_created and RUNTIME_CATALOG_BIN.exists():
+            engine.load_file(str(RUNTIME_CATALOG_BIN))
+        else:
+            engine.load_file(str(RUNTIME_CATALOG))
     load_story_nodes(player)
+    schedule_sector_prewarm(engine, player)
 
 
 def show_navigation(engine: I18nEngine, player: Player):
@@ -1132,57 +1247,67 @@ def parse_script(script: str):
     return script, []
 
 
-def run_script(player: Player, script: str, label: str, engine: I18nEngine):
-    name, clauses = parse_script(script)
-    effects = {}
-    commands = []
+SCRIPT_PLAYER_OPS = {
+    "ATK_ADD": ("atk", "add", "+"),
+    "ATK_MUL": ("atk", "mul", "*"),
+    "HP_ADD": ("hp", "heal", "+"),
+    "REPAIR": ("hp", "heal", "+"),
+    "HP_SUB": ("hp", "drain", "-"),
+    "CRIT_MUL": ("crit_chance", "mul", "*"),
+    "CRIT_ADD": ("crit_chance", "add", "+"),
+}
+SCRIPT_EFFECT_OPS = {
+    "STAB_SUB": ("stability_penalty", "add", "-"),
+    "DEF_ADD": ("defense", "add", "+"),
+    "ENEMY_HP_ADD": ("enemy_hp_add", "add", "+"),
+    "ENEMY_HP_MUL": ("enemy_hp_mul", "mul", "*"),
+    "ENEMY_ATK_ADD": ("enemy_atk_add", "add", "+"),
+    "ENEMY_ATK_MUL": ("enemy_atk_mul", "mul", "*"),
+}
+
+
+def apply_script_op(current, op: str, val: float, max_hp=None):
+    if op == "add":
+        return current + val
+    if op == "mul":
+        return current * val
+    if op == "heal":
+        return min(max_hp, current + val)
+    return max(0, current - val)
+
+
+def iter_script_clauses(clauses):
     for clause in clauses:
         clause = clause.strip()
         if not clause or ":" not in clause:
             continue
         key, value = clause.split(":", 1)
-        key = key.strip()
-        value = value.strip()
         try:
-            val = float(value)
+            val = float(value.strip())
         except ValueError:
             continue
-        if key == "ATK_ADD":
-            player.atk += val
-            commands.append(f"{key}+{val}")
-        elif key == "ATK_MUL":
-            player.atk *= val
-            commands.append(f"{key}*{val}")
-        elif key in {"HP_ADD", "REPAIR"}:
-            player.hp = min(player.max_hp, player.hp + val)
-            commands.append(f"{key}+{val}")
-        elif key == "HP_SUB":
-            player.hp = max(0, player.hp - val)
-            commands.append(f"{key}-{val}")
-        elif key == "CRIT_MUL":
-            player.crit_chance *= val
-            commands.append(f"{key}*{val}")
-        elif key == "CRIT_ADD":
-            player.crit_chance += val
-            commands.append(f"{key}+{val}")
-        elif key == "STAB_SUB":
-            effects["stability_penalty"] = effects.get("stability_penalty", 0) + val
-            commands.append(f"{key}-{val}")
-        elif key == "DEF_ADD":
-            effects["defense"] = effects.get("defense", 0) + val
-            commands.append(f"{key}+{val}")
-        elif key == "ENEMY_HP_ADD":
-            effects["enemy_hp_add"] = effects.get("enemy_hp_add", 0) + val
-            commands.append(f"{key}+{val}")
-        elif key == "ENEMY_HP_MUL":
-            effects["enemy_hp_mul"] = effects.get("enemy_hp_mul", 1.0) * val
-            commands.append(f"{key}*{val}")
-        elif key == "ENEMY_ATK_ADD":
-            effects["enemy_atk_add"] = effects.get("enemy_atk_add", 0) + val
-            commands.append(f"{key}+{val}")
-        elif key == "ENEMY_ATK_MUL":
-            effects["enemy_atk_mul"] = effects.get("enemy_atk_mul", 1.0) * val
-            commands.append(f"{key}*{val}")
+        yield key.strip(), val
+
+
+def apply_script_clauses(player: Player, clauses):
+    effects = {}
+    commands = []
+    for key, val in iter_script_clauses(clauses):
+        if key in SCRIPT_PLAYER_OPS:
+            attr, op, symbol = SCRIPT_PLAYER_OPS[key]
+            setattr(player, attr, apply_script_op(getattr(player, attr), op, val, player.max_hp))
+        elif key in SCRIPT_EFFECT_OPS:
+            name, op, symbol = SCRIPT_EFFECT_OPS[key]
+            effects[name] = apply_script_op(effects.get(name, 1.0 if op == "mul" else 0), op, val)
+        else:
+            continue
+        commands.append(f"{key}{symbol}{val}")
+    return effects, commands
+
+
+def run_script(player: Player, script: str, label: str, engine: I18nEngine):
+    name, clauses = parse_script(script)
+    effects, commands = apply_script_clauses(player, clauses)
     detail = f" ({name})" if name else ""
     print(
         translate_with_fallback(
@@ -1702,12 +1827,9 @@ def story_chapter_path(player: Player):
     return STORY_DIR / f"story_chapter_{chapter}.txt"
 
 
-def parse_story_nodes(chapter_num: int):
-    path = STORY_DIR / f"story_chapter_{chapter_num}.txt"
+def parse_story_text(raw_text: str):
     nodes = {}
-    if not path.exists():
-        return nodes
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in raw_text.splitlines():
         line = line.strip()
         if not line or line.startswith("#") or line.startswith("@"):
             continue
@@ -1751,6 +1873,69 @@ def parse_story_nodes(chapter_num: int):
     return nodes
 
 
+def story_reachable_nodes(nodes: dict, roots):
+    reachable = set()
+    pending = [key for key in roots if key in nodes]
+    while pending:
+        key = pending.pop()
+        if key in reachable:
+            continue
+        reachable.add(key)
+        for choice in nodes[key]["choices"]:
+            if choice["next"] in nodes and choice["next"] not in reachable:
+                pending.append(choice["next"])
+    return reachable
+
+
+def compile_story_chapter(chapter_num: int):
+    path = STORY_DIR / f"story_chapter_{chapter_num}.txt"
+    try:
+        stat = path.stat()
+    except OSError:
+        STORY_GRAPH_CACHE.pop(chapter_num, None)
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = STORY_GRAPH_CACHE.get(chapter_num)
+    if cached and cached["signature"] == signature:
+        return cached
+    nodes = parse_story_text(path.read_text(encoding="utf-8"))
+    edges = {key: [choice["next"] for choice in node["choices"]] for key, node in nodes.items()}
+    targets = {target for nexts in edges.values() for target in nexts}
+    roots = [key for key in nodes if key not in targets] or list(nodes)[:1]
+    graph = {
+        "chapter": chapter_num,
+        "signature": signature,
+        "nodes": nodes,
+        "edges": edges,
+        "roots": roots,
+        "reachable": story_reachable_nodes(nodes, roots),
+    }
+    STORY_GRAPH_CACHE[chapter_num] = graph
+    return graph
+
+
+def parse_story_nodes(chapter_num: int):
+    graph = compile_story_chapter(chapter_num)
+    return graph["nodes"] if graph else {}
+
+
+def prefetch_story_neighbours(engine: I18nEngine, player: Player, node: dict):
+    next_chapter = node.get("chapter")
+    if next_chapter and next_chapter != player.story_chapter:
+        # Kapitelwechsel: der neue Katalog wird erst mit dem Refresh geladen, daher nur den Graphen vorwärmen.
+        compile_story_chapter(next_chapter)
+        return
+    tokens = []
+    for choice in node["choices"]:
+        target = player.story_nodes.get(choice["next"])
+        if not target:
+            continue
+        tokens.append(target["text_token"])
+        tokens.extend(entry["label_token"] for entry in target["choices"])
+    if tokens:
+        engine.translate_many(list(dict.fromkeys(tokens)))
+
+
 def load_story_nodes(player: Player):
     player.story_nodes = parse_story_nodes(player.story_chapter)
 
@@ -1783,6 +1968,7 @@ def play_story_sequence(engine: I18nEngine, player: Player):
             )
         )
         apply_story_effects(player, node)
+        prefetch_story_neighbours(engine, player, node)
         if not node["choices"]:
             player.story_history.append((node["node_key"], "Abschluss"))
             player.story_state = "completed"
@@ -2076,13 +2262,38 @@ MYCEL_BOSS_TOKENS = [
 ]
 
 
+BATTLE_STABILITY_RANGE = (50, 100)
+BATTLE_BOSS_STABILITY = 30
+BATTLE_STABILITY_FLOOR = 15
+BATTLE_PHYSICS_THRESHOLD = 75
+BATTLE_PHYSICS_BONUS_RANGE = (5, 20)
+BATTLE_ATTACK_SPREAD = 2
+BATTLE_HEAVY_MISS_CHANCE = 0.4
+BATTLE_HEAVY_MULTIPLIER = 1.8
+BATTLE_REPAIR_HP = 25
+
+
+def enemy_base_stats(player: Player, is_boss=False):
+    if is_boss:
+        return 250, 15
+    return 40 + (player.lvl * 10), 8 + player.lvl
+
+
+def apply_level_up(player: Player):
+    player.lvl += 1
+    player.atk += 5
+    player.max_hp += 20
+    player.hp = player.max_hp
+    player.xp = 0
+
+
 def run_battle(player, engine, is_boss=False):
     # GPU-CUBE PHYSIK LOGIK
-    stability = random.randint(50, 100)
+    stability = random.randint(*BATTLE_STABILITY_RANGE)
     physics_bonus = 0
     if is_boss:
         print("\n" + engine.translate("000B00"))
-        stability = 30
+        stability = BATTLE_BOSS_STABILITY
 
     event = get_active_world_event()
     if event:
@@ -2115,7 +2326,7 @@ def run_battle(player, engine, is_boss=False):
             total_module_penalty += effects.get("stability_penalty", 0)
     story_penalty = player.story_effects.get("stab_sub", 0) if player.story_effects else 0
 
-    stability = max(15, stability - total_module_penalty - story_penalty)
+    stability = max(BATTLE_STABILITY_FLOOR, stability - total_module_penalty - story_penalty)
     print("\n" + engine.translate("000C10", [int(stability)]))
 
     hp_add = item_effects.get("hp_add", 0)
@@ -2125,14 +2336,13 @@ def run_battle(player, engine, is_boss=False):
     if hp_sub:
         player.hp = max(0, player.hp - hp_sub)
 
-    if stability < 75:
-        physics_bonus = random.randint(5, 20)
+    if stability < BATTLE_PHYSICS_THRESHOLD:
+        physics_bonus = random.randint(*BATTLE_PHYSICS_BONUS_RANGE)
         print(engine.translate("000C12", [int(physics_bonus)]))
 
     enemy_token = random.choice(MYCEL_BOSS_TOKENS) if is_boss else random.choice(MYCEL_ENEMY_TOKENS)
     e_name = translate_with_fallback(engine, enemy_token)
-    e_hp = 250 if is_boss else 40 + (player.lvl * 10)
-    e_atk = 8 + player.lvl if not is_boss else 15
+    e_hp, e_atk = enemy_base_stats(player, is_boss)
     boss_phase_triggered = not is_boss
     original_hp = e_hp
     
@@ -2183,12 +2393,12 @@ def run_battle(player, engine, is_boss=False):
         atk_mul = item_effects.get("atk_mul", 1.0)
         current_atk = int((player.atk + atk_add + physics_bonus) * atk_mul * trait_multiplier)
         if choice == "1":
-            dmg = current_atk + random.randint(-2, 2)
-        elif choice == "2" and random.random() > 0.4:
-            dmg = int(current_atk * 1.8)
+            dmg = current_atk + random.randint(-BATTLE_ATTACK_SPREAD, BATTLE_ATTACK_SPREAD)
+        elif choice == "2" and random.random() > BATTLE_HEAVY_MISS_CHANCE:
+            dmg = int(current_atk * BATTLE_HEAVY_MULTIPLIER)
             print(translate_with_fallback(engine, UI_TOKENS["full_hit"]))
         elif choice == "3":
-            player.hp = min(player.max_hp, player.hp + 25)
+            player.hp = min(player.max_hp, player.hp + BATTLE_REPAIR_HP)
             print(translate_with_fallback(engine, UI_TOKENS["repair_action"]))
 
         if dmg > 0:
@@ -2235,11 +2445,7 @@ def run_battle(player, engine, is_boss=False):
             print("\n" + engine.translate("000D03", [b]))
             player.quest_kills, player.quest_target = 0, player.quest_target + 5
         if player.xp >= 100:
-            player.lvl += 1
-            player.atk += 5
-            player.max_hp += 20
-            player.hp = player.max_hp
-            player.xp = 0
+            apply_level_up(player)
             print(engine.translate("000103", [player.name, int(player.lvl), int(player.atk)]))
         gather_resources(engine, player)
         trigger_story_progress(engine, player)
@@ -2277,10 +2483,7 @@ def select_game_catalog():
 def main():
     catalog_path = select_game_catalog()
     set_active_catalog_context(catalog_path)
-    if RUNTIME_CATALOG.exists():
-        RUNTIME_CATALOG.unlink()
-    if RUNTIME_CATALOG_BIN.exists():
-        RUNTIME_CATALOG_BIN.unlink()
+    remove_runtime_catalogs()
     try:
         engine = I18nEngine()
         engine.load_file(str(catalog_path))
@@ -1,8 +1,69 @@
+import array
+import asyncio
+import concurrent.futures
 import ctypes
+import gc
+import itertools
+import multiprocessing
 import os
+import select
+import struct
 import threading
 import platform
 
+CATALOG_SUFFIXES = (".txt", ".i18n", ".bin", ".i18nb", ".i18ns")
+RELOAD_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p)
+BATCH_NO_COUNT = -2147483648
+ARG_STRING, ARG_INT, ARG_DOUBLE, ARG_TOKEN_ID, ARG_TOKEN = range(5)
+
+
+class _ArgValue(ctypes.Union):
+    _fields_ = [("str", ctypes.c_char_p), ("i", ctypes.c_int64), ("d", ctypes.c_double), ("id", ctypes.c_uint64)]
+
+
+class I18nArg(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_int32), ("precision", ctypes.c_int32), ("value", _ArgValue)]
+
+
+class TokenRef:
+    """Argument für translate_ex, das als Token aufgelöst wird (str = Token, int = Token-ID)."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _typed_arg(value):
+    arg = I18nArg(ARG_STRING, -1)
+    if isinstance(value, TokenRef):
+        if isinstance(value.value, int):
+            arg.type, arg.value.id = ARG_TOKEN_ID, value.value
+        else:
+            arg.type, arg.value.str = ARG_TOKEN, str(value.value).encode("utf-8")
+    elif isinstance(value, int):
+        arg.type, arg.value.i = ARG_INT, value
+    elif isinstance(value, float):
+        arg.type, arg.value.d = ARG_DOUBLE, value
+    else:
+        arg.value.str = str(value).encode("utf-8")
+    return arg
+
+
+class _NativeEngine:
+    """Besitzt einen nativen Engine-Zeiger. Freigegeben wird erst, wenn keine Referenz mehr existiert, d. h. auch
+    laufende Aufrufe (lokale Referenz) ein adopt() des Besitzers überleben."""
+    __slots__ = ("lib", "ptr")
+
+    def __init__(self, lib, ptr):
+        self.lib = lib
+        self.ptr = ptr
+
+    def __del__(self):
+        if self.ptr:
+            self.lib.i18n_free(self.ptr)
+            self.ptr = None
+
+
 class I18nEngine:
     def __init__(self, lib_path=None):
         # Falls kein Pfad angegeben wurde, wähle die passende Endung für das OS
@@ -14,7 +75,7 @@ class I18nEngine:
         if not os.path.exists(lib_path):
             raise FileNotFoundError(f"Library nicht gefunden: {lib_path}")
             
-        self._lib_path = lib_path
+        self.lib_path = lib_path
         self.lib = ctypes.CDLL(lib_path)
         
         # Deine originalen Signaturen
@@ -28,20 +89,229 @@ class I18nEngine:
             ctypes.POINTER(ctypes.c_char_p), ctypes.c_int,
             ctypes.c_char_p, ctypes.c_int
         ]
+        self.lib.i18n_load_locale_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        self.lib.i18n_set_fallback_chain.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        self.lib.i18n_get_locale_stats.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)
+        ]
+        self.lib.i18n_load_bundle.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        self.lib.i18n_select_locale.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        self.lib.i18n_apply_patch.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        self.lib.i18n_set_cache_dir.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        self.lib.i18n_reload_if_changed.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_get_generation.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_get_generation.restype = ctypes.c_uint64
+        self.lib.i18n_preload.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_set_result_cache.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+        self.lib.i18n_get_result_cache_stats.argtypes = [ctypes.c_void_p] + [ctypes.POINTER(ctypes.c_uint64)] * 4
+        self.lib.i18n_translate_ex.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(I18nArg), ctypes.c_int, ctypes.c_char_p, ctypes.c_int
+        ]
+        self.lib.i18n_translate_plural_ex.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(I18nArg), ctypes.c_int,
+            ctypes.c_char_p, ctypes.c_int
+        ]
+        self.lib.i18n_translate_plural_column.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int)
+        ]
+        self.lib.i18n_clone.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_clone.restype = ctypes.c_void_p
+        self.lib.i18n_pin_snapshot.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_pin_snapshot.restype = ctypes.c_void_p
+        self.lib.i18n_unpin_snapshot.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_pinned_generation.argtypes = [ctypes.c_void_p]
+        self.lib.i18n_pinned_generation.restype = ctypes.c_uint64
+        self.lib.i18n_translate_pinned.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_char_p), ctypes.c_int,
+            ctypes.c_char_p, ctypes.c_int
+        ]
+        self.lib.i18n_translate_plural_pinned.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_char_p), ctypes.c_int,
+            ctypes.c_char_p, ctypes.c_int
+        ]
+        self.lib.i18n_reload_async.argtypes = [ctypes.c_void_p, RELOAD_CALLBACK, ctypes.c_void_p]
+        self.lib.i18n_translate_batch.argtypes = [
+            ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_char_p),
+            ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int)
+        ]
         
-        self._ptr = self.lib.i18n_new()
+        self._native = _NativeEngine(self.lib, self.lib.i18n_new())
         self._ptr_lock = threading.RLock()
         self._cache = {}
         self._cache_lock = threading.RLock()
+        self._locale_files = set()
+        self._current_path = None
+        self._reload_callbacks = {}
+
+    @property
+    def _ptr(self):
+        return self._native.ptr
+
+    def _acquire(self):
+        # Aufrufe außerhalb von _ptr_lock halten die Instanz selbst fest, nicht nur ihren Zeiger.
+        with self._ptr_lock:
+            return self._native
 
     def load_file(self, path: str):
         path_bytes = os.path.abspath(path).encode("utf-8")
         with self._ptr_lock:
             success = self.lib.i18n_load_txt_file(self._ptr, path_bytes, 0) != -1
         if success:
+            self._current_path = os.path.abspath(path)
+            self.invalidate_cache()
+        return success
+
+    def set_cache_dir(self, path: str = ""):
+        # Kompilierte Snapshots der .txt-Kataloge zwischenspeichern ("" = aus).
+        path_bytes = os.path.abspath(path).encode("utf-8") if path else b""
+        with self._ptr_lock:
+            return self.lib.i18n_set_cache_dir(self._ptr, path_bytes) != -1
+
+    def load_locale_file(self, path: str):
+        # Lädt eine weitere Locale als Fallback-Ebene (Kette über `@meta fallback` oder set_fallback_chain).
+        path_bytes = os.path.abspath(path).encode("utf-8")
+        with self._ptr_lock:
+            success = self.lib.i18n_load_locale_file(self._ptr, path_bytes, 0) != -1
+        if success:
+            self._locale_files.add(os.path.abspath(path))
             self.invalidate_cache()
         return success
 
+    def load_bundle(self, path: str, locale: str = ""):
+        path_bytes = os.path.abspath(path).encode("utf-8")
+        with self._ptr_lock:
+            success = self.lib.i18n_load_bundle(self._ptr, path_bytes, locale.encode("utf-8"), 0) != -1
+        if success:
+            self._current_path = os.path.abspath(path)
+            self.invalidate_cache()
+        return success
+
+    def select_locale(self, locale: str):
+        # Wechselt innerhalb des gemappten Bundles, ohne die Datei erneut zu lesen.
+        with self._ptr_lock:
+            success = self.lib.i18n_select_locale(self._ptr, locale.encode("utf-8")) != -1
+        if success:
+            self.invalidate_cache()
+        return success
+
+    def apply_patch(self, path: str):
+        # Delta-Patch auf den geladenen Katalog anwenden (Basis- und Ergebnis-Hash werden geprüft).
+        path_bytes = os.path.abspath(path).encode("utf-8")
+        with self._ptr_lock:
+            success = self.lib.i18n_apply_patch(self._ptr, path_bytes) != -1
+        if success:
+            self.invalidate_cache()
+        return success
+
+    def set_fallback_chain(self, chain):
+        if not isinstance(chain, str):
+            chain = ",".join(chain)
+        with self._ptr_lock:
+            success = self.lib.i18n_set_fallback_chain(self._ptr, chain.encode("utf-8")) != -1
+        if success:
+            self.invalidate_cache()
+        return success
+
+    def locale_stats(self, locale: str):
+        hits = ctypes.c_uint64()
+        misses = ctypes.c_uint64()
+        with self._ptr_lock:
+            rc = self.lib.i18n_get_locale_stats(self._ptr, locale.encode("utf-8"),
+                                                ctypes.byref(hits), ctypes.byref(misses))
+        if rc != 0:
+            return None
+        return hits.value, misses.value
+
+    def adopt(self, other: "I18nEngine"):
+        # Übernimmt die fertig geladene Instanz von `other` (Snapshot-Swap), `other` erhält die alte.
+        with self._ptr_lock, other._ptr_lock:
+            self._native, other._native = other._native, self._native
+            self._current_path, other._current_path = other._current_path, self._current_path
+            self._locale_files, other._locale_files = other._locale_files, self._locale_files
+        self.invalidate_cache()
+        other.invalidate_cache()
+
+    def reload_if_changed(self):
+        # True nur bei neuem Snapshot; unveränderte Dateien lassen den Cache unangetastet.
+        with self._ptr_lock:
+            rc = self.lib.i18n_reload_if_changed(self._ptr)
+        if rc == 1:
+            self.invalidate_cache()
+        return rc == 1
+
+    def reload_future(self):
+        # Native Reload im Worker-Thread der Engine; das Future wird dort erfüllt (True = neuer Snapshot aktiv).
+        future = concurrent.futures.Future()
+
+        def on_done(_user, status, error):
+            self._reload_callbacks.pop(id(callback), None)
+            if status == 0:
+                self.invalidate_cache()
+                future.set_result(True)
+            else:
+                future.set_exception(RuntimeError(error.decode("utf-8") if error else "Reload fehlgeschlagen"))
+
+        callback = RELOAD_CALLBACK(on_done)
+        # Referenz halten, bis die Engine den Callback aufgerufen hat.
+        self._reload_callbacks[id(callback)] = callback
+        with self._ptr_lock:
+            rc = self.lib.i18n_reload_async(self._ptr, callback, None)
+        if rc != 0:
+            self._reload_callbacks.pop(id(callback), None)
+            future.set_exception(RuntimeError(self.last_error() or "Reload nicht möglich"))
+        return future
+
+    async def reload_async(self):
+        return await asyncio.wrap_future(self.reload_future())
+
+    def current_path(self):
+        return self._current_path
+
+    def generation(self):
+        with self._ptr_lock:
+            return self.lib.i18n_get_generation(self._ptr)
+
+    def set_result_cache(self, max_bytes: int):
+        # Nativer LRU-Cache für alle Aufrufer dieser Engine (0 = aus); wird bei jedem neuen Snapshot geleert.
+        with self._ptr_lock:
+            return self.lib.i18n_set_result_cache(self._ptr, int(max_bytes)) == 0
+
+    def result_cache_stats(self):
+        values = [ctypes.c_uint64() for _ in range(4)]
+        with self._ptr_lock:
+            self.lib.i18n_get_result_cache_stats(self._ptr, *[ctypes.byref(v) for v in values])
+        return dict(zip(("hits", "misses", "evictions", "bytes"), (v.value for v in values)))
+
+    def clone(self):
+        # Eigene Instanz (z. B. pro Thread), die die Snapshots dieser Engine teilt statt den Katalog neu zu laden.
+        twin = I18nEngine(self.lib_path)
+        with self._ptr_lock:
+            ptr = self.lib.i18n_clone(self._ptr)
+            twin._current_path = self._current_path
+            twin._locale_files = set(self._locale_files)
+        if not ptr:
+            raise RuntimeError(self.last_error() or "Klonen fehlgeschlagen")
+        twin._native = _NativeEngine(twin.lib, ptr)
+        return twin
+
+    def preload(self):
+        # Kompletten Katalog entpackt im Speicher halten (vor fork(), siehe TranslationPool).
+        with self._ptr_lock:
+            return self.lib.i18n_preload(self._ptr) == 0
+
+    def watch(self, paths=(), debounce=0.2, poll_interval=1.0, callback=None):
+        # Ein langlebiger Watcher für den geladenen Katalog, alle Locale-Dateien und zusätzliche Pfade.
+        watcher = CatalogWatcher(self, paths, debounce=debounce, poll_interval=poll_interval)
+        if callback is not None:
+            watcher.subscribe(callback)
+        watcher.start()
+        return watcher
+
     def hot_reload_file(self, path: str):
         def worker():
             if not self.load_file(path):
@@ -65,8 +335,8 @@ class I18nEngine:
 
         c_args = (ctypes.c_char_p * len(args))(*[a.encode("utf-8") for a in args_tuple])
         
-        with self._ptr_lock:
-            ptr = self._ptr
+        native = self._acquire()
+        ptr = native.ptr
         
         size = self.lib.i18n_translate(ptr, token_upper.encode("utf-8"), c_args, len(args), None, 0)
         
@@ -81,16 +351,551 @@ class I18nEngine:
             self._cache[key] = result
         return result
 
+    def translate_ex(self, token: str, args=None, count=None) -> str:
+        # Typisierte Argumente: str/float/int werden literal eingesetzt, nur TokenRef wird aufgelöst.
+        args = list(args or ())
+        c_args = (I18nArg * len(args))(*[_typed_arg(a) for a in args])
+        token_bytes = str(token).upper().encode("utf-8")
+        extra = () if count is None else (int(count),)
+        fn = self.lib.i18n_translate_ex if count is None else self.lib.i18n_translate_plural_ex
+        native = self._acquire()
+        ptr = native.ptr
+        buf = ctypes.create_string_buffer(256)
+        size = fn(ptr, token_bytes, *extra, c_args, len(args), buf, len(buf))
+        if size >= len(buf):
+            buf = ctypes.create_string_buffer(size + 1)
+            size = fn(ptr, token_bytes, *extra, c_args, len(args), buf, len(buf))
+        if size < 0:
+            return f"⟦{token_bytes.decode('utf-8')}⟧"
+        return buf.value.decode("utf-8").replace("\\n", "\n")
+
+    def translate_batch(self, requests):
+        # requests: Folge von (token, args, count) mit count=None für Nicht-Plural. Ein nativer Aufruf für alle Cache-Misses.
+        results = [None] * len(requests)
+        misses = []
+        with self._cache_lock:
+            for i, (token, args, count) in enumerate(requests):
+                key = (str(token).upper(), tuple(str(a) for a in (args or ())))
+                cached = self._cache.get(key) if count is None else None
+                if cached is None:
+                    misses.append((i, key, count))
+                else:
+                    results[i] = cached
+        if not misses:
+            return results
+
+        n = len(misses)
+        tokens = (ctypes.c_char_p * n)(*[key[0].encode("utf-8") for _, key, _ in misses])
+        counts = (ctypes.c_int * n)(*[BATCH_NO_COUNT if c is None else int(c) for _, _, c in misses])
+        arg_counts = (ctypes.c_int * n)(*[len(key[1]) for _, key, _ in misses])
+        flat = [a.encode("utf-8") for _, key, _ in misses for a in key[1]]
+        c_args = (ctypes.c_char_p * max(len(flat), 1))(*flat)
+        lengths = (ctypes.c_int * n)()
+        size = 256 * n
+        native = self._acquire()
+        ptr = native.ptr
+        while True:
+            buf = ctypes.create_string_buffer(size)
+            needed = self.lib.i18n_translate_batch(ptr, n, tokens, counts, arg_counts, c_args, buf, size, lengths)
+            if needed < 0 or needed <= size:
+                break
+            size = needed
+
+        offset = 0
+        raw = buf.raw
+        with self._cache_lock:
+            for j, (i, key, count) in enumerate(misses):
+                length = lengths[j]
+                if needed < 0 or length < 0:
+                    results[i] = f"⟦{key[0]}⟧"
+                    continue
+                text = raw[offset:offset + length].decode("utf-8").replace("\\n", "\n")
+                offset += length + 1
+                results[i] = text
+                if count is None:
+                    self._cache[key] = text
+        return results
+
+    def pin(self):
+        """Hält den aktuellen Katalogstand fest: `with engine.pin() as page: page.translate(...)`."""
+        return PinnedSnapshot(self)
+
+    def translate_plural_column(self, token: str, counts, arg_columns=()):
+        """Eine Pluralübersetzung pro Zeile. counts: Ganzzahl-Buffer (z. B. NumPy int32/int64, array('q')) oder
+        Sequenz; arg_columns: Spalten mit je len(counts) Argumenten. Liefert eine Liste von Strings."""
+        try:
+            view = memoryview(counts)
+        except TypeError:
+            view = memoryview(array.array("q", counts))
+        if view.ndim != 1 or not view.c_contiguous or view.format.lstrip("@=<") not in ("i", "l", "q") \
+                or view.itemsize not in (4, 8):
+            view = memoryview(array.array("q", (int(c) for c in counts)))
+        rows = len(view)
+        try:
+            c_counts = (ctypes.c_char * view.nbytes).from_buffer(view)
+        except TypeError:
+            c_counts = (ctypes.c_char * view.nbytes).from_buffer_copy(view)
+        columns = [list(col) for col in arg_columns]
+        if any(len(col) != rows for col in columns):
+            raise ValueError("Jede Argumentspalte braucht so viele Einträge wie counts.")
+        flat = [str(v).encode("utf-8") for col in columns for v in col]
+        c_args = (ctypes.c_char_p * max(len(flat), 1))(*flat)
+        lengths = (ctypes.c_int * max(rows, 1))()
+        token_bytes = str(token).upper().encode("utf-8")
+        native = self._acquire()
+        ptr = native.ptr
+        size = 32 * rows + 1
+        while True:
+            buf = ctypes.create_string_buffer(size)
+            needed = self.lib.i18n_translate_plural_column(
+                ptr, token_bytes, c_counts, view.itemsize, rows, c_args, len(columns), buf, size, lengths
+            )
+            if needed < 0:
+                return [f"⟦{token_bytes.decode('utf-8')}⟧"] * rows
+            if needed <= size:
+                break
+            size = needed
+        raw = buf.raw
+        out = []
+        offset = 0
+        for length in lengths[:rows]:
+            out.append(raw[offset:offset + length].decode("utf-8").replace("\\n", "\n"))
+            offset += length + 1
+        return out
+
+    def translate_many(self, tokens, args=None):
+        # Ein Lock für den ganzen Batch: Prefetches füllen den Cache ohne zwischenzeitlichen Reload.
+        with self._ptr_lock:
+            return [self.translate(token, args) for token in tokens]
+
     def invalidate_cache(self):
         with self._cache_lock:
             self._cache.clear()
 
     def last_error(self):
-        if not hasattr(self, "_ptr") or not self._ptr:
+        if not hasattr(self, "_native") or not self._ptr:
             return "Engine nicht initialisiert"
         err_ptr = self.lib.i18n_last_error(self._ptr)
         return err_ptr.decode("utf-8") if err_ptr else ""
 
+class PinnedSnapshot:
+    """Alle Übersetzungen laufen gegen denselben Snapshot, auch wenn währenddessen ein Reload landet."""
+
+    def __init__(self, engine: I18nEngine):
+        self.engine = engine
+        self.lib = engine.lib
+        self._pin = None
+        # Der Pin benutzt die native Engine, auf der er erzeugt wurde (Fehlerzustand); sie muss ihn überleben,
+        # auch wenn engine per adopt() inzwischen eine andere Instanz hält.
+        with engine._ptr_lock:
+            self._native = engine._native
+            self._pin = self.lib.i18n_pin_snapshot(self._native.ptr)
+        if not self._pin:
+            raise RuntimeError(engine.last_error() or "Kein Katalog geladen")
+
+    @property
+    def generation(self):
+        return self.lib.i18n_pinned_generation(self._pin)
+
+    def _call(self, fn, token, extra, args):
+        args_tuple = tuple(str(a) for a in (args or ()))
+        c_args = (ctypes.c_char_p * len(args_tuple))(*[a.encode("utf-8") for a in args_tuple])
+        token_bytes = str(token).upper().encode("utf-8")
+        size = fn(self._pin, token_bytes, *extra, c_args, len(args_tuple), None, 0)
+        if size < 0:
+            return f"⟦{str(token).upper()}⟧"
+        buf = ctypes.create_string_buffer(size + 1)
+        fn(self._pin, token_bytes, *extra, c_args, len(args_tuple), buf, size + 1)
+        return buf.value.decode("utf-8").replace("\\n", "\n")
+
+    def translate(self, token: str, args=None) -> str:
+        return self._call(self.lib.i18n_translate_pinned, token, (), args)
+
+    def translate_plural(self, token: str, count: int, args=None) -> str:
+        return self._call(self.lib.i18n_translate_plural_pinned, token, (int(count),), args)
+
+    def close(self):
+        if self._pin:
+            self.lib.i18n_unpin_snapshot(self._pin)
+            self._pin = None
+        self._native = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def __del__(self):
-        if hasattr(self, "_ptr") and self._ptr:
-            self.lib.i18n_free(self._ptr)
\ No newline at end of file
+        self.close()
+
+class CatalogWatcher:
+    """Beobachtet Katalogdateien und -verzeichnisse und lädt nach einer Ruhephase (debounce) neu.
+
+    Linux nutzt inotify auf den Elternverzeichnissen (Editoren ersetzen Dateien per rename),
+    sonst wird per stat gepollt. Nachgeladen wird im Watcher-Thread; Subscriber erhalten die
+    neue Generation erst, wenn der Snapshot aktiv ist. Geänderte Katalogdateien, die die Engine
+    nicht geladen hat (z. B. neue Dateien in beobachteten Verzeichnissen), lösen keinen Reload aus,
+    sondern gehen als Pfadliste an `subscribe_files`.
+    """
+
+    _IN_MODIFY = 0x002
+    _IN_ATTRIB = 0x004
+    _IN_CLOSE_WRITE = 0x008
+    _IN_MOVED_TO = 0x080
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, engine: I18nEngine, paths=(), debounce=0.2, poll_interval=1.0, use_inotify=None):
+        self.engine = engine
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._extra = {os.path.abspath(p) for p in paths}
+        self._subscribers = []
+        self._file_subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._use_inotify = platform.system() == "Linux" if use_inotify is None else use_inotify
+
+    def subscribe(self, callback):
+        return self._add_subscriber(self._subscribers, callback)
+
+    def subscribe_files(self, callback):
+        # callback(paths): sortierte Liste geänderter, nicht geladener Katalogdateien.
+        return self._add_subscriber(self._file_subscribers, callback)
+
+    def _add_subscriber(self, subscribers, callback):
+        with self._lock:
+            subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in subscribers:
+                    subscribers.remove(callback)
+
+        return unsubscribe
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="i18n-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _targets(self):
+        # Dateien: Hauptkatalog + Locales + explizite Dateien; Verzeichnisse: alle Katalogdateien darin.
+        files = set(self.engine._locale_files)
+        current = self.engine.current_path()
+        if current:
+            files.add(current)
+        dirs = set()
+        for path in self._extra:
+            (dirs if os.path.isdir(path) else files).add(path)
+        return files, dirs
+
+    def _matches(self, path, files, dirs):
+        return path in files or (os.path.dirname(path) in dirs and path.endswith(CATALOG_SUFFIXES))
+
+    def _run(self):
+        inotify = self._open_inotify() if self._use_inotify else None
+        try:
+            while not self._stop.is_set():
+                changed = self._wait_inotify(inotify) if inotify else self._wait_poll()
+                if changed and not self._stop.is_set():
+                    self._apply(changed)
+        finally:
+            if inotify:
+                os.close(inotify[0])
+
+    def _open_inotify(self):
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return fd, libc, {}
+
+    def _sync_watches(self, inotify, files, dirs):
+        fd, libc, watches = inotify
+        mask = (self._IN_MODIFY | self._IN_ATTRIB | self._IN_CLOSE_WRITE | self._IN_MOVED_TO
+                | self._IN_CREATE | self._IN_DELETE)
+        for directory in {os.path.dirname(f) for f in files} | dirs:
+            if directory in watches.values() or not os.path.isdir(directory):
+                continue
+            wd = libc.inotify_add_watch(fd, directory.encode("utf-8"), mask)
+            if wd >= 0:
+                watches[wd] = directory
+
+    def _read_events(self, inotify, timeout):
+        fd, _, watches = inotify
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        paths = []
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(data):
+            wd, _, _, length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+            offset += length
+            if wd in watches and name:
+                paths.append(os.path.join(watches[wd], name))
+        return paths
+
+    def _wait_inotify(self, inotify):
+        files, dirs = self._targets()
+        self._sync_watches(inotify, files, dirs)
+        changed = {p for p in self._read_events(inotify, self.poll_interval) if self._matches(p, files, dirs)}
+        # Debounce: sammeln, bis debounce Sekunden lang nichts Relevantes mehr kommt.
+        while changed and not self._stop.is_set():
+            more = {p for p in self._read_events(inotify, self.debounce) if self._matches(p, files, dirs)}
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def _snapshot_stat(self, files, dirs):
+        state = {}
+        for path in files:
+            try:
+                st = os.stat(path)
+                state[path] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                state[path] = None
+        for directory in dirs:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith(CATALOG_SUFFIXES):
+                    path = os.path.join(directory, name)
+                    try:
+                        st = os.stat(path)
+                        state[path] = (st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        pass
+        return state
+
+    def _wait_poll(self):
+        files, dirs = self._targets()
+        before = getattr(self, "_poll_state", None)
+        if before is None:
+            before = self._snapshot_stat(files, dirs)
+        if self._stop.wait(self.poll_interval):
+            return set()
+        after = self._snapshot_stat(files, dirs)
+        changed = {p for p in set(before) | set(after) if before.get(p) != after.get(p)}
+        while changed and not self._stop.wait(self.debounce):
+            settled = self._snapshot_stat(files, dirs)
+            if settled == after:
+                break
+            changed |= {p for p in set(after) | set(settled) if after.get(p) != settled.get(p)}
+            after = settled
+        self._poll_state = after
+        return changed
+
+    def _apply(self, changed):
+        engine = self.engine
+        before = engine.generation()
+        current = engine.current_path()
+        locales = set(engine._locale_files)
+        for path in sorted(changed & locales):
+            if os.path.exists(path) and not engine.load_locale_file(path):
+                print(f"[CatalogWatcher] Locale reload failed: {engine.last_error()}")
+        if current in changed and not engine.reload_if_changed() and engine.last_error():
+            print(f"[CatalogWatcher] Reload failed: {engine.last_error()}")
+        others = sorted(changed - locales - {current})
+        if others:
+            self._notify(self._file_subscribers, others)
+        generation = engine.generation()
+        if generation != before:
+            self._notify(self._subscribers, generation)
+
+    def _notify(self, subscribers, value):
+        with self._lock:
+            subscribers = list(subscribers)
+        for callback in subscribers:
+            try:
+                callback(value)
+            except Exception as exc:  # Subscriber-Fehler dürfen den Watcher nicht beenden.
+                print(f"[CatalogWatcher] Subscriber failed: {exc}")
+
+
+class AsyncI18nEngine:
+    """asyncio-Frontend: gleichzeitige `await translate(...)` einer Loop-Iteration werden zu einem
+    nativen Batch-Aufruf gebündelt; Laden läuft im Executor, Reload nativ asynchron."""
+
+    def __init__(self, engine: I18nEngine = None, lib_path=None, executor=None, max_batch=1024):
+        self.engine = engine if engine is not None else I18nEngine(lib_path)
+        self.max_batch = max_batch
+        self._executor = executor
+        self._pending = []
+        self._flush_handle = None
+        self._listeners = set()
+        self._watcher = None
+
+    async def translate(self, token: str, args=None) -> str:
+        return await self._enqueue(token, args, None)
+
+    async def translate_plural(self, token: str, count: int, args=None) -> str:
+        return await self._enqueue(token, args, count)
+
+    def _enqueue(self, token, args, count):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((token, args, count, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            # Flush nach allen bereits lauffähigen Coroutinen dieser Iteration.
+            self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            results = self.engine.translate_batch([(token, args, count) for token, args, count, _ in batch])
+        except Exception as exc:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (*_, future), text in zip(batch, results):
+            if not future.done():
+                future.set_result(text)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def load_file(self, path: str) -> bool:
+        ok = await self._run(self.engine.load_file, path)
+        if ok:
+            self._publish(self.engine.generation())
+        return ok
+
+    async def load_locale_file(self, path: str) -> bool:
+        ok = await self._run(self.engine.load_locale_file, path)
+        if ok:
+            self._publish(self.engine.generation())
+        return ok
+
+    async def reload(self) -> bool:
+        ok = await self.engine.reload_async()
+        self._publish(self.engine.generation())
+        return ok
+
+    async def reload_if_changed(self) -> bool:
+        changed = await self._run(self.engine.reload_if_changed)
+        if changed:
+            self._publish(self.engine.generation())
+        return changed
+
+    def watch(self, paths=(), debounce=0.2, poll_interval=1.0):
+        # Datei-Änderungen (CatalogWatcher) landen ebenfalls in reloads().
+        if self._watcher is None:
+            self._watcher = self.engine.watch(paths, debounce=debounce, poll_interval=poll_interval,
+                                              callback=self._publish)
+        return self._watcher
+
+    def _publish(self, generation):
+        for loop, queue in list(self._listeners):
+            if loop.is_closed():
+                continue
+            loop.call_soon_threadsafe(queue.put_nowait, generation)
+
+    async def reloads(self):
+        """Async-Iterator über die Generation jedes neu veröffentlichten Snapshots."""
+        entry = (asyncio.get_running_loop(), asyncio.Queue())
+        self._listeners.add(entry)
+        try:
+            while True:
+                yield await entry[1].get()
+        finally:
+            self._listeners.discard(entry)
+
+    def close(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+
+_POOL_ENGINE = None
+
+
+def _pool_init():
+    # Locks des Elternprozesses können beim fork() gehalten worden sein.
+    _POOL_ENGINE._ptr_lock = threading.RLock()
+    _POOL_ENGINE._cache_lock = threading.RLock()
+
+
+def _pool_translate(chunk):
+    return _POOL_ENGINE.translate_batch(chunk)
+
+
+class TranslationPool:
+    """Pre-fork-Pool: Der Elternprozess lädt den Katalog einmal, die Worker erben ihn per Copy-on-Write und
+    übersetzen Chunks ohne eigenes Laden oder Reload. Ergebnisse kommen in Eingabereihenfolge zurück."""
+
+    def __init__(self, engine: I18nEngine, processes=None, chunk_size=512):
+        global _POOL_ENGINE
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("TranslationPool benötigt fork() (nicht verfügbar auf diesem System).")
+        if not engine.preload():
+            raise RuntimeError(engine.last_error() or "Kein Katalog geladen")
+        self.engine = engine
+        self.chunk_size = chunk_size
+        _POOL_ENGINE = engine
+        # Python-Objekte des Elternprozesses aus dem GC nehmen, damit Collections in den Workern keine Seiten kopieren.
+        gc.freeze()
+        try:
+            self._pool = multiprocessing.get_context("fork").Pool(processes, initializer=_pool_init)
+        finally:
+            gc.unfreeze()
+
+    def imap(self, requests):
+        """Iterator über die Übersetzungen; requests wie bei translate_batch, darf ein Generator sein."""
+        it = iter(requests)
+        chunks = iter(lambda: list(itertools.islice(it, self.chunk_size)), [])
+        for results in self._pool.imap(_pool_translate, chunks):
+            yield from results
+
+    def map(self, requests):
+        return list(self.imap(requests))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
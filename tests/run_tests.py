@@ -1,6 +1,10 @@
 import ctypes
+import importlib
+import json
 import os
 import sys
+import tempfile
+import threading
 
 BASE_DIR = os.path.dirname(__file__)
 lib_name = "i18n_engine.dll" if os.name == "nt" else "libi18n_engine.so"
@@ -31,6 +35,101 @@ lib.i18n_get_meta_note_copy.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes
 lib.i18n_get_meta_note_copy.restype = ctypes.c_int
 lib.i18n_get_meta_plural_rule.argtypes = [ctypes.c_void_p]
 lib.i18n_get_meta_plural_rule.restype = ctypes.c_int
+lib.i18n_load_locale_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_load_locale_file.restype = ctypes.c_int
+lib.i18n_set_fallback_chain.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.i18n_set_fallback_chain.restype = ctypes.c_int
+lib.i18n_get_fallback_chain_copy.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_get_fallback_chain_copy.restype = ctypes.c_int
+lib.i18n_get_locale_stats.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)]
+lib.i18n_get_locale_stats.restype = ctypes.c_int
+lib.i18n_export_binary_ex.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_export_binary_ex.restype = ctypes.c_int
+lib.i18n_load_txt_file_ex.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_load_txt_file_ex.restype = ctypes.c_int
+lib.i18n_make_patch.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
+lib.i18n_make_patch.restype = ctypes.c_int
+lib.i18n_apply_patch_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_apply_patch_file.restype = ctypes.c_int
+lib.i18n_apply_patch.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.i18n_apply_patch.restype = ctypes.c_int
+lib.i18n_export_bundle.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.i18n_export_bundle.restype = ctypes.c_int
+lib.i18n_load_bundle.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_load_bundle.restype = ctypes.c_int
+lib.i18n_select_locale.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.i18n_select_locale.restype = ctypes.c_int
+lib.i18n_get_bundle_locales_copy.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_get_bundle_locales_copy.restype = ctypes.c_int
+lib.i18n_export_sharded.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
+lib.i18n_export_sharded.restype = ctypes.c_int
+lib.i18n_get_shard_stats.argtypes = [
+    ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)
+]
+lib.i18n_get_shard_stats.restype = ctypes.c_int
+lib.i18n_export_subset.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_export_subset.restype = ctypes.c_int
+lib.i18n_set_cache_dir.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.i18n_set_cache_dir.restype = ctypes.c_int
+lib.i18n_find.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+lib.i18n_find.restype = ctypes.c_int
+lib.i18n_reload_if_changed.argtypes = [ctypes.c_void_p]
+lib.i18n_reload_if_changed.restype = ctypes.c_int
+lib.i18n_get_generation.argtypes = [ctypes.c_void_p]
+lib.i18n_get_generation.restype = ctypes.c_uint64
+RELOAD_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p)
+lib.i18n_reload_async.argtypes = [ctypes.c_void_p, RELOAD_CALLBACK, ctypes.c_void_p]
+lib.i18n_reload_async.restype = ctypes.c_int
+lib.i18n_translate_batch.argtypes = [
+    ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_char_p), ctypes.c_char_p, ctypes.c_int,
+    ctypes.POINTER(ctypes.c_int)
+]
+lib.i18n_translate_batch.restype = ctypes.c_int
+lib.i18n_has_token.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.i18n_has_token.restype = ctypes.c_int
+lib.i18n_preload.argtypes = [ctypes.c_void_p]
+lib.i18n_preload.restype = ctypes.c_int
+lib.i18n_pin_snapshot.argtypes = [ctypes.c_void_p]
+lib.i18n_pin_snapshot.restype = ctypes.c_void_p
+lib.i18n_unpin_snapshot.argtypes = [ctypes.c_void_p]
+lib.i18n_pinned_generation.argtypes = [ctypes.c_void_p]
+lib.i18n_pinned_generation.restype = ctypes.c_uint64
+lib.i18n_translate_pinned.argtypes = [
+    ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_char_p, ctypes.c_int
+]
+lib.i18n_translate_pinned.restype = ctypes.c_int
+lib.i18n_reload.argtypes = [ctypes.c_void_p]
+lib.i18n_reload.restype = ctypes.c_int
+lib.i18n_clone.argtypes = [ctypes.c_void_p]
+lib.i18n_clone.restype = ctypes.c_void_p
+lib.i18n_set_result_cache.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+lib.i18n_set_result_cache.restype = ctypes.c_int
+lib.i18n_get_result_cache_stats.argtypes = [ctypes.c_void_p] + [ctypes.POINTER(ctypes.c_uint64)] * 4
+lib.i18n_get_result_cache_stats.restype = ctypes.c_int
+
+
+class ArgValue(ctypes.Union):
+    _fields_ = [("str", ctypes.c_char_p), ("i", ctypes.c_int64), ("d", ctypes.c_double), ("id", ctypes.c_uint64)]
+
+
+class TypedArg(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_int32), ("precision", ctypes.c_int32), ("value", ArgValue)]
+
+
+lib.i18n_translate_ex.argtypes = [
+    ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(TypedArg), ctypes.c_int, ctypes.c_char_p, ctypes.c_int
+]
+lib.i18n_translate_ex.restype = ctypes.c_int
+lib.i18n_translate_plural_ex.argtypes = [
+    ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(TypedArg), ctypes.c_int, ctypes.c_char_p, ctypes.c_int
+]
+lib.i18n_translate_plural_ex.restype = ctypes.c_int
+lib.i18n_translate_plural_column.argtypes = [
+    ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+    ctypes.POINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int)
+]
+lib.i18n_translate_plural_column.restype = ctypes.c_int
 lib.i18n_abi_version.restype = ctypes.c_uint32
 lib.i18n_binary_version_supported_max.restype = ctypes.c_uint32
 
@@ -76,6 +175,17 @@ def translate_plural(engine, token, count, args=None):
     return buf.value.decode("utf-8")
 
 
+def wrapper_module():
+    sys.path.insert(0, os.path.join(BASE_DIR, "..", "rpg_beispiel"))
+    import i18n_wrapper
+    return i18n_wrapper
+
+
+def tool_module(name):
+    sys.path.insert(0, os.path.join(BASE_DIR, ".."))
+    return importlib.import_module(name)
+
+
 def load_catalog(engine, fname):
     path = os.path.join(BASE_DIR, "catalogs", fname)
     if lib.i18n_load_txt_file(engine, path.encode("utf-8"), 1) != 0:
@@ -102,9 +212,923 @@ def check_meta(engine):
     return locale, fallback, note, lib.i18n_get_meta_plural_rule(engine)
 
 
+def locale_stats(engine, locale):
+    hits = ctypes.c_uint64()
+    misses = ctypes.c_uint64()
+    if lib.i18n_get_locale_stats(engine, locale.encode("utf-8"), ctypes.byref(hits), ctypes.byref(misses)) != 0:
+        raise RuntimeError(last_error(engine))
+    return hits.value, misses.value
+
+
+def test_fallback_chain():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "fallback_de_at.txt")
+        for fname in ("fallback_de_de.txt", "fallback_en_us.txt"):
+            path = os.path.join(BASE_DIR, "catalogs", fname)
+            if lib.i18n_load_locale_file(engine, path.encode("utf-8"), 1) != 0:
+                raise RuntimeError(f"Locale load failed for {fname}: {last_error(engine)}")
+        buf = ctypes.create_string_buffer(128)
+        lib.i18n_get_fallback_chain_copy(engine, buf, len(buf))
+        assert buf.value.decode("utf-8") == "de_AT,de_DE,en_US"
+        assert translate(engine, "f0a001") == "Servus"
+        assert translate(engine, "f0c001") == "Quit"
+        assert translate(engine, "f0a002") == "Speichern – Quit"
+        assert locale_stats(engine, "de_AT") == (2, 1)
+        assert locale_stats(engine, "de_DE") == (0, 1)
+        assert locale_stats(engine, "en_US") == (1, 0)
+        lib.i18n_set_fallback_chain(engine, b"en_US")
+        assert translate(engine, "f0b001") == "Save"
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_string_table_sharing():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "dedup_suffix.txt")
+        with tempfile.TemporaryDirectory() as tmp:
+            sizes = []
+            for flags in (0, 1):
+                path = os.path.join(tmp, f"dedup_{flags}.i18n")
+                assert lib.i18n_export_binary_ex(engine, path.encode("utf-8"), flags) == 0
+                sizes.append(os.path.getsize(path))
+                check = lib.i18n_new()
+                try:
+                    assert lib.i18n_load_txt_file(check, path.encode("utf-8"), 1) == 0, last_error(check)
+                    assert translate(check, "d0d002") == "Alles speichern"
+                    assert translate(check, "d0d003") == "Speichern"
+                    assert translate(check, "d0d005") == "Gegenstände"
+                    assert translate_plural(check, "d0d004", 3, ["3"]) == "3 Gegenstände"
+                    assert translate(check, "d0d007") == "Kruemmel"
+                finally:
+                    lib.i18n_free(check)
+            assert sizes[1] < sizes[0], sizes
+            # Export schreibt über eine Temp-Datei + rename, es bleibt nichts liegen.
+            assert lib.i18n_export_binary_ex(engine, os.path.join(tmp, "dedup_0.i18n").encode("utf-8"), 0) == 0
+            assert sorted(os.listdir(tmp)) == ["dedup_0.i18n", "dedup_1.i18n"]
+            # Mehrere Threads auf dasselbe Ziel: jede Temp-Datei ist eindeutig, jeder Export gelingt.
+            target = os.path.join(tmp, "dedup_0.i18n").encode("utf-8")
+            results = []
+            workers = [threading.Thread(target=lambda: results.extend(
+                lib.i18n_export_binary_ex(engine, target, 2) for _ in range(10))) for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            assert results == [0] * 40, results
+            assert sorted(os.listdir(tmp)) == ["dedup_0.i18n", "dedup_1.i18n"]
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_compressed_string_table():
+    engine = lib.i18n_new()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "large.txt")
+            with open(src, "w", encoding="utf-8") as fh:
+                fh.write("@meta locale=de_DE\n")
+                for i in range(3000):
+                    fh.write(f"{0xB00000 + i:06x}(Item{i}): Gegenstand Nummer {i} liegt im Lager {i % 7}\n")
+            assert lib.i18n_load_txt_file(engine, src.encode("utf-8"), 1) == 0, last_error(engine)
+            plain = os.path.join(tmp, "plain.i18n")
+            packed = os.path.join(tmp, "packed.i18n")
+            assert lib.i18n_export_binary_ex(engine, plain.encode("utf-8"), 0) == 0
+            assert lib.i18n_export_binary_ex(engine, packed.encode("utf-8"), 2) == 0
+            assert os.path.getsize(packed) < os.path.getsize(plain)
+            with open(packed, "rb") as fh:
+                header = fh.read(6)
+            assert header[4] == 3 and header[5] == 1
+
+            lazy = lib.i18n_new()
+            try:
+                assert lib.i18n_load_txt_file(lazy, packed.encode("utf-8"), 1) == 0, last_error(lazy)
+                assert translate(lazy, "b00000") == "Gegenstand Nummer 0 liegt im Lager 0"
+                assert translate(lazy, "b00bb7") == "Gegenstand Nummer 2999 liegt im Lager 3"
+                code, _ = run_check(lazy)
+                assert code == 0
+                again = os.path.join(tmp, "again.i18n")
+                assert lib.i18n_export_binary_ex(lazy, again.encode("utf-8"), 0) == 0
+                with open(plain, "rb") as a, open(again, "rb") as b:
+                    assert a.read() == b.read()
+            finally:
+                lib.i18n_free(lazy)
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_section_checksums():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "dedup_suffix.txt")
+        with tempfile.TemporaryDirectory() as tmp:
+            for flags in (4, 6):
+                path = os.path.join(tmp, f"sections_{flags}.i18n")
+                assert lib.i18n_export_binary_ex(engine, path.encode("utf-8"), flags) == 0
+                with open(path, "rb") as fh:
+                    data = bytearray(fh.read())
+                # Komprimiert kommen Block-Checksummen (0x04) dazu.
+                assert data[5] == (2 if flags == 4 else 7)
+                data[-1] ^= 0xFF
+                broken = os.path.join(tmp, f"broken_{flags}.i18n")
+                with open(broken, "wb") as fh:
+                    fh.write(data)
+                check = lib.i18n_new()
+                try:
+                    assert lib.i18n_load_txt_file_ex(check, path.encode("utf-8"), 1) == 0, last_error(check)
+                    assert translate(check, "d0d006") == "Kruemmel"
+                    # Die String-Table wird erst beim ersten Zugriff geprüft, der Fehler landet in last_error.
+                    assert lib.i18n_load_txt_file_ex(check, broken.encode("utf-8"), 1) == 0, last_error(check)
+                    assert lib.i18n_set_result_cache(check, 1 << 20) == 0
+                    for _ in range(2):
+                        assert translate(check, "d0d006") == "⟦d0d006⟧"
+                        assert "Checksum" in last_error(check), last_error(check)
+                    assert translate(check, "d0d0ff") == "⟦d0d0ff⟧" and last_error(check) == ""
+                    code, report = run_check(check)
+                    assert code != 0 and "Checksum" in report, report
+                    assert lib.i18n_export_binary_ex(check, os.path.join(tmp, "again.i18n").encode("utf-8"), 0) != 0
+                    assert lib.i18n_load_txt_file_ex(check, broken.encode("utf-8"), 3) == 0
+                    assert translate(check, "d0d001") != "⟦d0d001⟧"
+                finally:
+                    lib.i18n_free(check)
+
+            # Mit Block-Checksummen trifft ein defekter Block nur seine eigenen Texte.
+            big = os.path.join(tmp, "big.txt")
+            with open(big, "w", encoding="utf-8") as fh:
+                fh.write("@meta locale=de_DE\n")
+                for i in range(3000):
+                    fh.write(f"{0xB00000 + i:06x}: Gegenstand Nummer {i} liegt im Lager {i % 7}\n")
+            assert lib.i18n_load_txt_file(engine, big.encode("utf-8"), 1) == 0, last_error(engine)
+            packed = os.path.join(tmp, "big.i18n")
+            assert lib.i18n_export_binary_ex(engine, packed.encode("utf-8"), 6) == 0
+            with open(packed, "rb") as fh:
+                data = bytearray(fh.read())
+            data[-1] ^= 0xFF
+            with open(packed, "wb") as fh:
+                fh.write(data)
+            check = lib.i18n_new()
+            try:
+                assert lib.i18n_load_txt_file_ex(check, packed.encode("utf-8"), 1) == 0, last_error(check)
+                assert translate(check, "b00000") == "Gegenstand Nummer 0 liegt im Lager 0"
+                assert last_error(check) == ""
+                assert translate(check, "b00bb7") == "⟦b00bb7⟧"
+                assert "String-Block" in last_error(check), last_error(check)
+            finally:
+                lib.i18n_free(check)
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_delta_patch():
+    old_src = "@meta locale=de_DE\n\nd1a001: Alt\nd1a002: Bleibt\nd1a003{one}: ein Ding\nd1a003{other}: %0 Dinge\n"
+    new_src = "@meta locale=de_DE\n@meta note=Fix\n\nd1a001: Neu\nd1a002: Bleibt\nd1a003{other}: %0 Dinge\nd1a004: Dazu\n"
+    engine = lib.i18n_new()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for name, src in (("old", old_src), ("new", new_src)):
+                txt = os.path.join(tmp, f"{name}.txt")
+                with open(txt, "w", encoding="utf-8") as fh:
+                    fh.write(src)
+                assert lib.i18n_load_txt_file(engine, txt.encode("utf-8"), 1) == 0, last_error(engine)
+                paths[name] = os.path.join(tmp, f"{name}.i18n").encode("utf-8")
+                assert lib.i18n_export_binary_ex(engine, paths[name], 2) == 0
+            patch = os.path.join(tmp, "old_new.i18p").encode("utf-8")
+            assert lib.i18n_make_patch(engine, paths["old"], paths["new"], patch) == 0, last_error(engine)
+            assert os.path.getsize(patch) < os.path.getsize(paths["new"])
+
+            out = os.path.join(tmp, "patched.i18n").encode("utf-8")
+            assert lib.i18n_apply_patch_file(engine, paths["old"], patch, out, 2) == 0, last_error(engine)
+            with open(out, "rb") as a, open(paths["new"], "rb") as b:
+                assert a.read() == b.read()
+            assert lib.i18n_apply_patch_file(engine, paths["new"], patch, out, 0) == -1
+            assert "Basis" in last_error(engine)
+
+            assert lib.i18n_load_txt_file(engine, paths["old"], 1) == 0
+            assert lib.i18n_apply_patch(engine, patch) == 0, last_error(engine)
+            assert translate(engine, "d1a001") == "Neu"
+            assert translate(engine, "d1a004") == "Dazu"
+            assert translate_plural(engine, "d1a003", 1, ["1"]) == "1 Dinge"
+            _, _, note, _ = check_meta(engine)
+            assert note == "Fix"
+
+            # Reloads wenden den Patch erneut an; enthält die neue Basis ihn schon, wird er übersprungen.
+            assert lib.i18n_reload(engine) == 0, last_error(engine)
+            assert translate(engine, "d1a001") == "Neu"
+            os.replace(paths["new"], paths["old"])
+            assert lib.i18n_reload_if_changed(engine) == 1, last_error(engine)
+            assert translate(engine, "d1a004") == "Dazu"
+            base = os.path.join(tmp, "old.txt")
+            with open(base, "w", encoding="utf-8") as fh:
+                fh.write("d1a001: Anders\n")
+            assert lib.i18n_load_txt_file(engine, base.encode("utf-8"), 1) == 0
+            assert lib.i18n_reload(engine) == 0
+            assert translate(engine, "d1a001") == "Anders"
+            with open(base, "w", encoding="utf-8") as fh:
+                fh.write(old_src)
+            assert lib.i18n_load_txt_file(engine, base.encode("utf-8"), 1) == 0
+            assert lib.i18n_apply_patch(engine, patch) == 0, last_error(engine)
+            with open(base, "w", encoding="utf-8") as fh:
+                fh.write("d1a001: Anders\n")
+            assert lib.i18n_reload(engine) == -1
+            assert "nicht erneut anwendbar" in last_error(engine)
+            assert translate(engine, "d1a001") == "Neu"
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_bundle():
+    engine = lib.i18n_new()
+    bundle = lib.i18n_new()
+    try:
+        load_catalog(engine, "fallback_de_at.txt")
+        for fname in ("fallback_de_de.txt", "fallback_en_us.txt"):
+            path = os.path.join(BASE_DIR, "catalogs", fname)
+            if lib.i18n_load_locale_file(engine, path.encode("utf-8"), 1) != 0:
+                raise RuntimeError(f"Locale load failed for {fname}: {last_error(engine)}")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "all.i18nb").encode("utf-8")
+            assert lib.i18n_export_bundle(engine, path) == 0, last_error(engine)
+            assert lib.i18n_load_bundle(bundle, path, b"de_AT", 1) == 0, last_error(bundle)
+            buf = ctypes.create_string_buffer(128)
+            lib.i18n_get_bundle_locales_copy(bundle, buf, len(buf))
+            assert buf.value.decode("utf-8") == "de_AT,de_DE,en_US"
+            assert translate(bundle, "f0a002") == "Speichern – Quit"
+            assert lib.i18n_select_locale(bundle, b"en_US") == 0
+            assert translate(bundle, "f0a001") == "Hello"
+            assert lib.i18n_select_locale(bundle, b"fr_FR") == -1
+            assert "fr_FR" in last_error(bundle)
+            # Locales werden direkt aus den Offset-Spalten bedient; check, Export und Wechsel zurück bleiben korrekt.
+            assert lib.i18n_has_token(bundle, b"f0c001") == 1 and lib.i18n_has_token(bundle, b"f0c0ff") == 0
+            assert run_check(bundle)[0] == 0
+            single = os.path.join(tmp, "en.i18n").encode("utf-8")
+            assert lib.i18n_export_binary_ex(bundle, single, 0) == 0, last_error(bundle)
+            assert lib.i18n_select_locale(bundle, b"de_AT") == 0
+            assert translate(bundle, "f0a001") == "Servus"
+            assert translate(bundle, "f0a002") == "Speichern – Quit"
+            assert lib.i18n_load_txt_file(engine, single, 1) == 0, last_error(engine)
+            assert translate(engine, "f0b001") == "Save"
+    finally:
+        lib.i18n_free(bundle)
+        lib.i18n_free(engine)
+
+
+def test_sharded_catalog():
+    engine = lib.i18n_new()
+    sharded = lib.i18n_new()
+    try:
+        load_catalog(engine, "sharded.txt")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "game.i18ns")
+            assert lib.i18n_export_sharded(engine, path.encode("utf-8"), 1, 2) == 0, last_error(engine)
+            segments = sorted(name for name in os.listdir(tmp) if name != "game.i18ns")
+            assert [name.split(".")[1] for name in segments] == ["a", "c", "f"], segments
+            assert lib.i18n_load_txt_file(sharded, path.encode("utf-8"), 1) == 0, last_error(sharded)
+            loaded, total = ctypes.c_uint32(), ctypes.c_uint32()
+            assert lib.i18n_get_shard_stats(sharded, ctypes.byref(loaded), ctypes.byref(total)) == 0
+            assert (loaded.value, total.value) == (0, 3)
+            assert translate(sharded, "A9F001") == "Speichern"
+            lib.i18n_get_shard_stats(sharded, ctypes.byref(loaded), ctypes.byref(total))
+            assert loaded.value == 1
+            assert translate_plural(sharded, "c1c1c1", 3, ["3"]) == "3 Items"
+            assert translate(sharded, "b00000") == "⟦b00000⟧"
+            lib.i18n_get_shard_stats(sharded, ctypes.byref(loaded), ctypes.byref(total))
+            assert loaded.value == 2
+            code, report = run_check(sharded)
+            assert code == 0, report
+
+            # Neuer Export mit geänderten Texten: das alte Manifest sieht weiter nur seine Segmente.
+            stale = lib.i18n_new()
+            try:
+                assert lib.i18n_load_txt_file(stale, path.encode("utf-8"), 1) == 0, last_error(stale)
+                changed = os.path.join(tmp, "changed.txt")
+                with open(os.path.join(BASE_DIR, "catalogs", "sharded.txt"), encoding="utf-8") as fh:
+                    src = fh.read().replace("Hallo Welt", "Servus Welt")
+                with open(changed, "w", encoding="utf-8") as fh:
+                    fh.write(src)
+                assert lib.i18n_load_txt_file(engine, changed.encode("utf-8"), 1) == 0
+                assert lib.i18n_export_sharded(engine, path.encode("utf-8"), 1, 2) == 0, last_error(engine)
+                assert translate(stale, "a1b2c3") == "Hallo Welt"
+            finally:
+                lib.i18n_free(stale)
+
+            # Fehlendes oder ersetztes Segment: check und Export melden es statt eines Teilkatalogs.
+            broken = lib.i18n_new()
+            try:
+                assert lib.i18n_load_txt_file(broken, path.encode("utf-8"), 0) == 0, last_error(broken)
+                segments = [name for name in os.listdir(tmp) if name.startswith("game.c.")]
+                for name in segments:
+                    os.remove(os.path.join(tmp, name))
+                code, report = run_check(broken)
+                assert code != 0 and "game.c." in report, report
+                out = os.path.join(tmp, "full.i18n").encode("utf-8")
+                assert lib.i18n_export_binary_ex(broken, out, 0) == -1
+                assert "game.c." in last_error(broken)
+                assert not os.path.exists(out)
+                assert lib.i18n_load_txt_file(broken, path.encode("utf-8"), 0) == 0
+                current = [name for name in os.listdir(tmp) if name.startswith("game.a.")]
+                for name in current:
+                    with open(os.path.join(tmp, name), "r+b") as fh:
+                        fh.seek(-1, os.SEEK_END)
+                        last = fh.read(1)
+                        fh.seek(-1, os.SEEK_END)
+                        fh.write(bytes([last[0] ^ 0xFF]))
+                code, report = run_check(broken)
+                assert code != 0 and "Hash passt nicht" in report, report
+            finally:
+                lib.i18n_free(broken)
+    finally:
+        lib.i18n_free(sharded)
+        lib.i18n_free(engine)
+
+
+def test_tree_shaking():
+    engine = lib.i18n_new()
+    subset = lib.i18n_new()
+    try:
+        load_catalog(engine, "tree_shake.txt")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "min.i18n").encode("utf-8")
+            assert lib.i18n_export_subset(engine, path, b"B00001, b00002{other}\nffffff", 0) == 5, last_error(engine)
+            assert lib.i18n_load_txt_file(subset, path, 1) == 0, last_error(subset)
+            assert translate(subset, "b00001") == "Meine App – Hauptmenü"
+            assert translate_plural(subset, "b00002", 1) == "Ein Item in Rucksack"
+            assert translate(subset, "e00002") == "⟦e00002⟧"
+            assert lib.i18n_export_subset(engine, path, b"ffffff", 0) == -1
+    finally:
+        lib.i18n_free(subset)
+        lib.i18n_free(engine)
+
+
+def test_compile_directory():
+    crypt = tool_module("i18n_crypt")
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "src")
+        out = os.path.join(tmp, "out")
+        os.makedirs(os.path.join(src, "sub"))
+        os.makedirs(out)
+        catalogs = {
+            "a.txt": "@meta locale=de_DE\n\nc0a001: Eins\n",
+            "b.txt": "@meta locale=de_DE\n\nc0a002: Zwei\n",
+            "bad.txt": "@meta locale=de_DE\n\nc0a003: A\nc0a003: B\n",
+            os.path.join("sub", "c.txt"): "@meta locale=de_DE\n\nc0a004: Vier\n",
+        }
+        for name, text in catalogs.items():
+            with open(os.path.join(src, name), "w", encoding="utf-8") as fh:
+                fh.write(text)
+        # Eine Datei blockiert das Ausgabe-Unterverzeichnis: OSError statt RuntimeError im Worker.
+        with open(os.path.join(out, "sub"), "w", encoding="utf-8") as fh:
+            fh.write("kein Verzeichnis")
+
+        def build(force=False):
+            report_path = crypt.Path(out) / "build_report.json"
+            report = crypt.compile_directory(crypt.Path(LIB_PATH).resolve(), crypt.Path(src), crypt.Path(out),
+                                             True, 0, 2, report_path, force)
+            with open(report_path, encoding="utf-8") as fh:
+                assert json.load(fh) == report
+            with open(os.path.join(out, crypt.BUILD_MANIFEST), encoding="utf-8") as fh:
+                manifest = json.load(fh)
+            status = {f["input"][len(src) + 1:].replace(os.sep, "/"): f["status"] for f in report["files"]}
+            return report, status, sorted(manifest["entries"])
+
+        report, status, entries = build()
+        assert status == {"a.txt": "compiled", "b.txt": "compiled", "bad.txt": "failed", "sub/c.txt": "failed"}
+        assert (report["compiled"], report["skipped"], report["failed"]) == (2, 0, 2)
+        errors = {f["input"][len(src) + 1:].replace(os.sep, "/"): f.get("error", "") for f in report["files"]}
+        assert "Laden" in errors["bad.txt"] and errors["sub/c.txt"]
+        assert entries == ["a.txt", "b.txt"]
+        engine = lib.i18n_new()
+        try:
+            assert lib.i18n_load_txt_file(engine, os.path.join(out, "a.i18n").encode("utf-8"), 1) == 0
+            assert translate(engine, "c0a001") == "Eins"
+        finally:
+            lib.i18n_free(engine)
+
+        # Unveränderte Kataloge werden übersprungen, fehlgeschlagene erneut versucht.
+        os.remove(os.path.join(out, "sub"))
+        with open(os.path.join(src, "b.txt"), "w", encoding="utf-8") as fh:
+            fh.write("@meta locale=de_DE\n\nc0a002: Zwei neu\n")
+        report, status, entries = build()
+        assert status == {"a.txt": "skipped", "b.txt": "compiled", "bad.txt": "failed", "sub/c.txt": "compiled"}
+        assert entries == ["a.txt", "b.txt", "sub/c.txt"]
+        report, status, _ = build(force=True)
+        assert report["compiled"] == 3 and report["skipped"] == 0
+
+
+def test_translation_server():
+    server_mod = tool_module("i18n_server")
+    import http.client
+    import socket
+    import time
+    from http.server import ThreadingHTTPServer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = os.path.join(tmp, "server.txt")
+        with open(catalog, "w", encoding="utf-8") as fh:
+            fh.write("@meta locale=de_DE\n\ne5e001: Hallo %0\ne5e002{one}: ein Ding\ne5e002{other}: %0 Dinge\n")
+        server_lib = server_mod.load_library(server_mod.Path(LIB_PATH))
+        server_mod.setup(server_lib)
+        service = server_mod.TranslationService(server_lib, catalog)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), server_mod.TranslationHandler)
+        server.service = service
+        server.verbose = False
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+
+        def call(method, path, payload=None):
+            body = None if payload is None else json.dumps(payload).encode("utf-8")
+            conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            return response.status, json.loads(response.read())
+
+        try:
+            assert call("GET", "/health") == (200, {"ok": True})
+            status, meta = call("GET", "/meta")
+            assert status == 200 and meta["locale"] == "de_DE"
+            items = [{"token": "E5E001", "args": ["Welt"]}, {"token": "e5e0ff"}]
+            assert call("POST", "/translate", {"items": items}) == (200, {"results": ["Hallo Welt", "⟦e5e0ff⟧"]})
+            plural = [{"token": "e5e002", "count": 1}, {"token": "e5e002", "count": 3, "args": ["3"]}]
+            assert call("POST", "/plural", {"items": plural}) == (200, {"results": ["ein Ding", "3 Dinge"]})
+            assert call("POST", "/has", {"tokens": ["e5e001", "e5e0ff"]}) == (200, {"results": [True, False]})
+            # Ungültige Einträge sind 400, die Keep-Alive-Verbindung bleibt benutzbar.
+            for path, bad in (("/translate", {"items": ["e5e001"]}), ("/translate", {"items": "e5e001"}),
+                              ("/has", {"tokens": 5}), ("/plural", {"items": [{"token": "e5e002"}]}),
+                              ("/plural", {"items": [{"token": "e5e002", "count": 2**40}]}),
+                              ("/plural", {"items": [{"token": "e5e002", "count": -2**31}]})):
+                status, payload = call("POST", path, bad)
+                assert status == 400 and "Ungültige Anfrage" in payload["error"], (bad, payload)
+            assert call("GET", "/nope")[0] == 404
+            assert call("POST", "/translate", {"items": items})[1]["results"][0] == "Hallo Welt"
+
+            # Pipelining: zwei Requests in einem Paket, Antworten in derselben Reihenfolge.
+            with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=10) as sock:
+                requests = b""
+                for token in ("e5e001", "e5e0fe"):
+                    body = json.dumps({"items": [{"token": token, "args": ["Pipe"]}]}).encode("utf-8")
+                    requests += (b"POST /translate HTTP/1.1\r\nHost: x\r\nContent-Length: " +
+                                 str(len(body)).encode() + b"\r\n\r\n" + body)
+                sock.sendall(requests)
+                reader = sock.makefile("rb")
+                answers = []
+                for _ in range(2):
+                    assert reader.readline().startswith(b"HTTP/1.1 200")
+                    headers = {}
+                    for line in iter(reader.readline, b"\r\n"):
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.lower()] = value.strip()
+                    answers.append(json.loads(reader.read(int(headers["content-length"])))["results"][0])
+                reader.close()
+                assert answers == ["Hallo Pipe", "⟦e5e0fe⟧"]
+
+            # Negative Content-Length: 400 statt bis zum Verbindungsende zu lesen.
+            with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=10) as sock:
+                sock.sendall(b"POST /translate HTTP/1.1\r\nHost: x\r\nContent-Length: -1\r\n\r\n")
+                reader = sock.makefile("rb")
+                assert reader.readline().startswith(b"HTTP/1.1 400")
+                reader.close()
+
+            # Neue Generation nach Reload leert den Antwort-Cache.
+            generation = meta["generation"]
+            time.sleep(0.01)
+            with open(catalog, "w", encoding="utf-8") as fh:
+                fh.write("@meta locale=de_DE\n\ne5e001: Servus %0\ne5e002{other}: %0 Dinge\n")
+            status, reloaded = call("POST", "/reload", {})
+            assert status == 200 and reloaded["reloaded"] and reloaded["generation"] > generation
+            assert call("POST", "/translate", {"items": items})[1]["results"] == ["Servus Welt", "⟦e5e0ff⟧"]
+            assert call("POST", "/reload", {})[1]["reloaded"] is False
+        finally:
+            conn.close()
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+
+def test_snapshot_cache():
+    src = os.path.join(BASE_DIR, "catalogs", "good_minimal.txt")
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = os.path.join(tmp, "de.txt")
+        cache = os.path.join(tmp, "cache")
+        with open(src, "rb") as f:
+            original = f.read()
+        with open(catalog, "wb") as f:
+            f.write(original)
+
+        def load():
+            engine = lib.i18n_new()
+            lib.i18n_set_cache_dir(engine, cache.encode("utf-8"))
+            assert lib.i18n_load_txt_file(engine, catalog.encode("utf-8"), 1) == 0, last_error(engine)
+            buf = ctypes.create_string_buffer(512)
+            lib.i18n_find(engine, b"Welcome", buf, len(buf))
+            result = (translate(engine, "a1b2c3"), buf.value.decode("utf-8"))
+            lib.i18n_free(engine)
+            return result
+
+        cold = load()
+        assert sorted(os.path.splitext(n)[1] for n in os.listdir(cache)) == [".i18n", ".i18nc"]
+        assert load() == cold
+        # Gleiche Größe, neuer Inhalt und neue mtime -> Cache verworfen.
+        with open(catalog, "wb") as f:
+            f.write(original.replace(b"Hallo Welt", b"Hallo Wald"))
+        os.utime(catalog, (1, 1))
+        assert load()[0] == "Hallo Wald"
+        # Defektes Binary im Cache -> neu parsen statt Fehler.
+        binary = next(os.path.join(cache, n) for n in os.listdir(cache) if n.endswith(".i18n"))
+        with open(binary, "r+b") as f:
+            f.seek(30)
+            f.write(b"\xff")
+        assert load()[0] == "Hallo Wald"
+
+
+def test_reload_if_changed():
+    engine = lib.i18n_new()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = os.path.join(tmp, "de.txt")
+            with open(catalog, "w", encoding="utf-8") as f:
+                f.write("a1b2c3: Hallo Welt\n")
+            assert lib.i18n_reload_if_changed(engine) == -1
+            assert lib.i18n_load_txt_file(engine, catalog.encode("utf-8"), 1) == 0, last_error(engine)
+            generation = lib.i18n_get_generation(engine)
+            assert lib.i18n_reload_if_changed(engine) == 0
+            os.utime(catalog, (1, 1))
+            assert lib.i18n_reload_if_changed(engine) == 0
+            assert lib.i18n_get_generation(engine) == generation
+            with open(catalog, "w", encoding="utf-8") as f:
+                f.write("a1b2c3: Hallo Wald\n")
+            os.utime(catalog, (2, 2))
+            assert lib.i18n_reload_if_changed(engine) == 1
+            assert lib.i18n_get_generation(engine) > generation
+            assert translate(engine, "a1b2c3") == "Hallo Wald"
+            os.utime(catalog, (3, 3))
+            assert lib.i18n_reload_if_changed(engine) == 0
+            os.remove(catalog)
+            assert lib.i18n_reload_if_changed(engine) == -1
+            assert translate(engine, "a1b2c3") == "Hallo Wald"
+
+            binary = os.path.join(tmp, "de.i18n")
+            assert lib.i18n_export_binary_ex(engine, binary.encode("utf-8"), 0) == 0, last_error(engine)
+            assert lib.i18n_load_txt_file(engine, binary.encode("utf-8"), 1) == 0, last_error(engine)
+            generation = lib.i18n_get_generation(engine)
+            assert lib.i18n_reload_if_changed(engine) == 0
+            os.utime(binary, (4, 4))
+            assert lib.i18n_reload_if_changed(engine) == 0
+            assert lib.i18n_get_generation(engine) == generation
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_reload_async():
+    engine = lib.i18n_new()
+    results = []
+    done = threading.Event()
+
+    def on_done(_user, status, error):
+        results.append((status, error.decode("utf-8") if error else ""))
+        if len(results) == 2:
+            done.set()
+
+    callback = RELOAD_CALLBACK(on_done)
+    try:
+        assert lib.i18n_reload_async(engine, callback, None) == -1
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = os.path.join(tmp, "de.txt")
+            with open(catalog, "w", encoding="utf-8") as f:
+                f.write("a1b2c3: Hallo Welt\n")
+            assert lib.i18n_load_txt_file(engine, catalog.encode("utf-8"), 1) == 0, last_error(engine)
+            with open(catalog, "w", encoding="utf-8") as f:
+                f.write("a1b2c3: Neu geladen\n")
+            assert lib.i18n_reload_async(engine, callback, None) == 0
+            assert lib.i18n_reload_async(engine, callback, None) == 0
+            assert done.wait(5)
+            assert results[0] == (0, "")
+            assert translate(engine, "a1b2c3") == "Neu geladen"
+
+            results.clear()
+            done.clear()
+            with open(catalog, "w", encoding="utf-8") as f:
+                f.write("kein token\n")
+            assert lib.i18n_reload_async(engine, callback, None) == 0
+            assert lib.i18n_reload_async(engine, callback, None) == 0
+            assert done.wait(5)
+            assert results[0][0] == -1 and results[0][1]
+            assert translate(engine, "a1b2c3") == "Neu geladen"
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_translate_batch():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "plural_variants.txt")
+        no_count = -2147483648
+        tokens = (ctypes.c_char_p * 3)(b"c1c1c1", b"c1c1c1", b"ffffff")
+        counts = (ctypes.c_int * 3)(no_count, 3, no_count)
+        arg_counts = (ctypes.c_int * 3)(1, 1, 0)
+        args = (ctypes.c_char_p * 2)(b"7", b"3")
+        lengths = (ctypes.c_int * 3)()
+        small = ctypes.create_string_buffer(4)
+        needed = lib.i18n_translate_batch(engine, 3, tokens, counts, arg_counts, args, small, len(small), lengths)
+        expected = [translate(engine, "c1c1c1", ["7"]), translate_plural(engine, "c1c1c1", 3, ["3"]), "⟦ffffff⟧"]
+        assert needed == sum(len(t.encode("utf-8")) + 1 for t in expected)
+        buf = ctypes.create_string_buffer(needed)
+        assert lib.i18n_translate_batch(engine, 3, tokens, counts, arg_counts, args, buf, needed, lengths) == needed
+        assert buf.raw.split(b"\0")[:3] == [t.encode("utf-8") for t in expected]
+        assert list(lengths) == [len(t.encode("utf-8")) for t in expected]
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_has_token():
+    engine = lib.i18n_new()
+    try:
+        assert lib.i18n_has_token(engine, b"f0a001") == 0
+        load_catalog(engine, "fallback_de_at.txt")
+        path = os.path.join(BASE_DIR, "catalogs", "fallback_de_de.txt")
+        if lib.i18n_load_locale_file(engine, path.encode("utf-8"), 1) != 0:
+            raise RuntimeError(f"Locale load failed: {last_error(engine)}")
+        assert lib.i18n_has_token(engine, b"F0A001") == 1
+        assert lib.i18n_has_token(engine, b"f0b001") == 1
+        assert lib.i18n_has_token(engine, b"ffffff") == 0
+        load_catalog(engine, "plural_variants.txt")
+        assert lib.i18n_has_token(engine, b"c1c1c1") == 1
+        assert lib.i18n_has_token(engine, b"c1c1c1{few}") == 1
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_preload():
+    engine = lib.i18n_new()
+    sharded = lib.i18n_new()
+    try:
+        assert lib.i18n_preload(sharded) == -1
+        load_catalog(engine, "sharded.txt")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "game.i18ns")
+            assert lib.i18n_export_sharded(engine, path.encode("utf-8"), 1, 2) == 0, last_error(engine)
+            assert lib.i18n_load_txt_file(sharded, path.encode("utf-8"), 1) == 0, last_error(sharded)
+            generation = lib.i18n_get_generation(sharded)
+            assert lib.i18n_preload(sharded) == 0, last_error(sharded)
+            assert lib.i18n_get_generation(sharded) > generation
+        # Nach dem Vorladen hängt nichts mehr an den Segmentdateien.
+        loaded, total = ctypes.c_uint32(), ctypes.c_uint32()
+        assert lib.i18n_get_shard_stats(sharded, ctypes.byref(loaded), ctypes.byref(total)) == -1
+        assert translate(sharded, "A9F001") == "Speichern"
+        assert translate_plural(sharded, "c1c1c1", 3, ["3"]) == "3 Items"
+    finally:
+        lib.i18n_free(sharded)
+        lib.i18n_free(engine)
+
+
+def translate_pinned(pin, token, args=None):
+    c_args, _buffers = prepare_args(args)
+    size = lib.i18n_translate_pinned(pin, token.encode("utf-8"), c_args, len(args or []), None, 0)
+    buf = ctypes.create_string_buffer(size + 1)
+    lib.i18n_translate_pinned(pin, token.encode("utf-8"), c_args, len(args or []), buf, len(buf))
+    return buf.value.decode("utf-8")
+
+
+def test_pinned_snapshot():
+    engine = lib.i18n_new()
+    try:
+        assert not lib.i18n_pin_snapshot(engine)
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = os.path.join(tmp, "de.txt")
+            with open(catalog, "w", encoding="utf-8") as f:
+                f.write("a1b2c3: Hallo %0\n")
+            assert lib.i18n_load_txt_file(engine, catalog.encode("utf-8"), 1) == 0, last_error(engine)
+            pin = lib.i18n_pin_snapshot(engine)
+            assert pin
+            try:
+                assert lib.i18n_pinned_generation(pin) == lib.i18n_get_generation(engine)
+                with open(catalog, "w", encoding="utf-8") as f:
+                    f.write("a1b2c3: Servus %0\n")
+                assert lib.i18n_reload(engine) == 0, last_error(engine)
+                assert translate(engine, "a1b2c3", ["Welt"]) == "Servus Welt"
+                assert translate_pinned(pin, "A1B2C3", ["Welt"]) == "Hallo Welt"
+                assert lib.i18n_pinned_generation(pin) < lib.i18n_get_generation(engine)
+            finally:
+                lib.i18n_unpin_snapshot(pin)
+    finally:
+        lib.i18n_free(engine)
+
+
+def test_pin_survives_adopt():
+    wrapper = wrapper_module()
+    engine = wrapper.I18nEngine(LIB_PATH)
+    staged = wrapper.I18nEngine(LIB_PATH)
+    assert engine.load_file(os.path.join(BASE_DIR, "catalogs", "good_minimal.txt"))
+    assert staged.load_file(os.path.join(BASE_DIR, "catalogs", "plural_variants.txt"))
+    with engine.pin() as page:
+        engine.adopt(staged)
+        del staged
+        assert page.translate("a1b2c3") == "Hallo Welt"
+        assert engine.translate("c1c1c1", ["2"]) == "Du hast 2 Items."
+
+
+def test_catalog_watcher():
+    import time
+    wrapper = wrapper_module()
+
+    def wait_for(predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return predicate()
+
+    modes = (True, False) if sys.platform.startswith("linux") else (False,)
+    for use_inotify in modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = os.path.join(tmp, "live.txt")
+            extra_dir = os.path.join(tmp, "extra")
+            os.makedirs(extra_dir)
+            with open(catalog, "w", encoding="utf-8") as fh:
+                fh.write("@meta locale=de_DE\n\nf0f001: Start\n")
+            engine = wrapper.I18nEngine(LIB_PATH)
+            assert engine.load_file(catalog)
+            start = engine.generation()
+            generations = []
+            files = []
+            watcher = wrapper.CatalogWatcher(engine, [extra_dir], debounce=0.3, poll_interval=0.1,
+                                             use_inotify=use_inotify)
+            watcher.subscribe(generations.append)
+            watcher.subscribe_files(files.append)
+            with watcher:
+                time.sleep(0.3)
+                # Mehrere Schreibvorgänge innerhalb der Ruhephase ergeben genau einen Reload.
+                for i in range(5):
+                    with open(catalog, "w", encoding="utf-8") as fh:
+                        fh.write(f"@meta locale=de_DE\n\nf0f001: Stand {i} {'x' * i}\n")
+                    time.sleep(0.03)
+                assert wait_for(lambda: generations), use_inotify
+                time.sleep(0.6)
+                assert generations == [engine.generation()] and generations[0] > start, (use_inotify, generations)
+                assert engine.translate("f0f001") == "Stand 4 xxxx"
+
+                # Nicht geladene Katalogdateien im beobachteten Verzeichnis: kein Reload, nur subscribe_files.
+                new_file = os.path.join(extra_dir, "neu.txt")
+                with open(new_file, "w", encoding="utf-8") as fh:
+                    fh.write("@meta locale=en_US\n\nf0f001: New\n")
+                with open(os.path.join(extra_dir, "notiz.md"), "w", encoding="utf-8") as fh:
+                    fh.write("kein Katalog")
+                assert wait_for(lambda: files), use_inotify
+                time.sleep(0.4)
+                assert files == [[new_file]] and len(generations) == 1, (use_inotify, files, generations)
+
+
+def test_translation_pool():
+    import multiprocessing
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return
+    wrapper = wrapper_module()
+    engine = wrapper.I18nEngine(LIB_PATH)
+    assert engine.load_file(os.path.join(BASE_DIR, "catalogs", "plural_variants.txt"))
+    requests = []
+    for i in range(50):
+        requests.append(("c1c1c1", [str(i)], i))
+        requests.append(("C1C1C1", [str(i)], None))
+        requests.append((f"c1c1{i:02x}", [], None))
+    expected = engine.translate_batch(requests)
+    assert expected[0] != expected[3] and expected[2] == "⟦c1c100⟧"
+    # Chunks kleiner als die Eingabe: Reihenfolge muss über Chunk-Grenzen und Worker hinweg stimmen.
+    with wrapper.TranslationPool(engine, processes=2, chunk_size=7) as pool:
+        assert pool.map(requests) == expected
+        assert list(pool.imap(r for r in requests)) == expected
+        assert pool.map([]) == []
+
+
+def test_clone():
+    engine = lib.i18n_new()
+    twin = None
+    try:
+        load_catalog(engine, "fallback_de_at.txt")
+        path = os.path.join(BASE_DIR, "catalogs", "fallback_de_de.txt")
+        if lib.i18n_load_locale_file(engine, path.encode("utf-8"), 1) != 0:
+            raise RuntimeError(f"Locale load failed: {last_error(engine)}")
+        twin = lib.i18n_clone(engine)
+        assert twin
+        load_catalog(engine, "plural_variants.txt")
+        lib.i18n_free(engine)
+        engine = None
+        assert translate(twin, "f0a002") == "Speichern – ⟦MISSING:@f0c001⟧"
+        assert locale_stats(twin, "de_AT") == (1, 0)
+        buf = ctypes.create_string_buffer(64)
+        lib.i18n_get_meta_locale_copy(twin, buf, len(buf))
+        assert buf.value == b"de_AT"
+    finally:
+        if twin:
+            lib.i18n_free(twin)
+        if engine:
+            lib.i18n_free(engine)
+
+
+def result_cache_stats(engine):
+    stats = [ctypes.c_uint64() for _ in range(4)]
+    assert lib.i18n_get_result_cache_stats(engine, *[ctypes.byref(v) for v in stats]) == 0
+    return tuple(v.value for v in stats)
+
+
+def test_result_cache():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "plural_variants.txt")
+        translate(engine, "c1c1c1", ["1"])
+        assert result_cache_stats(engine) == (0, 0, 0, 0)
+        assert lib.i18n_set_result_cache(engine, 4096) == 0
+        # Längenabfrage + Kopie: ein Miss, ein Treffer.
+        assert translate(engine, "c1c1c1", ["1"]) == "Du hast 1 Items."
+        hits, misses, evictions, used = result_cache_stats(engine)
+        assert (hits, misses, evictions) == (1, 1, 0) and used > 0
+        assert translate_plural(engine, "c1c1c1", 1, ["1"]) == "Ein Item"
+        assert translate_plural(engine, "c1c1c1", 5, ["5"]) == "Viele Items"
+        assert translate(engine, "c1c1c1", ["2"]) == "Du hast 2 Items."
+        assert result_cache_stats(engine)[:2] == (4, 4)
+        assert lib.i18n_set_result_cache(engine, 300) == 0
+        hits, misses, evictions, used = result_cache_stats(engine)
+        assert evictions == 3 and 0 < used <= 300
+        assert translate(engine, "c1c1c1", ["2"]) == "Du hast 2 Items."
+        assert result_cache_stats(engine)[0] == hits + 2
+        load_catalog(engine, "plural_variants.txt")
+        assert result_cache_stats(engine)[3] == 0
+    finally:
+        lib.i18n_free(engine)
+
+
+def typed_arg(kind, value, precision=-1):
+    arg = TypedArg(kind, precision)
+    field = {0: "str", 1: "i", 2: "d", 3: "id", 4: "str"}[kind]
+    setattr(arg.value, field, value.encode("utf-8") if isinstance(value, str) else value)
+    return arg
+
+
+def translate_ex(engine, token, args, count=None):
+    arr = (TypedArg * len(args))(*args)
+    extra = () if count is None else (count,)
+    fn = lib.i18n_translate_ex if count is None else lib.i18n_translate_plural_ex
+    buf = ctypes.create_string_buffer(256)
+    if fn(engine, token.encode("utf-8"), *extra, arr, len(args), buf, len(buf)) < 0:
+        raise RuntimeError(last_error(engine))
+    return buf.value.decode("utf-8")
+
+
+def test_translate_ex():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "args_token_resolution.txt")
+        assert translate_ex(engine, "aa11bb", [typed_arg(0, "deadbeef")]) == "Wert deadbeef"
+        assert translate_ex(engine, "aa11bb", [typed_arg(4, "DEADBEEF")]) == "Wert Bedeutungsstring"
+        assert translate_ex(engine, "aa11bb", [typed_arg(3, 0xDEADBEEF)]) == "Wert Bedeutungsstring"
+        assert translate_ex(engine, "aa11bb", [typed_arg(3, 0xBEEF)]) == "Wert ⟦00beef⟧"
+        assert translate_ex(engine, "aa11bb", [typed_arg(1, -42)]) == "Wert -42"
+        assert translate_ex(engine, "aa11bb", [typed_arg(2, 0.1)]) == "Wert 0.1"
+        assert translate_ex(engine, "aa11bb", [typed_arg(2, 2.5, 2)]) == "Wert 2.50"
+        assert translate_ex(engine, "cc22dd", []) == "Literal ⟦arg:0⟧"
+        arr = (TypedArg * 1)(TypedArg(9, 0))
+        assert lib.i18n_translate_ex(engine, b"aa11bb", arr, 1, None, 0) == -1
+        assert "Argumenttyp" in last_error(engine)
+        load_catalog(engine, "plural_variants.txt")
+        assert translate_ex(engine, "c1c1c1", [typed_arg(1, 3)], count=3) == "3 Items"
+        assert translate_ex(engine, "c1c1c1", [typed_arg(1, 1)], count=1) == "Ein Item"
+    finally:
+        lib.i18n_free(engine)
+
+
+def translate_plural_column(engine, token, counts, args=()):
+    rows = len(counts)
+    arr = (ctypes.c_char_p * max(len(args), 1))(*[a.encode("utf-8") for a in args])
+    lengths = (ctypes.c_int * rows)()
+    buf = ctypes.create_string_buffer(1024)
+    size = lib.i18n_translate_plural_column(engine, token.encode("utf-8"), counts, ctypes.sizeof(counts) // rows,
+                                            rows, arr, len(args) // rows, buf, len(buf), lengths)
+    if size < 0:
+        raise RuntimeError(last_error(engine))
+    raw = buf.raw[:size].split(b"\0")
+    return [raw[i].decode("utf-8") for i in range(rows)], list(lengths)
+
+
+def test_translate_plural_column():
+    engine = lib.i18n_new()
+    try:
+        load_catalog(engine, "plural_variants.txt")
+        counts = (ctypes.c_int32 * 5)(1, 3, 5, 22, -1)
+        texts, lengths = translate_plural_column(engine, "c1c1c1", counts, ["1", "3", "5", "22", "-1"])
+        assert texts == ["Ein Item", "3 Items", "Viele Items", "22 Items", "-1 Items (other)"]
+        assert lengths == [len(t.encode("utf-8")) for t in texts]
+        expected = [translate_plural(engine, "c1c1c1", n, [str(n)]) for n in (21, 12, 4)]
+        texts, _ = translate_plural_column(engine, "c1c1c1", (ctypes.c_int64 * 3)(21, 12, 4), ["21", "12", "4"])
+        assert texts == expected
+        texts, _ = translate_plural_column(engine, "c1c1c1", (ctypes.c_int64 * 2)(1, 2))
+        assert texts == ["Ein Item", "⟦arg:0⟧ Items"]
+        counts = (ctypes.c_int16 * 2)(1, 2)
+        assert lib.i18n_translate_plural_column(engine, b"c1c1c1", counts, 2, 2, None, 0, None, 0, None) == -1
+    finally:
+        lib.i18n_free(engine)
+
+
 def ensure_contract():
     expected_abi = 1
-    expected_binary = 2
+    expected_binary = 3
     abi = lib.i18n_abi_version()
     max_bin = lib.i18n_binary_version_supported_max()
     if abi != expected_abi or max_bin != expected_binary:
@@ -150,6 +1174,17 @@ def main():
             failures += 1
         finally:
             lib.i18n_free(engine)
+    for test in (test_fallback_chain, test_string_table_sharing, test_compressed_string_table,
+                 test_section_checksums, test_delta_patch, test_bundle, test_sharded_catalog,
+                 test_tree_shaking, test_compile_directory, test_translation_server, test_snapshot_cache, test_reload_if_changed,
+                 test_reload_async, test_translate_batch, test_has_token,
+                 test_preload, test_pinned_snapshot, test_pin_survives_adopt, test_catalog_watcher, test_translation_pool, test_clone, test_result_cache,
+                 test_translate_ex, test_translate_plural_column):
+        try:
+            test()
+        except Exception as exc:
+            print(f"❌ {test.__name__}: {exc!r}")
+            failures += 1
     if failures:
         print(f"\n{failures} Tests failed.")
         sys.exit(1)